@@ -0,0 +1,141 @@
+"""HTTP validators for the series endpoints derived from the data watermarks.
+
+Imports move the watermark of their table and key forward and stamp the
+time of every write next to it, also of a ``--bulk`` re-import that only
+rewrites older rows. Both together with the request identify a response and
+are part of every ``ETag``. The incremental load import re-fetches the slots
+of the last ``CORRECTION_HORIZON`` before the watermark and rewrites
+corrected values, so only windows ending before that horizon are closed and
+may be cached without revalidation, for ``max-age`` at most. Later windows
+must be revalidated on every use. A re-import rewriting closed windows is
+seen by clients after their copy's ``max-age`` at the latest.
+
+The in-process query and range caches may hold bodies read before the
+watermark moved. ``WatermarkCache`` tells its listeners about every
+watermark it has not seen before, the API drops the cached reads of that
+source and key then, so a body is never older than the watermark in its
+``ETag``.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from fastapi import Request, Response
+
+from probabilistic_load_forecast.adapters.db import AsyncForecastMetadataRepository, Watermark
+
+# Matches the default overlap of ``plf load import --incremental``.
+CORRECTION_HORIZON = timedelta(hours=24)
+CLOSED_WINDOW_CACHE_CONTROL = "public, max-age=3600"
+OPEN_WINDOW_CACHE_CONTROL = "public, no-cache"
+# The series bodies depend on the negotiated media type and content coding.
+# CompressionMiddleware adds Accept-Encoding to the Vary of full responses,
+# it passes a 304 on untouched.
+VARY = "Accept"
+NOT_MODIFIED_VARY = "Accept, Accept-Encoding"
+
+
+class WatermarkCache:
+    """Keeps watermarks in process for ``ttl`` seconds.
+
+    Conditional requests are answered from here, so a 304 does not query
+    Postgres while the entry is fresh. A watermark moved by an import is
+    picked up at the latest after ``ttl`` seconds, and passed to the
+    ``on_change`` listeners as ``(source, key)`` before it is handed out.
+    """
+
+    def __init__(self, repo: AsyncForecastMetadataRepository, ttl: float = 5.0):
+        self.repo = repo
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[float, Watermark | None]] = {}
+        self._listeners: list[Callable[[str, str], object]] = []
+
+    def on_change(self, listener: Callable[[str, str], object]) -> None:
+        """Call ``listener(source, key)`` whenever a watermark not seen before is read."""
+        self._listeners.append(listener)
+
+    async def get(self, source: str, key: str) -> Watermark | None:
+        now = time.monotonic()
+        entry = self._entries.get((source, key))
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        watermark = await self.repo.get_watermark_version(source, key)
+        if entry is None or entry[1] != watermark:
+            # Reads cached before this watermark may be older than it.
+            for listener in self._listeners:
+                listener(source, key)
+        self._entries[(source, key)] = (now + self.ttl, watermark)
+        return watermark
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str | None
+    cache_control: str
+
+    def apply(self, response: Response) -> None:
+        if self.etag is not None:
+            response.headers["ETag"] = self.etag
+        response.headers["Cache-Control"] = self.cache_control
+        response.headers["Vary"] = VARY
+
+    def not_modified(self, request: Request) -> bool:
+        """Whether ``If-None-Match`` lists this ``ETag``, compared weakly."""
+        if self.etag is None:
+            return False
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in tags
+
+
+async def series_validators(
+    request: Request,
+    cache: WatermarkCache,
+    source: str,
+    key: str,
+    end: datetime,
+    representation: str,
+) -> Validators:
+    """``ETag`` and ``Cache-Control`` of a series read ending at ``end``.
+
+    Args:
+        source: Table the series is read from.
+        key: Zone or area key of the watermark.
+        representation: Negotiated media type, part of the ``ETag`` since
+            the query string alone does not identify the body.
+    """
+    watermark = await cache.get(source, key)
+    if watermark is None:
+        return Validators(etag=None, cache_control=OPEN_WINDOW_CACHE_CONTROL)
+
+    closed = end <= watermark.latest_ts - CORRECTION_HORIZON
+    digest = hashlib.sha256(
+        "\n".join(
+            [
+                request.url.path,
+                "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items())),
+                representation,
+                watermark.latest_ts.isoformat(),
+                watermark.updated_at.isoformat() if watermark.updated_at else "",
+            ]
+        ).encode()
+    ).hexdigest()[:32]
+
+    return Validators(
+        etag=f'"{digest}"',
+        cache_control=CLOSED_WINDOW_CACHE_CONTROL if closed else OPEN_WINDOW_CACHE_CONTROL,
+    )
+
+
+def not_modified_response(validators: Validators) -> Response:
+    """304 carrying the validators and the ``Vary`` of the full response."""
+    response = Response(status_code=304)
+    validators.apply(response)
+    response.headers["Vary"] = NOT_MODIFIED_VARY
+    return response
@@ -0,0 +1,161 @@
+"""zstd and gzip response compression negotiated from ``Accept-Encoding``.
+
+Works for complete and streaming responses. Compressing a response changes
+its bytes, so a strong ``ETag`` is turned into a weak one like nginx does;
+``If-None-Match`` compares weakly and keeps matching.
+"""
+
+import asyncio
+import zlib
+
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ENCODINGS = ("zstd", "gzip")
+
+# Parquet is zstd compressed already.
+EXCLUDED_MEDIA_TYPES = ("application/vnd.apache.parquet",)
+
+# Compressing larger bodies in the event loop would stall other requests.
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick zstd or gzip from an ``Accept-Encoding`` header, preferring zstd on ties."""
+    if not accept_encoding:
+        return None
+
+    qualities = {}
+    for coding in accept_encoding.split(","):
+        name, *params = [part.strip() for part in coding.split(";")]
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.lower()] = quality
+
+    ranked = [
+        (-qualities.get(encoding, qualities.get("*", 0.0)), position, encoding)
+        for position, encoding in enumerate(ENCODINGS)
+    ]
+    quality, _, encoding = min(ranked)
+    return encoding if quality < 0 else None
+
+
+class _Compressor:
+    """Incremental compressor writing one zstd frame or one gzip member."""
+
+    def __init__(self, encoding: str, zstd_level: int, gzip_level: int):
+        if encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+            self._gzip = None
+        else:
+            self._zstd = None
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        if self._zstd is not None:
+            flush_mode = (
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+                if more_body
+                else zstandard.COMPRESSOBJ_FLUSH_FINISH
+            )
+            return self._zstd.compress(body) + self._zstd.flush(flush_mode)
+        if more_body:
+            return self._gzip.compress(body) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+        return self._gzip.compress(body) + self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """Compress responses of at least ``minimum_size`` bytes with zstd or gzip."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        zstd_level: int = 3,
+        gzip_level: int = 6,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.zstd_level = zstd_level
+        self.gzip_level = gzip_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        start_message: Message | None = None
+        compressor: _Compressor | None = None
+        passthrough = False
+
+        async def compress(body: bytes, more_body: bool) -> bytes:
+            if len(body) >= THREAD_MINIMUM_SIZE:
+                return await asyncio.to_thread(compressor.compress, body, more_body)
+            return compressor.compress(body, more_body)
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip()
+                passthrough = (
+                    "content-encoding" in headers
+                    or message["status"] in (204, 206, 304)
+                    or media_type.lower() in EXCLUDED_MEDIA_TYPES
+                )
+                if not passthrough and encoding is None:
+                    # Shared caches must not hand this copy to clients that
+                    # accept a compressed one.
+                    MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                    passthrough = True
+                if passthrough:
+                    await send(message)
+                else:
+                    # Hold the headers back until the first body chunk shows
+                    # whether the response is worth compressing.
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if len(body) < self.minimum_size and not more_body:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.zstd_level, self.gzip_level)
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                body = await compress(body, more_body)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                start_message = None
+            else:
+                body = await compress(body, more_body)
+
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,84 @@
+"""Content negotiation between JSON and the columnar Arrow/Parquet responses."""
+
+from typing import Literal
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+import pyarrow as pa
+
+from probabilistic_load_forecast.adapters.db import timing
+from probabilistic_load_forecast.application.mappers import (
+    arrow_to_ipc_stream,
+    arrow_to_parquet,
+    columnar_to_json,
+)
+
+JSON = "application/json"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+PARQUET = "application/vnd.apache.parquet"
+NDJSON = "application/x-ndjson"
+
+COLUMNAR_MEDIA_TYPES = (ARROW_STREAM, PARQUET)
+RESPONSE_MEDIA_TYPES = (JSON, ARROW_STREAM, PARQUET)
+# Formats that can be written chunk by chunk, Parquet needs the whole table.
+STREAM_MEDIA_TYPES = (NDJSON, ARROW_STREAM)
+
+# ``?format=columnar`` selects the compact JSON layout of the series endpoints.
+JsonLayout = Literal["observations", "columnar"]
+
+
+def negotiate(
+    accept: str | None, supported: tuple[str, ...] = RESPONSE_MEDIA_TYPES
+) -> str:
+    """Pick the response media type from an ``Accept`` header.
+
+    Media ranges are ranked by their ``q`` value, ties keep the header order.
+    The first of ``supported``, JSON by default, is used for a missing header,
+    wildcards and anything unknown.
+    """
+    if not accept:
+        return supported[0]
+
+    ranked = []
+    for position, media_range in enumerate(accept.split(",")):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            ranked.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(ranked):
+        if media_type in supported:
+            return media_type
+    return supported[0]
+
+
+def table_response(table: pa.Table, media_type: str) -> Response:
+    """Serialize an Arrow table in the negotiated columnar format."""
+    if media_type == PARQUET:
+        with timing.stage("serialize", "parquet"):
+            content = arrow_to_parquet(table)
+    else:
+        with timing.stage("serialize", "arrow"):
+            content = arrow_to_ipc_stream(table)
+    return Response(content=content, media_type=media_type, headers={"Vary": "Accept"})
+
+
+def columnar_json_response(payload: dict) -> Response:
+    """Serialize a columnar payload with orjson, bypassing FastAPI's encoder."""
+    with timing.stage("serialize", "columnar"):
+        content = columnar_to_json(payload)
+    return Response(content=content, media_type=JSON, headers={"Vary": "Accept"})
+
+
+def observations_response(content) -> Response:
+    """Serialize domain objects like FastAPI does, timed as the ``serialize`` stage."""
+    with timing.stage("serialize", "json"):
+        return JSONResponse(jsonable_encoder(content))
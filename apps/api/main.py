@@ -1,30 +1,70 @@
+import asyncio
+from contextlib import aclosing, asynccontextmanager
 from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
+from prometheus_client import REGISTRY
 from pydantic import AwareDatetime
+import numpy as np
 
 from fastapi import FastAPI
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 import uvicorn
 
+from apps.api import caching, formats
+from apps.api.compression import CompressionMiddleware
+from apps.api.metrics import AppStateCollector, MetricsMiddleware, metrics_response
 from probabilistic_load_forecast import config
 from probabilistic_load_forecast.adapters.db import (
-    EntsoePostgreRepository,
-    Era5PostgreRepository,
-    ForecastMetadataRepository
+    AsyncCachedEntsoeRepository,
+    AsyncCachedEra5Repository,
+    AsyncEntsoePostgreRepository,
+    AsyncEra5PostgreRepository,
+    AsyncForecastMetadataRepository,
+    AsyncLoadRangeCache,
+    AsyncWeatherRangeCache,
+    CacheStatistics,
+    PoolStatistics,
+    QueryCache,
+    create_async_pool,
 )
 from probabilistic_load_forecast.adapters.country_code import (
     PycountryCountryCodeNormalizer,
 )
 
+from probabilistic_load_forecast.application.mappers import (
+    era5_frame_to_arrow,
+    era5_frame_to_columnar,
+    IpcStreamEncoder,
+    load_array_batch_to_columnar,
+    load_array_series_to_arrow,
+    load_array_series_to_columnar,
+    load_array_series_to_ndjson,
+    resampled_series_to_arrow,
+    resampled_series_to_columnar,
+)
 from probabilistic_load_forecast.application.services import (
+    GetActualLoadArrays,
+    GetActualLoadBatch,
     GetActualLoadData,
     GetERA5DataFromDB,
-    GetLatestCommonTimestamp
+    GetERA5FrameFromDB,
+    GetLatestCommonTimestamp,
+    GetResampledERA5FromDB,
+    GetResampledLoad,
+    StreamActualLoadArrays,
+)
+from probabilistic_load_forecast.domain.exceptions import (
+    InvalidAggregateError,
+    UnknownBiddingZoneError,
 )
 
 from probabilistic_load_forecast.domain.model import (
+    LoadArraySeries,
+    parse_aggregate,
     resolve_bidding_zone,
+    Resolution,
     TimeInterval,
     WeatherArea,
     WeatherVariable,
@@ -34,25 +74,85 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 load_dotenv(ROOT_DIR / ".env")
 
 
-@lru_cache
-def get_load_repository() -> EntsoePostgreRepository:
-    return EntsoePostgreRepository(config.get_postgre_uri())
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared async connection pool once and close it on shutdown.
+
+    The load and weather reads go through one in-process query cache unless
+    ``QUERY_CACHE_MAX_ENTRIES`` is 0. Its misses go through range caches that
+    only read the parts of a panned window not read before, unless
+    ``RANGE_CACHE_MAX_KEYS`` is 0. Both drop the reads of a source and key
+    when its watermark moves, the series ETags are built from it.
+    """
+    pool = create_async_pool(config.get_postgre_uri(), config.get_pool_settings())
+    await pool.open()
+    app.state.pool = pool
+    app.state.load_repository = AsyncEntsoePostgreRepository(pool=pool)
+    app.state.era5_repository = AsyncEra5PostgreRepository(pool=pool)
+    app.state.forecast_metadata_repository = AsyncForecastMetadataRepository(pool=pool)
+    app.state.watermark_cache = caching.WatermarkCache(
+        app.state.forecast_metadata_repository
+    )
+    if range_cache_keys := config.get_range_cache_max_keys():
+        app.state.load_repository = AsyncLoadRangeCache(
+            app.state.load_repository, max_keys=range_cache_keys
+        )
+        app.state.era5_repository = AsyncWeatherRangeCache(
+            app.state.era5_repository, max_keys=range_cache_keys
+        )
+        for range_cache in (app.state.load_repository, app.state.era5_repository):
+            app.state.watermark_cache.on_change(range_cache.invalidate_table)
+    app.state.query_cache = None
+    if cache_size := config.get_query_cache_size():
+        app.state.query_cache = QueryCache(max_entries=cache_size)
+        app.state.load_repository = AsyncCachedEntsoeRepository(
+            app.state.load_repository, app.state.query_cache
+        )
+        app.state.era5_repository = AsyncCachedEra5Repository(
+            app.state.era5_repository, app.state.query_cache
+        )
+        app.state.watermark_cache.on_change(app.state.query_cache.invalidate)
+    collector = AppStateCollector(app.state)
+    REGISTRY.register(collector)
+    try:
+        yield
+    finally:
+        REGISTRY.unregister(collector)
+        await pool.close()
 
 
-@lru_cache
-def get_era5_repository() -> Era5PostgreRepository:
-    return Era5PostgreRepository(config.get_postgre_uri())
+def get_load_repository(request: Request) -> AsyncEntsoePostgreRepository:
+    return request.app.state.load_repository
+
+
+def get_era5_repository(request: Request) -> AsyncEra5PostgreRepository:
+    return request.app.state.era5_repository
 
 
 @lru_cache
 def get_country_code_normalizer() -> PycountryCountryCodeNormalizer:
     return PycountryCountryCodeNormalizer()
 
-@lru_cache
-def get_forecast_metadata_repository() -> ForecastMetadataRepository:
-    return ForecastMetadataRepository(config.get_postgre_uri())
+def get_forecast_metadata_repository(request: Request) -> AsyncForecastMetadataRepository:
+    return request.app.state.forecast_metadata_repository
+
+
+def get_watermark_cache(request: Request) -> caching.WatermarkCache:
+    return request.app.state.watermark_cache
+
+def parse_aggregates(agg: list[str] = Query(["mean"])) -> list[str]:
+    """Aggregates of a resampled read, e.g. ``agg=mean&agg=q90``."""
+    try:
+        for name in agg:
+            parse_aggregate(name)
+    except InvalidAggregateError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return list(dict.fromkeys(agg))
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(CompressionMiddleware)
+# Added last, so it runs outermost and times the compression as well.
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/")
@@ -61,46 +161,279 @@ async def root():
 
 
 @app.get("/load-data")
-def get_load_data(
+async def get_load_data(
+    request: Request,
     start: AwareDatetime,
     end: AwareDatetime,
     eic_code: str,
-    repo: EntsoePostgreRepository = Depends(get_load_repository),
+    layout: formats.JsonLayout = Query("observations", alias="format"),
+    epoch: bool = False,
+    resolution: Resolution | None = None,
+    aggregates: list[str] = Depends(parse_aggregates),
+    repo: AsyncEntsoePostgreRepository = Depends(get_load_repository),
+    watermarks: caching.WatermarkCache = Depends(get_watermark_cache),
 ):
+    """Load of one zone, as JSON or as Arrow/Parquet depending on ``Accept``.
+
+    ``format=columnar`` returns the zone once with parallel ``timestamps`` and
+    ``values`` arrays, ``epoch=true`` encodes the timestamps as Unix seconds.
+    With ``resolution`` the slots starting in ``[start, end)`` are aggregated
+    per bucket in Postgres, ``agg`` picks ``mean``, ``min``, ``max``, ``sum``
+    or quantiles such as ``q90``; the JSON is always columnar then.
+    Answers ``If-None-Match`` with 304 while the load watermark is unchanged.
+    """
+    bidding_zone = resolve_bidding_zone(eic_code)
+
+    media_type = formats.negotiate(request.headers.get("accept"))
+    validators = await caching.series_validators(
+        request, watermarks, "actual_total_load", bidding_zone.eic_code, end, media_type
+    )
+    if validators.not_modified(request):
+        return caching.not_modified_response(validators)
+
+    if resolution is not None:
+        series = await GetResampledLoad(repo)(
+            start, end, bidding_zone, resolution, aggregates
+        )
+        if media_type in formats.COLUMNAR_MEDIA_TYPES:
+            table = resampled_series_to_arrow(series, {"eic_code": bidding_zone.eic_code})
+            response = formats.table_response(table, media_type)
+        else:
+            response = formats.columnar_json_response(
+                {
+                    "eic_code": bidding_zone.eic_code,
+                    **resampled_series_to_columnar(series, epoch=epoch),
+                }
+            )
+    elif media_type in formats.COLUMNAR_MEDIA_TYPES:
+        load_series = await GetActualLoadArrays(repo)(start, end, bidding_zone)
+        response = formats.table_response(load_array_series_to_arrow(load_series), media_type)
+    elif layout == "columnar":
+        load_series = await GetActualLoadArrays(repo)(start, end, bidding_zone)
+        response = formats.columnar_json_response(
+            load_array_series_to_columnar(load_series, epoch=epoch)
+        )
+    else:
+        load_series = await GetActualLoadData(repo)(start, end, bidding_zone)
+        response = formats.observations_response(load_series)
+
+    validators.apply(response)
+    return response
+
+
+async def _ndjson_chunks(chunks, epoch: bool):
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            yield await asyncio.to_thread(load_array_series_to_ndjson, chunk, epoch)
+
+
+async def _arrow_chunks(chunks, bidding_zone):
+    # The schema carries the resolution of the first chunk, 15 minutes without rows.
+    encoder = None
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            table = load_array_series_to_arrow(chunk)
+            if encoder is None:
+                encoder = IpcStreamEncoder(table.schema)
+            yield await asyncio.to_thread(encoder.write, table)
+    if encoder is None:
+        empty = LoadArraySeries(
+            bidding_zone=bidding_zone,
+            resolution=Resolution.PT15M,
+            start_ts=np.array([], dtype="datetime64[us]"),
+            load_mw=np.array([], dtype=np.float64),
+        )
+        encoder = IpcStreamEncoder(load_array_series_to_arrow(empty).schema)
+    yield encoder.close()
+
+
+@app.get("/load-data/stream")
+async def stream_load_data(
+    request: Request,
+    start: AwareDatetime,
+    end: AwareDatetime,
+    eic_code: str,
+    epoch: bool = False,
+    batch_size: int = Query(50_000, ge=1, le=1_000_000),
+    repo: AsyncEntsoePostgreRepository = Depends(get_load_repository),
+):
+    """Load of one zone streamed as NDJSON or Arrow record batches.
+
+    The rows are read through a server-side cursor ``batch_size`` at a time
+    and every batch is sent as soon as it is read, so memory stays flat for
+    any range. ``Accept: application/vnd.apache.arrow.stream`` selects one
+    Arrow IPC stream, anything else one JSON object per line.
+    """
     bidding_zone = resolve_bidding_zone(eic_code)
+    media_type = formats.negotiate(request.headers.get("accept"), formats.STREAM_MEDIA_TYPES)
+    chunks = StreamActualLoadArrays(repo)(start, end, bidding_zone, batch_size=batch_size)
 
-    service = GetActualLoadData(repo)
+    if media_type == formats.ARROW_STREAM:
+        body = _arrow_chunks(chunks, bidding_zone)
+    else:
+        body = _ndjson_chunks(chunks, epoch)
+    return StreamingResponse(body, media_type=media_type, headers={"Vary": "Accept"})
 
-    return service(start, end, bidding_zone)
+
+@app.get("/load-data/batch")
+async def get_load_data_batch(
+    start: AwareDatetime,
+    end: AwareDatetime,
+    eic_codes: list[str] = Query(),
+    epoch: bool = False,
+    repo: AsyncEntsoePostgreRepository = Depends(get_load_repository),
+):
+    """Load of several zones from one query, as columnar JSON keyed by EIC code.
+
+    Every zone carries its ``missing_slots`` in ``[start, end)``.
+    """
+    try:
+        bidding_zones = [resolve_bidding_zone(eic_code) for eic_code in eic_codes]
+    except UnknownBiddingZoneError as exc:
+        raise HTTPException(status_code=422, detail=str(exc.args[0])) from exc
+
+    batch = await GetActualLoadBatch(repo)(start, end, bidding_zones)
+    return formats.columnar_json_response(load_array_batch_to_columnar(batch, epoch=epoch))
 
 
 @app.get("/weather-data")
-def get_weather_data(
+async def get_weather_data(
+    request: Request,
     start: AwareDatetime,
     end: AwareDatetime,
     variable: WeatherVariable,
     area_code: str = "AT",
-    repo: Era5PostgreRepository = Depends(get_era5_repository),
+    layout: formats.JsonLayout = Query("observations", alias="format"),
+    epoch: bool = False,
+    resolution: Resolution | None = None,
+    aggregates: list[str] = Depends(parse_aggregates),
+    repo: AsyncEra5PostgreRepository = Depends(get_era5_repository),
+    watermarks: caching.WatermarkCache = Depends(get_watermark_cache),
     country_code_normalizer: PycountryCountryCodeNormalizer = Depends(
         get_country_code_normalizer
     ),
 ):
+    """One weather variable, as JSON or as Arrow/Parquet depending on ``Accept``.
 
-    service = GetERA5DataFromDB(repo)
-
+    ``format=columnar`` and ``epoch=true`` work as for ``/load-data``. The
+    columnar layouts report interval-end variables at the start of their
+    interval, like ``/weather-frame``. ``resolution`` and ``agg`` aggregate
+    as for ``/load-data``; interval-end values are binned by the start of
+    their interval, so the precipitation of a day sums its 24 hours.
+    Answers ``If-None-Match`` with 304 while the watermark of the variable
+    is unchanged.
+    """
     interval = TimeInterval(start=start, end=end)
     area = WeatherArea(code=country_code_normalizer.normalize(area_code))
 
-    return service(
-        variable=variable,
-        area=area,
-        interval=interval,
+    media_type = formats.negotiate(request.headers.get("accept"))
+    validators = await caching.series_validators(
+        request, watermarks, f"{variable}_country_avg", area.code.value, end, media_type
     )
+    if validators.not_modified(request):
+        return caching.not_modified_response(validators)
+
+    if resolution is not None:
+        series = await GetResampledERA5FromDB(repo)(
+            variable=variable,
+            area=area,
+            interval=interval,
+            resolution=resolution,
+            aggregates=aggregates,
+        )
+        metadata = {"area_code": area.code.value, "variable": variable.value}
+        if media_type in formats.COLUMNAR_MEDIA_TYPES:
+            table = resampled_series_to_arrow(series, metadata)
+            response = formats.table_response(table, media_type)
+        else:
+            response = formats.columnar_json_response(
+                {**metadata, **resampled_series_to_columnar(series, epoch=epoch)}
+            )
+    elif media_type in formats.COLUMNAR_MEDIA_TYPES:
+        frame = await GetERA5FrameFromDB(repo)(
+            variables=[variable], area=area, interval=interval
+        )
+        response = formats.table_response(era5_frame_to_arrow(frame, variable), media_type)
+    elif layout == "columnar":
+        frame = await GetERA5FrameFromDB(repo)(
+            variables=[variable], area=area, interval=interval
+        )
+        response = formats.columnar_json_response(
+            era5_frame_to_columnar(frame, variable, epoch=epoch)
+        )
+    else:
+        weather_series = await GetERA5DataFromDB(repo)(
+            variable=variable,
+            area=area,
+            interval=interval,
+        )
+        response = formats.observations_response(weather_series)
+
+    validators.apply(response)
+    return response
+
+@app.get("/weather-frame")
+async def get_weather_frame(
+    start: AwareDatetime,
+    end: AwareDatetime,
+    variables: list[WeatherVariable] = Query(),
+    area_code: str = "AT",
+    repo: AsyncEra5PostgreRepository = Depends(get_era5_repository),
+    country_code_normalizer: PycountryCountryCodeNormalizer = Depends(
+        get_country_code_normalizer
+    ),
+):
+    service = GetERA5FrameFromDB(repo)
+
+    frame = await service(
+        variables=variables,
+        area=WeatherArea(code=country_code_normalizer.normalize(area_code)),
+        interval=TimeInterval(start=start, end=end),
+    )
+
+    return {
+        "area_code": frame.area.code.value,
+        "resolution": frame.resolution,
+        "timestamps": np.datetime_as_string(frame.timestamps, unit="s", timezone="UTC").tolist(),
+        "values": {
+            variable.value: np.where(np.isnan(values), None, values).tolist()
+            for variable, values in frame.values.items()
+        },
+    }
 
 @app.get("/latest-common-timestamp")
-def get_latest_common_timestamp(repo: ForecastMetadataRepository = Depends(get_forecast_metadata_repository)):
+async def get_latest_common_timestamp(
+    eic_code: str = "10YAT-APG------L",
+    area_code: str | None = None,
+    repo: AsyncForecastMetadataRepository = Depends(get_forecast_metadata_repository),
+    country_code_normalizer: PycountryCountryCodeNormalizer = Depends(
+        get_country_code_normalizer
+    ),
+):
     service = GetLatestCommonTimestamp(repo)
-    return  {"timestamp": service()}
+
+    area = None
+    if area_code is not None:
+        area = WeatherArea(code=country_code_normalizer.normalize(area_code))
+
+    return {
+        "timestamp": await service(bidding_zone=resolve_bidding_zone(eic_code), area=area)
+    }
+
+@app.get("/pool-stats")
+async def get_pool_stats(request: Request) -> PoolStatistics:
+    return PoolStatistics.from_pool(request.app.state.pool)
+
+@app.get("/cache-stats")
+async def get_cache_stats(request: Request) -> CacheStatistics | None:
+    """Hit, miss and eviction counters of the query cache, null when disabled."""
+    cache = request.app.state.query_cache
+    return cache.statistics() if cache is not None else None
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus metrics of the requests, repository stages, pool and query cache."""
+    return metrics_response()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
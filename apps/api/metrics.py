@@ -0,0 +1,133 @@
+"""Prometheus metrics and ``Server-Timing`` for the API.
+
+``MetricsMiddleware`` observes the latency and payload size of every request
+per route template and sends the repository stages of the request, see
+``probabilistic_load_forecast.adapters.db.timing``, in a ``Server-Timing``
+header. Pool and query cache counters are read when ``/metrics`` is scraped.
+"""
+
+from time import perf_counter
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi import Response
+
+from probabilistic_load_forecast.adapters.db import CacheStatistics, PoolStatistics
+from probabilistic_load_forecast.adapters.db import timing
+
+REQUEST_SECONDS = Histogram(
+    "plf_http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+RESPONSE_BYTES = Histogram(
+    "plf_http_response_bytes",
+    "Size of the response bodies as sent, after compression.",
+    ["route"],
+    buckets=tuple(4**exponent for exponent in range(4, 16)),
+)
+
+# Order of the stages in the Server-Timing header.
+STAGES = ("connect", "execute", "fetch", "map", "serialize")
+
+
+def server_timing(stages: dict[str, float], total: float) -> str:
+    """``Server-Timing`` value with the stage durations and the total in ms."""
+    entries = [f"{name};dur={stages[name] * 1000:.2f}" for name in STAGES if name in stages]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class MetricsMiddleware:
+    """Observe request latency and response size, add ``Server-Timing``.
+
+    The header is sent with the response start, so for streamed responses it
+    only covers the stages until the first chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status = 500
+        size = 0
+
+        with timing.track_stages() as stages:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status, size
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    MutableHeaders(raw=message["headers"]).append(
+                        "Server-Timing", server_timing(stages, perf_counter() - start)
+                    )
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                # The router stores the matched route in the scope.
+                route = scope.get("route")
+                route_path = getattr(route, "path", "unmatched")
+                REQUEST_SECONDS.labels(scope["method"], route_path, str(status)).observe(
+                    perf_counter() - start
+                )
+                RESPONSE_BYTES.labels(route_path).observe(size)
+
+
+class AppStateCollector(Collector):
+    """Pool and query cache counters of the running app, read on every scrape."""
+
+    def __init__(self, state):
+        self.state = state
+
+    def collect(self):
+        pool = getattr(self.state, "pool", None)
+        if pool is not None:
+            stats = PoolStatistics.from_pool(pool)
+            for name, value, help_text in (
+                ("size", stats.size, "Open connections."),
+                ("in_use", stats.in_use, "Connections handed out."),
+                ("available", stats.available, "Idle connections."),
+                ("max_size", stats.max_size, "Maximum number of connections."),
+                ("requests_waiting", stats.requests_waiting, "Requests waiting for a connection."),
+            ):
+                yield GaugeMetricFamily(f"plf_pool_{name}", help_text, value=value)
+            yield CounterMetricFamily(
+                "plf_pool_requests", "Connection requests.", value=stats.requests_total
+            )
+            yield CounterMetricFamily(
+                "plf_pool_requests_wait_seconds",
+                "Time requests waited for a connection.",
+                value=stats.requests_wait_ms / 1000,
+            )
+            yield CounterMetricFamily(
+                "plf_pool_requests_errors", "Failed connection requests.", value=stats.requests_errors
+            )
+
+        cache = getattr(self.state, "query_cache", None)
+        if cache is not None:
+            stats: CacheStatistics = cache.statistics()
+            yield GaugeMetricFamily(
+                "plf_query_cache_entries", "Entries in the query cache.", value=stats.entries
+            )
+            for name in ("hits", "misses", "evictions", "invalidations"):
+                yield CounterMetricFamily(
+                    f"plf_query_cache_{name}", f"Query cache {name}.", value=getattr(stats, name)
+                )
+
+
+def metrics_response() -> Response:
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
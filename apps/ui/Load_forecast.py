@@ -824,22 +824,16 @@ if start is not None and end is not None:
             render_interpretation_panel()
 
             if st.button("Run forecast"):
-                weather_combined = pd.DataFrame()
-                # fetch the data for each variable and combine them into 
-                # a single dataframe
-                for variable in client.WEATHER_VARIABLE_META:
-                    weather_series = client.get_weather_data(
-                        client.WeatherDataQuery(
-                            start=start_week_ahead,#.replace(minute=0),
-                            end=end_utc.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1) + timedelta(days=1),
-                            area_code=area_code,
-                            variable=variable,
-                        )
+                # fetch all variables with a single request, already
+                # combined into one time-aligned dataframe
+                weather_combined = client.get_weather_frame(
+                    client.WeatherFrameQuery(
+                        start=start_week_ahead,#.replace(minute=0),
+                        end=end_utc.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1) + timedelta(days=1),
+                        area_code=area_code,
+                        variables=tuple(client.WEATHER_VARIABLE_META),
                     )
-                    weather_df = weather_series.to_frame()
-                    
-                   
-                    weather_combined = pd.concat([weather_combined, weather_df], axis=1, join="outer")
+                )
 
                 # hardcode renaming columns to ***_future for now
                 weather_combined = weather_combined.rename(
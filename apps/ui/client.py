@@ -1,12 +1,17 @@
 from datetime import datetime
+import logging
 import requests
 import streamlit as st
 from dataclasses import dataclass
 from requests.exceptions import JSONDecodeError
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
 
 BASE_URL = st.secrets["api"]["base_url"]
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
 
 WEATHER_VARIABLE_META = {
     "t2m": {
@@ -111,10 +116,32 @@ class WeatherSeries:
         return df
 
 
-def get_observation_timestamp(obs: dict) -> str:
-    if "interval" in obs:
-        return obs["interval"]["start"]
-    return obs["valid_at"]
+@dataclass(frozen=True)
+class WeatherFrameQuery:
+    start: datetime
+    end: datetime
+    variables: tuple[str, ...]
+    area_code: str
+
+    def to_params(self) -> dict[str, str | list[str]]:
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "variables": list(self.variables),
+            "area_code": self.area_code,
+        }
+
+
+def log_server_timing(response: requests.Response) -> None:
+    """Log the stage breakdown the API sends in ``Server-Timing``."""
+    if server_timing := response.headers.get("Server-Timing"):
+        logger.info("%s %s", response.request.path_url, server_timing)
+
+
+def read_arrow_stream(content: bytes) -> pa.Table:
+    """Decode an Arrow IPC stream response body into a table."""
+    with pa.ipc.open_stream(content) as reader:
+        return reader.read_all()
 
 
 @st.cache_data
@@ -122,28 +149,47 @@ def get_weather_data(query: WeatherDataQuery) -> WeatherSeries:
     response = requests.get(
         f"{BASE_URL}/weather-data",
         params=query.to_params(),
+        headers={"Accept": ARROW_STREAM},
         timeout=30,
     )
-    print(query.to_params())
     response.raise_for_status()
+    log_server_timing(response)
 
     try:
-        weather_data = response.json()
-        observations = weather_data["observations"]
-        variable = weather_data["variable"]
-        timestamp = pd.to_datetime(
-            [get_observation_timestamp(obs) for obs in observations],
-            utc=True,
-        )
+        table = read_arrow_stream(response.content)
+        variable = table.schema.metadata[b"variable"].decode()
+        timestamp = pd.DatetimeIndex(table.column("timestamp").to_pandas())
+        value = table.column("value").to_numpy(zero_copy_only=False)
+    except Exception as ex:
+        raise ValueError("Could not decode Arrow stream into a WeatherSeries", ex) from ex
 
-        value = np.array(
-            [obs["value"] for obs in observations],
-            dtype=np.float64,
+    return WeatherSeries(weather_variable=variable, value=value, timestamp=timestamp)
+
+
+@st.cache_data
+def get_weather_frame(query: WeatherFrameQuery) -> pd.DataFrame:
+    response = requests.get(
+        f"{BASE_URL}/weather-frame",
+        params=query.to_params(),
+        timeout=30,
+    )
+    response.raise_for_status()
+    log_server_timing(response)
+
+    try:
+        weather_frame = response.json()
+        df = pd.DataFrame(
+            {
+                variable: np.array(values, dtype=np.float64)
+                for variable, values in weather_frame["values"].items()
+            },
+            index=pd.to_datetime(weather_frame["timestamps"], utc=True),
         )
+        df.index.name = "timestamp"
     except Exception as ex:
-        raise ValueError("Could not decode JSON into a WeatherSeries", ex) from ex
+        raise ValueError("Could not decode JSON into a weather frame", ex) from ex
 
-    return WeatherSeries(weather_variable=variable, value=value, timestamp=timestamp)
+    return df
 
 
 @st.cache_data
@@ -151,24 +197,18 @@ def get_load_data(query: LoadDataQuery) -> LoadSeries:
     response = requests.get(
         f"{BASE_URL}/load-data",
         params=query.to_params(),
+        headers={"Accept": ARROW_STREAM},
         timeout=30,
     )
     response.raise_for_status()
+    log_server_timing(response)
 
     try:
-        load_data = response.json()
-        observations = load_data["observations"]
-        timestamp = pd.to_datetime(
-            [obs["interval"]["start"] for obs in observations],
-            utc=True
-        )
-
-        actual_total_load = np.array(
-            [obs["load_mw"] for obs in observations],
-            dtype=np.float64,
-        )
+        table = read_arrow_stream(response.content)
+        timestamp = pd.DatetimeIndex(table.column("timestamp").to_pandas())
+        actual_total_load = table.column("load_mw").to_numpy(zero_copy_only=False)
     except Exception as ex:
-        raise ValueError("Could not decode JSON into a LoadSeries") from ex
+        raise ValueError("Could not decode Arrow stream into a LoadSeries") from ex
 
     return LoadSeries(timestamp=timestamp, total_load=actual_total_load)
 
@@ -180,6 +220,7 @@ def get_latest_common_ts() -> datetime | None:
         timeout=30,
     )
     response.raise_for_status()
+    log_server_timing(response)
     try:
         data = response.json()
     except JSONDecodeError as ex:
@@ -0,0 +1,180 @@
+"""Compare JSON, columnar JSON, Arrow and Parquet responses of /load-data and /weather-data.
+
+Usage:
+    uv run uvicorn apps.api.main:app
+    uv run python -m benchmarks.bench_api_formats --url http://127.0.0.1:8000 --end 2025-01-01T00:00:00Z
+    uv run python -m benchmarks.bench_api_formats --serialization-only --rows 35040
+
+Requests a one-week and a one-year window ending at ``--end`` in every
+format and reports the payload size and the end-to-end latency, including
+decoding the body into NumPy arrays the way the UI client does.
+
+``--serialization-only`` needs no server: it builds ``--rows`` load slots
+and times FastAPI's default encoding of a ``LoadSeries`` against the
+orjson encoding of the columnar layout.
+"""
+
+import argparse
+import io
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+from fastapi.encoders import jsonable_encoder
+
+from probabilistic_load_forecast.application.mappers import (
+    columnar_to_json,
+    load_array_series_to_columnar,
+)
+from probabilistic_load_forecast.domain.model import (
+    LoadArraySeries,
+    LoadMeasurement,
+    LoadSeries,
+    Resolution,
+    TimeInterval,
+    resolve_bidding_zone,
+)
+
+# Accept header and extra query parameters of every format.
+FORMATS = {
+    "json": ("application/json", {}),
+    "columnar": ("application/json", {"format": "columnar"}),
+    "epoch": ("application/json", {"format": "columnar", "epoch": "true"}),
+    "arrow": ("application/vnd.apache.arrow.stream", {}),
+    "parquet": ("application/vnd.apache.parquet", {}),
+}
+WINDOWS = {"1 week": timedelta(days=7), "1 year": timedelta(days=365)}
+
+
+def decode_json(body: bytes, value_key: str) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    # The list comprehensions of the previous UI client.
+    observations = json.loads(body)["observations"]
+    timestamp = pd.to_datetime(
+        [
+            obs["interval"]["start"] if "interval" in obs else obs["valid_at"]
+            for obs in observations
+        ],
+        utc=True,
+    )
+    return timestamp, np.array([obs[value_key] for obs in observations], dtype=np.float64)
+
+
+def decode_columnar(body: bytes) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    payload = json.loads(body)
+    timestamps = payload["timestamps"]
+    unit = "s" if timestamps and isinstance(timestamps[0], int) else None
+    return (
+        pd.to_datetime(timestamps, unit=unit, utc=True),
+        np.array(payload["values"], dtype=np.float64),
+    )
+
+
+def decode_table(table: pa.Table) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    return (
+        pd.DatetimeIndex(table.column("timestamp").to_pandas()),
+        table.column(1).to_numpy(zero_copy_only=False),
+    )
+
+
+def fetch(url: str, params: dict, fmt: str, value_key: str) -> tuple[int, float]:
+    accept, format_params = FORMATS[fmt]
+    start = time.perf_counter()
+    response = requests.get(
+        url, params={**params, **format_params}, headers={"Accept": accept}, timeout=300
+    )
+    response.raise_for_status()
+    if fmt == "json":
+        decode_json(response.content, value_key)
+    elif fmt in ("columnar", "epoch"):
+        decode_columnar(response.content)
+    elif fmt == "arrow":
+        with pa.ipc.open_stream(response.content) as reader:
+            decode_table(reader.read_all())
+    else:
+        decode_table(pq.read_table(io.BytesIO(response.content)))
+    return len(response.content), time.perf_counter() - start
+
+
+def run(base_url: str, end: datetime, repeats: int) -> None:
+    endpoints = {
+        "/load-data": ({"eic_code": "10YAT-APG------L"}, "load_mw"),
+        "/weather-data": ({"variable": "t2m", "area_code": "AT"}, "value"),
+    }
+    print(f"{'endpoint':>14} {'window':>7} {'format':>8} {'bytes':>11} {'latency [s]':>12}")
+    for path, (extra_params, value_key) in endpoints.items():
+        for window_name, window in WINDOWS.items():
+            params = {
+                "start": (end - window).isoformat(),
+                "end": end.isoformat(),
+                **extra_params,
+            }
+            for fmt in FORMATS:
+                results = [
+                    fetch(f"{base_url}{path}", params, fmt, value_key)
+                    for _ in range(repeats)
+                ]
+                size = results[0][0]
+                latency = min(seconds for _, seconds in results)
+                print(f"{path:>14} {window_name:>7} {fmt:>8} {size:>11} {latency:>12.3f}")
+
+
+def run_serialization(rows: int, repeats: int) -> None:
+    zone = resolve_bidding_zone("10YAT-APG------L")
+    start = np.datetime64("2024-01-01T00:00", "us")
+    start_ts = start + np.arange(rows) * np.timedelta64(15, "m")
+    load_mw = np.random.default_rng(42).normal(6000.0, 800.0, size=rows)
+    first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    load_series = LoadSeries(
+        bidding_zone=zone,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=zone,
+                interval=TimeInterval(
+                    first + timedelta(minutes=15 * i), first + timedelta(minutes=15 * (i + 1))
+                ),
+                load_mw=float(value),
+            )
+            for i, value in enumerate(load_mw)
+        ),
+    )
+    arrays = LoadArraySeries(zone, Resolution.PT15M, start_ts, load_mw)
+    encoders = {
+        "json": lambda: json.dumps(jsonable_encoder(load_series)).encode(),
+        "columnar": lambda: columnar_to_json(load_array_series_to_columnar(arrays)),
+        "epoch": lambda: columnar_to_json(
+            load_array_series_to_columnar(arrays, epoch=True)
+        ),
+    }
+
+    print(f"{'format':>8} {'bytes':>11} {'encode [s]':>11}")
+    for name, encode in encoders.items():
+        timings = []
+        for _ in range(repeats):
+            started = time.process_time()
+            body = encode()
+            timings.append(time.process_time() - started)
+        print(f"{name:>8} {len(body):>11} {min(timings):>11.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--end", type=datetime.fromisoformat, default="2025-01-01T00:00:00Z")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--serialization-only", action="store_true")
+    parser.add_argument("--rows", type=int, default=35040)
+    args = parser.parse_args()
+    if args.serialization_only:
+        run_serialization(args.rows, args.repeats)
+    else:
+        run(args.url, args.end, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Compare the tree based and the iterparse ENTSO-E load mappers.
+
+Usage:
+    uv run python -m benchmarks.bench_entsoe_mapper --points 35040
+
+Builds an A65 document with ``--points`` quarter-hourly points, a year by
+default, and reports the parse throughput in points per second and the peak
+resident memory of parsing it once in a fresh process. No database or API
+access is needed.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+from probabilistic_load_forecast.adapters.entsoe.mapper import (
+    NAMESPACE,
+    IterparseLoadMapper,
+    XmlLoadMapper,
+)
+
+from benchmarks.common import SERIES_START
+
+MAPPERS = {
+    "tree": XmlLoadMapper.map,
+    "iterparse": IterparseLoadMapper.map,
+    "iterparse arrays": IterparseLoadMapper.map_arrays,
+}
+
+
+def synthetic_document(points: int) -> str:
+    """An A65 document of one TimeSeries with one quarter-hourly Period."""
+    start = SERIES_START
+    end = start + timedelta(minutes=15) * points
+    body = "".join(
+        f"<Point><position>{i + 1}</position><quantity>{6000 + i % 96}</quantity></Point>"
+        for i in range(points)
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><GL_MarketDocument xmlns="{NAMESPACE}">'
+        "<TimeSeries><outBiddingZone_Domain.mRID codingScheme=\"A01\">10YAT-APG------L"
+        "</outBiddingZone_Domain.mRID><Period><timeInterval>"
+        f"<start>{start:%Y-%m-%dT%H:%MZ}</start><end>{end:%Y-%m-%dT%H:%MZ}</end>"
+        f"</timeInterval><resolution>PT15M</resolution>{body}</Period></TimeSeries>"
+        "</GL_MarketDocument>"
+    )
+
+
+def peak_memory(name: str, points: int) -> float:
+    """Growth of the peak RSS in MiB while mapping the document once.
+
+    Runs in a fresh interpreter, so memory freed by earlier runs cannot be
+    reused and hide the peak. Needs Linux.
+    """
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_entsoe_mapper", "--points", str(points),
+         "--memory-of", name],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def _peak_rss_kib() -> int:
+    # Unlike ru_maxrss, VmHWM is not inherited from the parent across exec.
+    with open("/proc/self/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    raise RuntimeError("VmHWM is not reported, peak memory needs Linux")
+
+
+def _print_peak_memory(name: str, points: int) -> None:
+    xml = synthetic_document(points)
+    before = _peak_rss_kib()
+    MAPPERS[name](xml)
+    print((_peak_rss_kib() - before) / 1024)
+
+
+def run(points: int, repeat: int) -> None:
+    xml = synthetic_document(points)
+    print(f"points={points} document={len(xml) / 2**20:.1f} MiB")
+    print(f"{'mapper':<18} {'seconds':>10} {'points/s':>14} {'peak MiB':>10}")
+
+    for name, mapper in MAPPERS.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            mapper(xml)
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"{name:<18} {best:>10.3f} {points / best:>14,.0f} {peak_memory(name, points):>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=35_040)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--memory-of", choices=MAPPERS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.memory_of:
+        _print_peak_memory(args.memory_of, args.points)
+    else:
+        run(args.points, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Compare row-wise and binary COPY writes of ERA5 country averages.
+
+Usage:
+    TEST_PG_DSN=postgresql://... uv run python -m benchmarks.bench_era5_ingest --hours 61368
+
+Writes all five weather variables for ``--hours`` hourly timestamps (the
+default covers 2018-10 to 2025-10) and reports the throughput in rows/s.
+"""
+
+import argparse
+from datetime import timedelta
+
+import numpy as np
+
+from probabilistic_load_forecast.adapters.db import Era5PostgreRepository
+from probabilistic_load_forecast.domain.model import (
+    CountryCode,
+    Era5ArraySeries,
+    Era5Series,
+    InstantWeatherValue,
+    IntervalStatistic,
+    IntervalWeatherValue,
+    Resolution,
+    TimeInterval,
+    VARIABLE_VALUE_KIND,
+    WeatherArea,
+    WeatherValueKind,
+    WeatherVariable,
+)
+
+from benchmarks.common import SERIES_START, benchmark_dsn, scratch_schema, timed
+
+AREA = WeatherArea(CountryCode("AT"))
+
+
+def array_series(hours: int) -> list[Era5ArraySeries]:
+    start = np.datetime64(SERIES_START.replace(tzinfo=None), "us")
+    valid_time = start + np.arange(hours).astype("timedelta64[h]")
+    rng = np.random.default_rng(42)
+    return [
+        Era5ArraySeries(
+            area=AREA,
+            resolution=Resolution.PT1H,
+            variable=variable,
+            valid_time=valid_time,
+            value=rng.normal(size=hours),
+        )
+        for variable in WeatherVariable
+    ]
+
+
+def to_domain_series(series: Era5ArraySeries) -> Era5Series:
+    timestamps = series.valid_time.astype("datetime64[us]").astype(object)
+    observations = []
+    for valid_at, value in zip(timestamps, series.value):
+        valid_at = valid_at.replace(tzinfo=SERIES_START.tzinfo)
+        if VARIABLE_VALUE_KIND[series.variable] is WeatherValueKind.INSTANT:
+            observations.append(
+                InstantWeatherValue(AREA, series.variable, valid_at, float(value))
+            )
+        else:
+            observations.append(
+                IntervalWeatherValue(
+                    area=AREA,
+                    variable=series.variable,
+                    interval=TimeInterval(
+                        valid_at - timedelta(hours=1),
+                        valid_at,
+                    ),
+                    statistic=IntervalStatistic.TOTAL,
+                    value=float(value),
+                )
+            )
+    return Era5Series(
+        area=AREA,
+        resolution=series.resolution,
+        observations=tuple(observations),
+        variable=series.variable,
+    )
+
+
+def run(hours: int) -> None:
+    dsn = benchmark_dsn()
+    columnar = array_series(hours)
+    domain = [to_domain_series(series) for series in columnar]
+    rows = hours * len(columnar)
+
+    print(f"variables={len(columnar)} hours={hours} rows={rows}")
+    print(f"{'path':<12} {'seconds':>10} {'rows/s':>12}")
+
+    with scratch_schema(dsn) as schema:
+        repo = Era5PostgreRepository(dsn)
+        with timed() as elapsed:
+            for series in domain:
+                repo.add(series, schema=schema)
+        print(f"{'executemany':<12} {elapsed[0]:>10.2f} {rows / elapsed[0]:>12,.0f}")
+
+    with scratch_schema(dsn) as schema:
+        repo = Era5PostgreRepository(dsn)
+        with timed() as elapsed:
+            repo.add_arrays(columnar, schema=schema)
+        print(f"{'binary copy':<12} {elapsed[0]:>10.2f} {rows / elapsed[0]:>12,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=int, default=61_368)
+    args = parser.parse_args()
+    run(args.hours)
+
+
+if __name__ == "__main__":
+    main()
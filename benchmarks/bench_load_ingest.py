@@ -0,0 +1,49 @@
+"""Compare the executemany and COPY based write paths of EntsoePostgreRepository.
+
+Usage:
+    TEST_PG_DSN=postgresql://... uv run python -m benchmarks.bench_load_ingest --rows 250000
+
+Each run writes the series twice into a fresh schema, once into an empty table
+(pure inserts) and once more with changed values (pure updates).
+"""
+
+import argparse
+
+from probabilistic_load_forecast.adapters.db import EntsoePostgreRepository
+
+from benchmarks.common import (
+    benchmark_dsn,
+    scratch_schema,
+    synthetic_load_series,
+    timed,
+)
+
+
+def run(rows: int) -> None:
+    dsn = benchmark_dsn()
+    fresh = synthetic_load_series(rows)
+    changed = synthetic_load_series(rows, offset_mw=1.0)
+
+    print(f"rows={rows}")
+    print(f"{'path':<12} {'phase':<8} {'seconds':>10} {'rows/s':>12}")
+
+    for path in ("executemany", "copy"):
+        with scratch_schema(dsn) as schema:
+            repo = EntsoePostgreRepository(dsn)
+            write = repo.add if path == "executemany" else repo.add_bulk
+            for phase, series in (("insert", fresh), ("update", changed)):
+                with timed() as elapsed:
+                    write(series, schema=schema)
+                seconds = elapsed[0]
+                print(f"{path:<12} {phase:<8} {seconds:>10.2f} {rows / seconds:>12,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=250_000)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
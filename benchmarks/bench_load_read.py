@@ -0,0 +1,68 @@
+"""Compare the object and columnar read paths of EntsoePostgreRepository.
+
+Usage:
+    TEST_PG_DSN=postgresql://... uv run python -m benchmarks.bench_load_read --months 1 12 84
+
+Seeds the longest window once, then reads each window with ``get`` (one
+LoadMeasurement per row) and ``get_arrays`` (binary COPY into NumPy).
+"""
+
+import argparse
+from datetime import timedelta
+
+from probabilistic_load_forecast.adapters.db import EntsoePostgreRepository
+
+from benchmarks.common import (
+    AUSTRIA,
+    SERIES_START,
+    benchmark_dsn,
+    scratch_schema,
+    synthetic_load_series,
+    timed,
+)
+
+ROWS_PER_MONTH = 30 * 96
+
+
+def best_of(repeats: int, read) -> float:
+    timings = []
+    for _ in range(repeats):
+        with timed() as elapsed:
+            read()
+        timings.append(elapsed[0])
+    return min(timings)
+
+
+def run(months: list[int], repeats: int) -> None:
+    dsn = benchmark_dsn()
+    with scratch_schema(dsn) as schema:
+        repo = EntsoePostgreRepository(dsn)
+        repo.add_bulk(synthetic_load_series(max(months) * ROWS_PER_MONTH), schema=schema)
+
+        print(f"{'months':>6} {'rows':>9} {'get [s]':>9} {'get_arrays [s]':>15} {'speedup':>8}")
+        for month_count in months:
+            end = SERIES_START + timedelta(minutes=15) * month_count * ROWS_PER_MONTH
+            get_s = best_of(
+                repeats, lambda: repo.get(SERIES_START, end, AUSTRIA, schema=schema)
+            )
+            arrays_s = best_of(
+                repeats,
+                lambda: repo.get_arrays(SERIES_START, end, AUSTRIA, schema=schema),
+            )
+            rows = month_count * ROWS_PER_MONTH
+            print(
+                f"{month_count:>6} {rows:>9} {get_s:>9.3f} {arrays_s:>15.3f} "
+                f"{get_s / arrays_s:>7.1f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--months", type=int, nargs="+", default=[1, 12, 84])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    run(args.months, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compare weather range reads on the legacy, BRIN indexed and partitioned layouts.
+
+Usage:
+    TEST_PG_DSN=postgresql://... uv run python -m benchmarks.bench_weather_read --hours 61368 --countries 20
+
+Seeds every weather variable for ``--countries`` areas into three scratch
+schemas: the legacy heap tables without BRIN index, heap tables with the BRIN
+index on ``valid_time`` and tables partitioned by year. Each layout is then
+read with ``get_frame`` for a one-week and a full-history window of Austria.
+"""
+
+import argparse
+import string
+from datetime import timedelta
+from itertools import product
+
+import numpy as np
+import psycopg
+from psycopg import sql
+
+from probabilistic_load_forecast.adapters.db import Era5PostgreRepository
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+from probabilistic_load_forecast.domain.model import (
+    CountryCode,
+    Era5ArraySeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+from benchmarks.common import SERIES_START, benchmark_dsn, scratch_schema, timed
+
+AUSTRIA = WeatherArea(CountryCode("AT"))
+LAYOUTS = ("legacy", "brin", "partitioned")
+
+
+def areas(countries: int) -> list[WeatherArea]:
+    # Austria plus made-up two letter codes standing in for further countries.
+    codes = ("".join(pair) for pair in product(string.ascii_uppercase, repeat=2))
+    others = [code for code in codes if code != "AT"][: countries - 1]
+    return [AUSTRIA] + [WeatherArea(CountryCode(code)) for code in others]
+
+
+def seed(repo: Era5PostgreRepository, schema: str, hours: int, countries: int) -> None:
+    start = np.datetime64(SERIES_START.replace(tzinfo=None), "us")
+    valid_time = start + np.arange(hours).astype("timedelta64[h]")
+    rng = np.random.default_rng(42)
+    # Write one year at a time for all areas, so rows arrive roughly in time
+    # order like the yearly imports do.
+    for chunk in np.array_split(valid_time, max(hours // 8760, 1)):
+        repo.add_arrays(
+            (
+                Era5ArraySeries(
+                    area=area,
+                    resolution=Resolution.PT1H,
+                    variable=variable,
+                    valid_time=chunk,
+                    value=rng.normal(size=len(chunk)),
+                )
+                for area in areas(countries)
+                for variable in WeatherVariable
+            ),
+            schema=schema,
+        )
+
+
+def drop_brin_indexes(dsn: str, schema: str) -> None:
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        for variable in WeatherVariable:
+            conn.execute(
+                sql.SQL("DROP INDEX {}").format(
+                    sql.Identifier(
+                        schema, db_schema.weather_index_name(f"{variable}_country_avg")
+                    )
+                )
+            )
+
+
+def analyze(dsn: str, schema: str) -> None:
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        for variable in WeatherVariable:
+            conn.execute(
+                sql.SQL("ANALYZE {}").format(
+                    sql.Identifier(schema, f"{variable}_country_avg")
+                )
+            )
+
+
+def best_of(repeats: int, read) -> float:
+    timings = []
+    for _ in range(repeats):
+        with timed() as elapsed:
+            read()
+        timings.append(elapsed[0])
+    return min(timings)
+
+
+def run(hours: int, countries: int, repeats: int) -> None:
+    dsn = benchmark_dsn()
+    end = SERIES_START + timedelta(hours=hours)
+    windows = {
+        "1 week": TimeInterval(end - timedelta(days=7), end),
+        "full history": TimeInterval(SERIES_START, end),
+    }
+
+    print(f"{'layout':>12} {'window':>13} {'get_frame [s]':>14}")
+    for layout in LAYOUTS:
+        with scratch_schema(dsn) as schema:
+            repo = Era5PostgreRepository(dsn, partitioned=layout == "partitioned")
+            seed(repo, schema, hours, countries)
+            if layout == "legacy":
+                drop_brin_indexes(dsn, schema)
+            analyze(dsn, schema)
+
+            for name, interval in windows.items():
+                seconds = best_of(
+                    repeats,
+                    lambda: repo.get_frame(interval, AUSTRIA, WeatherVariable, schema=schema),
+                )
+                print(f"{layout:>12} {name:>13} {seconds:>14.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=int, default=61368)
+    parser.add_argument("--countries", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    run(args.hours, args.countries, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Load test the FastAPI service with many concurrent clients.
+
+Usage:
+    uv run uvicorn apps.api.main:app --workers 1
+    uv run python -m benchmarks.load_test_api --url http://127.0.0.1:8000 --concurrency 50 100 200
+
+Every client requests the same endpoint back to back for ``--duration``
+seconds. The report shows requests/s and the p50/p99 latency per
+concurrency level. Point ``--path`` at another endpoint to compare reads of
+different size, the default reads one week of Austrian load.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+import numpy as np
+
+DEFAULT_PATH = (
+    "/load-data?start=2025-01-01T00:00:00Z&end=2025-01-08T00:00:00Z"
+    "&eic_code=10YAT-APG------L"
+)
+
+
+async def client(
+    http: httpx.AsyncClient, path: str, deadline: float, latencies: list[float]
+) -> int:
+    errors = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await http.get(path)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            errors += 1
+    return errors
+
+
+async def run_level(url: str, path: str, concurrency: int, duration: float) -> None:
+    latencies: list[float] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as http:
+        # Warm up the connection pools of the client and the service.
+        await asyncio.gather(*(http.get(path) for _ in range(concurrency)))
+
+        started = time.perf_counter()
+        deadline = started + duration
+        errors = await asyncio.gather(
+            *(client(http, path, deadline, latencies) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started
+
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99])
+    print(
+        f"{concurrency:>11} {len(latencies):>9} {len(latencies) / elapsed:>10.1f} "
+        f"{p50:>9.1f} {p99:>9.1f} {sum(errors):>7}"
+    )
+
+
+async def run(url: str, path: str, levels: list[int], duration: float) -> None:
+    print(f"{'concurrency':>11} {'requests':>9} {'req/s':>10} {'p50 [ms]':>9} {'p99 [ms]':>9} {'errors':>7}")
+    for concurrency in levels:
+        await run_level(url, path, concurrency, duration)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--duration", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.path, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
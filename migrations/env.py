@@ -0,0 +1,63 @@
+"""Alembic environment running the migrations against the PG_DSN database."""
+
+from logging.config import fileConfig
+from pathlib import Path
+
+import psycopg
+from alembic import context
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, pool
+
+from probabilistic_load_forecast import config as app_config
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# The schema is managed with plain SQL, there is no SQLAlchemy metadata.
+target_metadata = None
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+load_dotenv(ROOT_DIR / ".env")
+
+SQLALCHEMY_URL = "postgresql+psycopg://"
+
+
+def run_migrations_offline() -> None:
+    """Render the migrations as SQL script without connecting to the database."""
+    context.configure(
+        url=SQLALCHEMY_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run the migrations on a connection to PG_DSN.
+
+    The connection is opened by psycopg itself, so both URL and key/value
+    style DSNs are accepted.
+    """
+    dsn = app_config.get_postgre_uri()
+    connectable = create_engine(
+        SQLALCHEMY_URL,
+        creator=lambda: psycopg.connect(dsn),
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,100 @@
+"""Helpers shared by the migration scripts."""
+
+from datetime import datetime
+from typing import Callable, Sequence
+
+import psycopg
+import sqlalchemy as sa
+from alembic import context, op
+from psycopg import sql
+
+
+def execute(*statements: sql.Composable | str) -> None:
+    """Run psycopg composed statements through Alembic.
+
+    Colons are escaped so SQLAlchemy does not read casts or timestamp literals
+    as bind parameters.
+    """
+    for statement in statements:
+        if isinstance(statement, sql.Composable):
+            statement = statement.as_string()
+        statement = statement.strip().rstrip(";")
+        op.execute(sa.text(statement.replace(":", "\\:")))
+
+
+def x_flag(name: str) -> bool:
+    """Read a boolean ``-x name=true`` argument of the alembic command line."""
+    value = context.get_x_argument(as_dictionary=True).get(name, "false")
+    return value.lower() in ("1", "true", "yes")
+
+
+def psycopg_cursor() -> psycopg.Cursor:
+    """A cursor on the migration connection, for data dependent steps."""
+    if context.is_offline_mode():
+        raise RuntimeError("This migration step needs a database connection, run it online.")
+    return op.get_bind().connection.driver_connection.cursor()
+
+
+def relkind(schema: str, tablename: str) -> str | None:
+    """The pg_class relkind of a table, ``None`` if it does not exist."""
+    with psycopg_cursor() as cur:
+        cur.execute(
+            """
+            SELECT c.relkind
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s
+            """,
+            (schema, tablename),
+        )
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def rebuild_table(
+    schema: str,
+    tablename: str,
+    columns: Sequence[str],
+    create_statements: Sequence[sql.Composable],
+    index_names: Sequence[str] = (),
+    create_partitions: Callable[[psycopg.Cursor, str], None] | None = None,
+) -> None:
+    """Recreate a table from new DDL and move its rows over.
+
+    The old table is renamed aside, the new one created and filled with a
+    single ``INSERT ... SELECT`` before the old one is dropped. Everything runs
+    in the migration transaction, which holds an exclusive lock on the table
+    until it commits.
+
+    Args:
+        index_names: Indexes and constraints of the old table whose names the
+            new DDL reuses. They are renamed along with the old table.
+        create_partitions: Called with a cursor and the old table's name after
+            the new table exists, to create the partitions its rows need.
+    """
+    legacy = f"{tablename}_legacy"
+    execute(f"ALTER TABLE {schema}.{tablename} RENAME TO {legacy};")
+    for index_name in index_names:
+        # Renaming the index of a constraint renames the constraint as well.
+        execute(f"ALTER INDEX IF EXISTS {schema}.{index_name} RENAME TO {index_name}_legacy;")
+
+    execute(*create_statements)
+    if create_partitions is not None:
+        with psycopg_cursor() as cur:
+            create_partitions(cur, legacy)
+
+    column_list = ", ".join(columns)
+    execute(
+        f"INSERT INTO {schema}.{tablename} ({column_list}) "
+        f"SELECT {column_list} FROM {schema}.{legacy};",
+        # Dropping a partitioned table drops its partitions as well.
+        f"DROP TABLE {schema}.{legacy};",
+    )
+
+
+def column_range(
+    cur: psycopg.Cursor, schema: str, tablename: str, column: str
+) -> tuple[datetime | None, datetime | None]:
+    """Smallest and largest value of a column, ``None`` for an empty table."""
+    cur.execute(f"SELECT min({column}), max({column}) FROM {schema}.{tablename};")
+    return cur.fetchone()
@@ -0,0 +1,61 @@
+"""Baseline schema created by the repositories.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+Every statement uses IF NOT EXISTS, so the revision can be applied to
+databases that were populated before the migrations existed.
+"""
+
+from typing import Sequence, Union
+
+from migrations.helpers import execute
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+WEATHER_TABLES = (
+    "t2m_country_avg",
+    "u10_country_avg",
+    "v10_country_avg",
+    "tp_country_avg",
+    "ssrd_country_avg",
+)
+
+
+def upgrade() -> None:
+    execute(
+        """
+        CREATE TABLE IF NOT EXISTS public.actual_total_load (
+            start_ts timestamptz NOT NULL,
+            end_ts timestamptz NOT NULL,
+            load_mw numeric(10, 2) NOT NULL,
+            created_at timestamp DEFAULT now() NULL,
+            zone_code varchar(30) DEFAULT '10YAT-APG------L'::character varying NULL,
+            CONSTRAINT unique_load_measurement_slot UNIQUE (start_ts, end_ts, zone_code)
+        );
+        """
+    )
+    for tablename in WEATHER_TABLES:
+        execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS public.{tablename} (
+                valid_time TIMESTAMPTZ NOT NULL,
+                value DOUBLE PRECISION NOT NULL,
+                stat TEXT NOT NULL CHECK (stat IN ('total', 'mean', 'instant')),
+                interval_seconds INTEGER NOT NULL DEFAULT 3600,
+                country_code VARCHAR(5) NOT NULL,
+                PRIMARY KEY (country_code, valid_time)
+            );
+            """
+        )
+
+
+def downgrade() -> None:
+    for tablename in WEATHER_TABLES:
+        execute(f"DROP TABLE IF EXISTS public.{tablename};")
+    execute("DROP TABLE IF EXISTS public.actual_total_load;")
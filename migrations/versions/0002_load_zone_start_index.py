@@ -0,0 +1,66 @@
+"""Index actual_total_load on (zone_code, start_ts), optionally partition it.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+The range read filters on one zone and orders by ``start_ts``. Without this
+index it scans the whole table, the unique constraint leads with ``start_ts``
+and does not help for a single zone.
+
+Run with ``-x partition_load=true`` to also convert the table into a table
+range partitioned by month on ``start_ts``. The rows are copied into the new
+partitions inside the migration transaction, plan for a full table rewrite.
+"""
+
+from typing import Sequence, Union
+
+import psycopg
+
+from migrations.helpers import column_range, execute, rebuild_table, relkind, x_flag
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "public"
+TABLE = "actual_total_load"
+COLUMNS = ("start_ts", "end_ts", "load_mw", "created_at", "zone_code")
+INDEX_NAMES = ("unique_load_measurement_slot", f"{TABLE}_zone_start_idx")
+
+
+def upgrade() -> None:
+    execute(
+        f"CREATE INDEX IF NOT EXISTS {TABLE}_zone_start_idx "
+        f"ON {SCHEMA}.{TABLE} (zone_code, start_ts);"
+    )
+    if x_flag("partition_load") and relkind(SCHEMA, TABLE) != "p":
+        rebuild_table(
+            SCHEMA,
+            TABLE,
+            COLUMNS,
+            db_schema.load_table_ddl(SCHEMA, TABLE, partitioned=True),
+            INDEX_NAMES,
+            _create_monthly_partitions,
+        )
+
+
+def downgrade() -> None:
+    if relkind(SCHEMA, TABLE) == "p":
+        rebuild_table(
+            SCHEMA,
+            TABLE,
+            COLUMNS,
+            db_schema.load_table_ddl(SCHEMA, TABLE, partitioned=False),
+            INDEX_NAMES,
+        )
+    execute(f"DROP INDEX IF EXISTS {SCHEMA}.{TABLE}_zone_start_idx;")
+
+
+def _create_monthly_partitions(cur: psycopg.Cursor, legacy_table: str) -> None:
+    first, last = column_range(cur, SCHEMA, legacy_table, "start_ts")
+    if first is not None:
+        db_schema.ensure_monthly_partitions(cur, SCHEMA, TABLE, first, last)
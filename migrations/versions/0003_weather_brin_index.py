@@ -0,0 +1,71 @@
+"""BRIN index on valid_time of the weather tables, optionally partition them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+The ``(country_code, valid_time)`` primary key already serves reads of one
+country. The BRIN index keeps reads over a time window cheap as more
+countries share a table, at a few pages per table.
+
+Run with ``-x partition_weather=true`` to also convert every
+``<variable>_country_avg`` table into a table range partitioned by year on
+``valid_time``. The rows are copied inside the migration transaction.
+"""
+
+from typing import Sequence, Union
+
+import psycopg
+
+from migrations.helpers import column_range, execute, rebuild_table, relkind, x_flag
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "public"
+WEATHER_TABLES = (
+    "t2m_country_avg",
+    "u10_country_avg",
+    "v10_country_avg",
+    "tp_country_avg",
+    "ssrd_country_avg",
+)
+COLUMNS = ("valid_time", "value", "stat", "interval_seconds", "country_code")
+
+
+def upgrade() -> None:
+    partition = x_flag("partition_weather")
+    for tablename in WEATHER_TABLES:
+        execute(
+            f"CREATE INDEX IF NOT EXISTS {tablename}_valid_time_brin "
+            f"ON {SCHEMA}.{tablename} USING brin (valid_time);"
+        )
+        if partition and relkind(SCHEMA, tablename) != "p":
+            _rebuild(tablename, partitioned=True)
+
+
+def downgrade() -> None:
+    for tablename in WEATHER_TABLES:
+        if relkind(SCHEMA, tablename) == "p":
+            _rebuild(tablename, partitioned=False)
+        execute(f"DROP INDEX IF EXISTS {SCHEMA}.{tablename}_valid_time_brin;")
+
+
+def _rebuild(tablename: str, partitioned: bool) -> None:
+    def create_yearly_partitions(cur: psycopg.Cursor, legacy_table: str) -> None:
+        first, last = column_range(cur, SCHEMA, legacy_table, "valid_time")
+        if first is not None:
+            db_schema.ensure_yearly_partitions(cur, SCHEMA, tablename, first, last)
+
+    rebuild_table(
+        SCHEMA,
+        tablename,
+        COLUMNS,
+        db_schema.weather_table_ddl(SCHEMA, tablename, partitioned),
+        (f"{tablename}_pkey", f"{tablename}_valid_time_brin"),
+        create_yearly_partitions if partitioned else None,
+    )
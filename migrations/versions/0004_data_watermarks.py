@@ -0,0 +1,53 @@
+"""Per-source watermarks of the latest stored timestamp.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+The repositories advance ``data_watermarks`` whenever they write load or
+weather data, ``ForecastMetadataRepository`` reads it instead of scanning
+every data table. The upgrade backfills the watermarks from existing rows.
+"""
+
+from typing import Sequence, Union
+
+from migrations.helpers import execute
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "public"
+# (table, key column, timestamp column) of every watermarked source.
+SOURCES = (
+    ("actual_total_load", "zone_code", "start_ts"),
+    ("t2m_country_avg", "country_code", "valid_time"),
+    ("u10_country_avg", "country_code", "valid_time"),
+    ("v10_country_avg", "country_code", "valid_time"),
+    ("tp_country_avg", "country_code", "valid_time"),
+    ("ssrd_country_avg", "country_code", "valid_time"),
+)
+
+
+def upgrade() -> None:
+    execute(db_schema.watermark_table_ddl(SCHEMA))
+    for tablename, key_column, ts_column in SOURCES:
+        execute(
+            f"""
+            INSERT INTO {SCHEMA}.data_watermarks AS w (source, key, latest_ts)
+            SELECT '{tablename}', {key_column}, max({ts_column})
+            FROM {SCHEMA}.{tablename}
+            WHERE {key_column} IS NOT NULL
+            GROUP BY {key_column}
+            ON CONFLICT (source, key) DO UPDATE SET
+                latest_ts = GREATEST(w.latest_ts, EXCLUDED.latest_ts),
+                updated_at = now();
+            """
+        )
+
+
+def downgrade() -> None:
+    execute(f"DROP TABLE IF EXISTS {SCHEMA}.data_watermarks;")
@@ -0,0 +1,41 @@
+"""Hourly and daily roll-ups of actual_total_load.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+``EntsoePostgreRepository`` keeps ``actual_total_load_hourly`` and
+``actual_total_load_daily`` up to date on every write and answers aligned
+resampled reads from them. The upgrade creates the tables and fills them
+from the existing slots, buckets start at midnight UTC like the reads. The
+repositories never create the roll-ups themselves, without this revision
+resampled reads bin the slots.
+"""
+
+from typing import Sequence, Union
+
+from migrations.helpers import execute
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+from probabilistic_load_forecast.adapters.db.repository import BUCKET_ORIGIN
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "public"
+TABLE = "actual_total_load"
+
+
+def upgrade() -> None:
+    for grain in db_schema.LOAD_ROLLUP_GRAINS:
+        execute(
+            db_schema.load_rollup_ddl(SCHEMA, TABLE, grain),
+            db_schema.load_rollup_backfill(SCHEMA, TABLE, grain, BUCKET_ORIGIN),
+        )
+
+
+def downgrade() -> None:
+    for grain in db_schema.LOAD_ROLLUP_GRAINS:
+        execute(f"DROP TABLE IF EXISTS {SCHEMA}.{db_schema.load_rollup_name(TABLE, grain)};")
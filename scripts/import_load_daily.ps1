@@ -1,17 +1,13 @@
 param(
     [string]$ProjectRoot = (Resolve-Path (Join-Path $PSScriptRoot "..")).Path,
-    [int]$LookbackDays = 2
+    [string]$EicCode = "10YAT-APG------L",
+    [int]$OverlapHours = 24
 )
 
 $ErrorActionPreference = "Stop"
 
 Set-Location $ProjectRoot
 
-$endUtc = [DateTime]::UtcNow
-$startUtc = $endUtc.AddDays(-$LookbackDays)
-$startIso = $startUtc.ToString("yyyy-MM-ddTHH:mm:ssZ")
-$endIso = $endUtc.ToString("yyyy-MM-ddTHH:mm:ssZ")
-
 $plfExe = Join-Path $ProjectRoot ".venv\\Scripts\\plf.exe"
 $uvExe = Join-Path $ProjectRoot ".venv\\Scripts\\uv.exe"
 
@@ -25,11 +21,12 @@ if (Test-Path $plfExe) {
     throw "Neither .venv\\Scripts\\plf.exe nor .venv\\Scripts\\uv.exe was found under $ProjectRoot. Create the project virtual environment first."
 }
 
-Write-Host "Importing load data from $startIso to $endIso"
+Write-Host "Importing new load data of $EicCode, re-fetching the last $OverlapHours hours"
 
 & $command @baseArgs load import `
-    --start $startIso `
-    --end $endIso
+    --incremental `
+    --eic-code $EicCode `
+    --overlap-hours $OverlapHours
 
 if ($LASTEXITCODE -ne 0) {
     throw "Load import failed with exit code $LASTEXITCODE."
@@ -1,8 +1,55 @@
 """Database repository adapters package."""
 
-from .repository import EntsoePostgreRepository, Era5PostgreRepository, ForecastMetadataRepository
+from .async_repository import (
+    AsyncEntsoePostgreRepository,
+    AsyncEra5PostgreRepository,
+    AsyncForecastMetadataRepository,
+)
+from .cache import (
+    AsyncCachedEntsoeRepository,
+    AsyncCachedEra5Repository,
+    CacheStatistics,
+    CachedEntsoeRepository,
+    CachedEra5Repository,
+    QueryCache,
+)
+from .pool import (
+    PoolSettings,
+    PoolStatistics,
+    create_async_pool,
+    create_pool,
+)
+from .range_cache import (
+    AsyncLoadRangeCache,
+    AsyncWeatherRangeCache,
+)
+from .repository import (
+    EntsoePostgreRepository,
+    Era5PostgreRepository,
+    ForecastMetadataRepository,
+    UpsertResult,
+    Watermark,
+)
 
 __all__ = [
+    "AsyncCachedEntsoeRepository",
+    "AsyncCachedEra5Repository",
+    "AsyncEntsoePostgreRepository",
+    "AsyncEra5PostgreRepository",
+    "AsyncForecastMetadataRepository",
+    "AsyncLoadRangeCache",
+    "AsyncWeatherRangeCache",
+    "CacheStatistics",
+    "CachedEntsoeRepository",
+    "CachedEra5Repository",
     "EntsoePostgreRepository",
     "Era5PostgreRepository",
+    "ForecastMetadataRepository",
+    "PoolSettings",
+    "PoolStatistics",
+    "QueryCache",
+    "UpsertResult",
+    "Watermark",
+    "create_async_pool",
+    "create_pool",
 ]
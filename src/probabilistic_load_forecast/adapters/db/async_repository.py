@@ -0,0 +1,551 @@
+"""asyncio counterparts of the PostgreSQL repositories for the FastAPI service.
+
+The classes share their SQL and row mapping with the blocking repositories in
+``repository.py`` and mirror their ``get``/``add`` contracts as coroutines.
+Waiting for Postgres then suspends the request instead of holding a
+threadpool worker.
+"""
+
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Iterable
+
+import psycopg
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+from probabilistic_load_forecast.adapters.db import timing
+from probabilistic_load_forecast.adapters.db.repository import (
+    UpsertResult,
+    Watermark,
+    _EntsoeQueries,
+    _Era5Queries,
+    _ForecastMetadataQueries,
+    _rows_to_resampled,
+    _watermark_query,
+    _watermark_rows,
+)
+from probabilistic_load_forecast.adapters.utils import datetime_bounds
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    Era5ArraySeries,
+    Era5Frame,
+    Era5Series,
+    LoadArrayBatch,
+    LoadArraySeries,
+    LoadSeries,
+    ResampledSeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+
+class AsyncPostgresRepository:
+    """Base class handing out connections from an async pool or a plain DSN.
+
+    The pool must be opened with ``await pool.open()`` before the first call.
+    """
+
+    def __init__(
+        self, dsn: str | None = None, pool: AsyncConnectionPool | None = None
+    ):
+        if dsn is None and pool is None:
+            raise ValueError("Either a dsn or a connection pool is required")
+        self.dsn = dsn
+        self.pool = pool
+        self._known_tables: dict[tuple[str, str], bool] = {}
+        self._watermark_schemas: set[str] = set()
+
+    @asynccontextmanager
+    async def _connect(self, operation: str = "write") -> AsyncIterator[psycopg.AsyncConnection]:
+        """Yield a connection whose transaction is committed when the block exits.
+
+        Waiting for the connection is timed as the ``connect`` stage of ``operation``.
+        """
+        async with AsyncExitStack() as stack:
+            with timing.stage("connect", operation):
+                if self.pool is not None:
+                    con = await stack.enter_async_context(self.pool.connection())
+                else:
+                    con = await stack.enter_async_context(
+                        await psycopg.AsyncConnection.connect(self.dsn)
+                    )
+            yield con
+
+    async def _fetchall(self, operation: str, query: sql.Composable, params) -> list:
+        """Run a read query, timing its ``execute`` and ``fetch`` stages."""
+        async with self._connect(operation) as con:
+            async with con.cursor() as cur:
+                with timing.stage("execute", operation):
+                    await cur.execute(query, params)
+                with timing.stage("fetch", operation):
+                    rows = await cur.fetchall()
+        timing.record_rows(operation, len(rows))
+        return rows
+
+    async def _fetchone(self, operation: str, query: sql.Composable, params) -> tuple | None:
+        """Like ``_fetchall`` for queries returning at most one row."""
+        async with self._connect(operation) as con:
+            async with con.cursor() as cur:
+                with timing.stage("execute", operation):
+                    await cur.execute(query, params)
+                with timing.stage("fetch", operation):
+                    row = await cur.fetchone()
+        timing.record_rows(operation, int(row is not None))
+        return row
+
+    async def _ensure_table(
+        self, tablename: str, cur: psycopg.AsyncCursor, schema: str = "public"
+    ) -> bool:
+        """Create the table once per repository instance, returns whether it is partitioned."""
+        if (schema, tablename) not in self._known_tables:
+            for statement in self._table_ddl(schema, tablename):
+                await cur.execute(statement)
+            await cur.execute(db_schema.IS_PARTITIONED_QUERY, (schema, tablename))
+            row = await cur.fetchone()
+            self._known_tables[(schema, tablename)] = bool(row and row[0])
+        return self._known_tables[(schema, tablename)]
+
+    async def _advance_watermarks(
+        self,
+        cur: psycopg.AsyncCursor,
+        schema: str,
+        source: str,
+        latest: dict[str, datetime],
+    ) -> None:
+        """Move the watermarks of ``source`` forward to the latest written timestamps."""
+        if not latest:
+            return
+        if schema not in self._watermark_schemas:
+            await cur.execute(db_schema.watermark_table_ddl(schema))
+            self._watermark_schemas.add(schema)
+
+        await cur.executemany(_watermark_query(schema), _watermark_rows(source, latest))
+
+    async def _prepare_write(
+        self,
+        cur: psycopg.AsyncCursor,
+        schema: str,
+        tablename: str,
+        first: datetime | None,
+        last: datetime | None,
+    ) -> None:
+        """Create the table and, if it is partitioned, the partitions covering [first, last]."""
+        if not await self._ensure_table(tablename, cur, schema) or first is None:
+            return
+        for statement in self._partition_ddl(schema, tablename, first, last):
+            await cur.execute(statement)
+
+
+class AsyncEntsoePostgreRepository(_EntsoeQueries, AsyncPostgresRepository):
+    """asyncio repository for actual load data from ENTSO-E."""
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        pool: AsyncConnectionPool | None = None,
+        partitioned: bool = False,
+    ):
+        super().__init__(dsn, pool)
+        self.partitioned = partitioned
+        self._known_rollups: dict[tuple[str, str], frozenset[str]] = {}
+
+    async def _rollup_grains(
+        self, schema: str, tablename: str, cur: psycopg.AsyncCursor | None = None
+    ) -> frozenset[str]:
+        """Grains of the roll-ups migration 0005 created, like the blocking repository.
+
+        Looked up on ``cur`` inside a write transaction, otherwise on a
+        connection of its own.
+        """
+        if (schema, tablename) not in self._known_rollups:
+            params = self._rollup_tables_params(schema, tablename)
+            if cur is None:
+                rows = await self._fetchall("load.rollups", db_schema.EXISTING_TABLES_QUERY, params)
+            else:
+                await cur.execute(db_schema.EXISTING_TABLES_QUERY, params)
+                rows = await cur.fetchall()
+            self._known_rollups[(schema, tablename)] = self._rollup_grains_of(rows, tablename)
+        return self._known_rollups[(schema, tablename)]
+
+    async def _refresh_rollups(
+        self,
+        cur: psycopg.AsyncCursor,
+        schema: str,
+        tablename: str,
+        load_series: LoadSeries | LoadArraySeries,
+    ) -> None:
+        """Recompute the roll-up buckets touched by ``load_series`` in the write transaction."""
+        for grain in await self._rollup_grains(schema, tablename, cur):
+            params = self._rollup_refresh_params(load_series, grain)
+            if params:
+                await cur.executemany(self._rollup_refresh_query(schema, tablename, grain), params)
+
+    async def get(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadSeries:
+        """Retrieve actual load data between start and end timestamps."""
+        query = self._select_query(schema, tablename)
+        rows = await self._fetchall(
+            "load.get", query, self._select_params(bidding_zone, start, end)
+        )
+
+        with timing.stage("map", "load.get"):
+            return self._rows_to_series(rows, bidding_zone)
+
+    async def iter_batches(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        batch_size: int = 10_000,
+        columnar: bool = False,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> AsyncIterator[LoadSeries | LoadArraySeries]:
+        """Stream actual load data in chunks of at most ``batch_size`` rows.
+
+        Reads through a named server-side cursor like the blocking
+        ``iter_batches``. The connection is held until the iterator is
+        exhausted or closed, so close it when a client disconnects.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        columns = self._stream_columns if columnar else None
+        query = self._select_query(schema, tablename, columns)
+
+        operation = "load.iter_batches"
+        async with self._connect(operation) as con:
+            async with con.cursor(name=f"stream_{tablename}") as cur:
+                cur.itersize = batch_size
+                with timing.stage("execute", operation):
+                    await cur.execute(query, self._select_params(bidding_zone, start, end))
+                while True:
+                    with timing.stage("fetch", operation):
+                        rows = await cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    timing.record_rows(operation, len(rows))
+                    with timing.stage("map", operation):
+                        if columnar:
+                            chunk = self._rows_to_arrays(rows, bidding_zone)
+                        else:
+                            chunk = self._rows_to_series(rows, bidding_zone)
+                    yield chunk
+
+    async def get_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArraySeries:
+        """Retrieve actual load data as NumPy arrays through a binary ``COPY``."""
+        query = self._copy_query(schema, tablename, bidding_zone, start, end)
+
+        async with self._connect("load.get_arrays") as con:
+            async with con.cursor() as cur:
+                # COPY runs the query while the data streams in, it is all ``fetch``.
+                with timing.stage("fetch", "load.get_arrays"):
+                    async with cur.copy(query) as copy:
+                        payload = b"".join([chunk async for chunk in copy])
+
+        with timing.stage("map", "load.get_arrays"):
+            series = self._copy_to_arrays(payload, bidding_zone)
+        timing.record_rows("load.get_arrays", len(series))
+        return series
+
+    async def get_many(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zones: Iterable[BiddingZone],
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArrayBatch:
+        """Retrieve the load of several zones with one ``zone_code = ANY(...)`` query."""
+        bidding_zones = list(dict.fromkeys(bidding_zones))
+        rows = await self._fetchall(
+            "load.get_many",
+            self._batch_query(schema, tablename),
+            self._batch_params(bidding_zones, start, end),
+        )
+
+        with timing.stage("map", "load.get_many"):
+            return self._rows_to_batch(rows, bidding_zones, start, end)
+
+    async def get_resampled(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        resolution: Resolution,
+        aggregates: Iterable[str] = ("mean",),
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> ResampledSeries:
+        """Aggregate the load of slots starting in ``[start, end)`` per ``resolution``.
+
+        Uses the hourly or daily roll-up where it exists and answers the read exactly.
+        """
+        aggregates = list(dict.fromkeys(aggregates))
+        grain = self._rollup_grain(
+            start, end, resolution, aggregates, await self._rollup_grains(schema, tablename)
+        )
+        query = self._resample_query(schema, tablename, aggregates, grain)
+        params = self._resample_params(bidding_zone, start, end, resolution)
+        rows = await self._fetchall("load.get_resampled", query, params)
+
+        with timing.stage("map", "load.get_resampled"):
+            return _rows_to_resampled(rows, resolution, aggregates)
+
+    async def add(
+        self,
+        load_series: LoadSeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> None:
+        """Add load measurements to the repository."""
+        async with self._connect() as con:
+            async with con.cursor() as cur:
+                await self._prepare_write(
+                    cur, schema, tablename, *self._write_bounds(load_series)
+                )
+                await cur.executemany(
+                    self._insert_query(schema, tablename), self._insert_rows(load_series)
+                )
+                await self._refresh_rollups(cur, schema, tablename, load_series)
+                await self._advance_watermarks(
+                    cur, schema, tablename, self._latest_per_zone(load_series)
+                )
+
+    async def add_bulk(
+        self,
+        load_series: LoadSeries | LoadArraySeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> UpsertResult:
+        """Bulk upsert load measurements through a COPY-loaded staging table."""
+        async with self._connect() as con:
+            async with con.cursor() as cur:
+                await self._prepare_write(
+                    cur, schema, tablename, *self._write_bounds(load_series)
+                )
+                if isinstance(load_series, LoadArraySeries):
+                    await cur.execute(self._array_staging_ddl(tablename))
+                    async with cur.copy(self._array_staging_copy_query(tablename)) as copy:
+                        await copy.write(self._array_copy_payload(load_series))
+                    await cur.execute(
+                        self._merge_query(schema, tablename, columnar=True),
+                        self._array_merge_params(load_series),
+                    )
+                else:
+                    await cur.execute(self._staging_ddl(tablename))
+                    async with cur.copy(self._staging_copy_query(tablename)) as copy:
+                        for row in self._insert_rows(load_series):
+                            await copy.write_row(row)
+                    await cur.execute(self._merge_query(schema, tablename))
+                result = self._merge_result(await cur.fetchone())
+                await self._refresh_rollups(cur, schema, tablename, load_series)
+                await self._advance_watermarks(
+                    cur, schema, tablename, self._latest_per_zone(load_series)
+                )
+
+        return result
+
+
+class AsyncEra5PostgreRepository(_Era5Queries, AsyncPostgresRepository):
+    """asyncio repository for ERA5 country averages."""
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        pool: AsyncConnectionPool | None = None,
+        partitioned: bool = False,
+    ):
+        super().__init__(dsn, pool)
+        self.partitioned = partitioned
+
+    async def get(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        schema: str = "public",
+    ) -> Era5Series:
+        select_stmt = self._select_query(schema, variable)
+        params = (area.code.value, interval.start, interval.end)
+        rows = await self._fetchall("weather.get", select_stmt, params)
+
+        with timing.stage("map", "weather.get"):
+            return self._rows_to_series(rows, area, variable)
+
+    async def get_arrays(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        schema: str = "public",
+    ) -> Era5ArraySeries:
+        """Retrieve one variable as arrays of stored valid times and values.
+
+        Reads the same rows as ``get`` without building an observation per row.
+        """
+        select_stmt = self._select_query(schema, variable, self._array_columns)
+        params = (area.code.value, interval.start, interval.end)
+        rows = await self._fetchall("weather.get_arrays", select_stmt, params)
+
+        with timing.stage("map", "weather.get_arrays"):
+            return self._rows_to_arrays(rows, area, variable)
+
+    async def get_frame(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: Iterable[WeatherVariable],
+        schema: str = "public",
+    ) -> Era5Frame:
+        """Retrieve several variables of one area with a single query."""
+        variables = list(dict.fromkeys(variables))
+        query, params = self._frame_query(schema, interval, area, variables)
+        rows = await self._fetchall("weather.get_frame", query, params)
+
+        with timing.stage("map", "weather.get_frame"):
+            return self._rows_to_frame(rows, area, variables)
+
+    async def get_resampled(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        resolution: Resolution,
+        aggregates: Iterable[str] = ("mean",),
+        schema: str = "public",
+    ) -> ResampledSeries:
+        """Aggregate one variable per ``resolution`` bucket of period starts."""
+        aggregates = list(dict.fromkeys(aggregates))
+        query = self._resample_query(schema, variable, aggregates)
+        params = self._resample_params(interval, area, resolution)
+        rows = await self._fetchall("weather.get_resampled", query, params)
+
+        with timing.stage("map", "weather.get_resampled"):
+            return _rows_to_resampled(rows, resolution, aggregates)
+
+    async def add(
+        self,
+        weather_series: Era5Series,
+        interval_seconds=None,
+        schema: str = "public",
+    ) -> None:
+        """Add ERA5 country average data to the repository."""
+        tablename = f"{weather_series.variable}_country_avg"
+        rows = self._write_rows(weather_series)
+        first, last = self._write_bounds(rows)
+
+        async with self._connect() as con:
+            async with con.cursor() as cur:
+                await self._prepare_write(cur, schema, tablename, first, last)
+                await cur.executemany(self._insert_query(schema, tablename), rows)
+                if last is not None:
+                    await self._advance_watermarks(
+                        cur, schema, tablename, {weather_series.area.code.value: last}
+                    )
+
+    async def add_arrays(
+        self,
+        weather_series: Iterable[Era5ArraySeries],
+        schema: str = "public",
+    ) -> dict[WeatherVariable, UpsertResult]:
+        """Bulk upsert columnar ERA5 series in a single transaction, like the blocking repository."""
+        results: dict[WeatherVariable, UpsertResult] = {}
+
+        async with self._connect() as con:
+            async with con.cursor() as cur:
+                await cur.execute(self._staging_ddl)
+
+                for series in weather_series:
+                    tablename = f"{series.variable}_country_avg"
+                    first, last = datetime_bounds(series.valid_time)
+                    await self._prepare_write(cur, schema, tablename, first, last)
+
+                    async with cur.copy(self._staging_copy_query) as copy:
+                        await copy.write(self._copy_payload(series))
+
+                    await cur.execute(
+                        self._merge_query(schema, tablename), self._merge_params(series)
+                    )
+                    inserted, updated = await cur.fetchone()
+                    results[series.variable] = UpsertResult(
+                        inserted=inserted, updated=updated
+                    )
+                    if last is not None:
+                        await self._advance_watermarks(
+                            cur, schema, tablename, {series.area.code.value: last}
+                        )
+                    await cur.execute(self._staging_truncate)
+
+        return results
+
+
+class AsyncForecastMetadataRepository(_ForecastMetadataQueries, AsyncPostgresRepository):
+    """asyncio reader of the data availability in the ``data_watermarks`` table.
+
+    Falls back to the data tables on a database without the table, like
+    ``ForecastMetadataRepository``.
+    """
+
+    async def get_latest_common_timestamp(
+        self,
+        bidding_zone: BiddingZone | None = None,
+        area: WeatherArea | None = None,
+        schema: str = "public",
+    ) -> datetime | None:
+        """Latest load slot start for which load and every weather variable exist."""
+        operation = "metadata.latest_common_timestamp"
+        for build_query in (self._latest_common_query, self._latest_common_fallback_query):
+            try:
+                row = await self._fetchone(operation, *build_query(bidding_zone, area, schema))
+            except psycopg.errors.UndefinedTable:
+                continue
+            return row[0] if row else None
+        # A source table that was never written to has no timestamp.
+        return None
+
+    async def get_watermark(
+        self, source: str, key: str, schema: str = "public"
+    ) -> datetime | None:
+        """Latest timestamp written for ``key`` into the ``source`` table."""
+        for query, params in (
+            (self._watermark_select_query(schema), (source, key)),
+            (self._latest_in_table_query(schema, source), (key,)),
+        ):
+            try:
+                row = await self._fetchone("metadata.watermark", query, params)
+            except psycopg.errors.UndefinedTable:
+                continue
+            return row[0] if row else None
+        return None
+
+    async def get_watermark_version(
+        self, source: str, key: str, schema: str = "public"
+    ) -> Watermark | None:
+        """Watermark of ``key`` in ``source`` together with the time of the last write."""
+        try:
+            row = await self._fetchone(
+                "metadata.watermark", self._watermark_version_query(schema), (source, key)
+            )
+            return Watermark(*row) if row else None
+        except psycopg.errors.UndefinedTable:
+            pass
+        latest = await self.get_watermark(source, key, schema)
+        return Watermark(latest, None) if latest is not None else None
@@ -0,0 +1,108 @@
+"""Encoding and decoding of PostgreSQL binary COPY payloads with NumPy.
+
+Only fixed-width, non-nullable columns are supported. That keeps every tuple
+the same size, so a whole payload maps onto a single structured NumPy dtype
+and no Python object is created per row.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+PGCOPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+PGCOPY_HEADER = PGCOPY_SIGNATURE + np.array([0, 0], dtype=">i4").tobytes()
+PGCOPY_TRAILER = np.array([-1], dtype=">i2").tobytes()
+
+POSTGRES_EPOCH = np.datetime64("2000-01-01T00:00:00", "us")
+
+FIELD_DTYPES = {
+    "timestamptz": np.dtype(">i8"),
+    "float8": np.dtype(">f8"),
+    "int8": np.dtype(">i8"),
+    "int4": np.dtype(">i4"),
+}
+
+
+def _tuple_dtype(types: Sequence[str]) -> np.dtype:
+    fields: list[tuple[str, str | np.dtype]] = [("field_count", ">i2")]
+    for i, pg_type in enumerate(types):
+        try:
+            field_dtype = FIELD_DTYPES[pg_type]
+        except KeyError as exc:
+            raise ValueError(f"Unsupported binary COPY type: {pg_type}") from exc
+        fields.append((f"len_{i}", ">i4"))
+        fields.append((f"col_{i}", field_dtype))
+    return np.dtype(fields)
+
+
+def to_postgres_timestamps(values: np.ndarray) -> np.ndarray:
+    """Convert UTC datetime64 values to microseconds since the Postgres epoch."""
+    return (values.astype("datetime64[us]") - POSTGRES_EPOCH).astype(np.int64)
+
+
+def from_postgres_timestamps(values: np.ndarray) -> np.ndarray:
+    """Convert microseconds since the Postgres epoch to UTC datetime64[us]."""
+    return POSTGRES_EPOCH + values.astype(np.int64).astype("timedelta64[us]")
+
+
+def encode(columns: Sequence[tuple[str, np.ndarray]]) -> bytes:
+    """Encode equally long columns as a binary COPY payload.
+
+    Args:
+        columns: ``(postgres_type, values)`` pairs in table column order.
+            ``timestamptz`` columns take datetime64 values in UTC.
+
+    Returns:
+        bytes: Header, one tuple per row and trailer, ready for ``Copy.write``.
+    """
+    types = [pg_type for pg_type, _ in columns]
+    lengths = {len(values) for _, values in columns}
+    if len(lengths) > 1:
+        raise ValueError("all columns must have the same length")
+
+    dtype = _tuple_dtype(types)
+    rows = np.empty(lengths.pop() if lengths else 0, dtype=dtype)
+    rows["field_count"] = len(columns)
+    for i, (pg_type, values) in enumerate(columns):
+        rows[f"len_{i}"] = FIELD_DTYPES[pg_type].itemsize
+        if pg_type == "timestamptz":
+            values = to_postgres_timestamps(np.asarray(values))
+        rows[f"col_{i}"] = values
+
+    return PGCOPY_HEADER + rows.tobytes() + PGCOPY_TRAILER
+
+
+def decode(payload: bytes | memoryview, types: Sequence[str]) -> list[np.ndarray]:
+    """Decode a binary COPY payload produced by ``COPY ... TO STDOUT (FORMAT BINARY)``.
+
+    Args:
+        payload: The complete payload including header and trailer.
+        types: The Postgres type of every selected column.
+
+    Returns:
+        list[np.ndarray]: One array per column. ``timestamptz`` columns are
+        returned as datetime64[us] in UTC, all others in native byte order.
+    """
+    buffer = memoryview(payload)
+    if bytes(buffer[: len(PGCOPY_SIGNATURE)]) != PGCOPY_SIGNATURE:
+        raise ValueError("payload is not in PostgreSQL binary COPY format")
+
+    extension_length = int(
+        np.frombuffer(buffer, dtype=">i4", count=1, offset=len(PGCOPY_SIGNATURE) + 4)[0]
+    )
+    body_start = len(PGCOPY_HEADER) + extension_length
+    body = buffer[body_start : len(buffer) - len(PGCOPY_TRAILER)]
+
+    dtype = _tuple_dtype(types)
+    if len(body) % dtype.itemsize:
+        raise ValueError("binary COPY payload contains NULLs or variable-width fields")
+
+    rows = np.frombuffer(body, dtype=dtype)
+    columns = []
+    for i, pg_type in enumerate(types):
+        values = rows[f"col_{i}"]
+        if pg_type == "timestamptz":
+            columns.append(from_postgres_timestamps(values))
+        else:
+            columns.append(values.astype(values.dtype.newbyteorder("=")))
+    return columns
@@ -0,0 +1,551 @@
+"""In-process LRU cache in front of the load and weather repositories.
+
+``QueryCache`` holds read results keyed by method, table, zone or area,
+variables and the interval aligned to whole slots. A request is widened to
+its aligned interval, read once and trimmed back, so windows that differ by
+less than a slot share one entry.
+
+Entries of closed intervals, ending before the data edge, live for
+``closed_ttl``. Open intervals still receive rows from the daily imports and
+expire after the much shorter ``open_ttl``. The ``add`` methods of the
+wrappers invalidate every entry of the written table and key overlapping the
+written range. Writes by other processes, e.g. the CLI importers, are only
+picked up when the entries expire.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+from probabilistic_load_forecast.adapters.utils import datetime_bounds
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    Era5ArraySeries,
+    Era5Frame,
+    Era5Series,
+    InstantWeatherValue,
+    LoadArraySeries,
+    LoadSeries,
+    RESOLUTION_LENGTH,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+# Key granularity, the cached reads are trimmed with the slot length they report.
+LOAD_ALIGNMENT = timedelta(minutes=15)
+WEATHER_ALIGNMENT = timedelta(hours=1)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MISSING = object()
+
+
+class CacheKey(NamedTuple):
+    method: str
+    schema: str
+    tables: tuple[str, ...]
+    key: str
+    start: datetime
+    end: datetime
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    """Snapshot of the counters of a ``QueryCache``."""
+
+    max_entries: int
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+
+def align_interval(start: datetime, end: datetime, step: timedelta) -> tuple[datetime, datetime]:
+    """Widen ``[start, end)`` to whole multiples of ``step`` since the Unix epoch."""
+    return (
+        start - (start - _EPOCH) % step,
+        end + (_EPOCH - end) % step,
+    )
+
+
+class QueryCache:
+    """Size bounded LRU cache with separate TTLs for closed and open intervals.
+
+    Args:
+        max_entries: Least recently used entries are evicted beyond this size.
+        closed_ttl: Lifetime of entries ending before ``now - open_window``.
+        open_ttl: Lifetime of entries reaching into the open window.
+        open_window: How far back from now imports still add or correct
+            rows. ERA5 is published with a delay of about five days.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        closed_ttl: timedelta = timedelta(hours=6),
+        open_ttl: timedelta = timedelta(minutes=1),
+        open_window: timedelta = timedelta(days=7),
+        clock: Callable[[], float] = time.monotonic,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.closed_ttl = closed_ttl
+        self.open_ttl = open_ttl
+        self.open_window = open_window
+        self._clock = clock
+        self._now = now
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def lookup(self, key: CacheKey) -> Any:
+        """Cached value of ``key`` or ``_MISSING``, counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return _MISSING
+
+    def store(self, key: CacheKey, value: Any) -> None:
+        closed = key.end <= self._now() - self.open_window
+        ttl = self.closed_ttl if closed else self.open_ttl
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl.total_seconds(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(
+        self,
+        table: str,
+        key: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> int:
+        """Drop the entries of ``table`` and ``key`` overlapping ``[start, end]``.
+
+        Without bounds every entry of the table and key is dropped. Returns
+        the number of dropped entries.
+        """
+        with self._lock:
+            stale = [
+                cache_key
+                for cache_key in self._entries
+                if table in cache_key.tables
+                and cache_key.key == key
+                and (start is None or cache_key.end >= start)
+                and (end is None or cache_key.start <= end)
+            ]
+            for cache_key in stale:
+                del self._entries[cache_key]
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                max_entries=self.max_entries,
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+
+def _trim_load_series(series: LoadSeries, start: datetime, end: datetime) -> LoadSeries:
+    return replace(
+        series,
+        observations=tuple(
+            m for m in series.observations if m.interval.end > start and m.interval.start < end
+        ),
+    )
+
+
+def _trim_load_arrays(
+    series: LoadArraySeries, start: datetime, end: datetime
+) -> LoadArraySeries:
+    start64 = np.datetime64(start.astimezone(timezone.utc).replace(tzinfo=None), "us")
+    end64 = np.datetime64(end.astimezone(timezone.utc).replace(tzinfo=None), "us")
+    slot = np.timedelta64(RESOLUTION_LENGTH[series.resolution])
+    mask = (series.start_ts + slot > start64) & (series.start_ts < end64)
+    return replace(series, start_ts=series.start_ts[mask], load_mw=series.load_mw[mask])
+
+
+def _trim_era5_series(series: Era5Series, interval: TimeInterval) -> Era5Series:
+    """Instant values are valid at [start, end), interval values end in (start, end]."""
+    return replace(
+        series,
+        observations=tuple(
+            o
+            for o in series.observations
+            if (
+                interval.start <= o.valid_at < interval.end
+                if isinstance(o, InstantWeatherValue)
+                else interval.start < o.interval.end <= interval.end
+            )
+        ),
+    )
+
+
+def _load_span(
+    load_series: LoadSeries | LoadArraySeries,
+) -> dict[str, tuple[datetime, datetime]]:
+    """First slot start and last slot end per zone of a written series."""
+    if isinstance(load_series, LoadArraySeries):
+        if not len(load_series):
+            return {}
+        first, last = datetime_bounds(load_series.start_ts)
+        return {
+            load_series.bidding_zone.eic_code: (
+                first,
+                last + RESOLUTION_LENGTH[load_series.resolution],
+            )
+        }
+    spans: dict[str, tuple[datetime, datetime]] = {}
+    for m in load_series.observations:
+        zone_code = m.bidding_zone.eic_code
+        first, last = spans.get(zone_code, (m.interval.start, m.interval.end))
+        spans[zone_code] = (min(first, m.interval.start), max(last, m.interval.end))
+    return spans
+
+
+def _era5_span(weather_series: Era5Series) -> tuple[datetime, datetime] | None:
+    times = [
+        o.valid_at if isinstance(o, InstantWeatherValue) else o.interval.end
+        for o in weather_series.observations
+    ]
+    if not times:
+        return None
+    return min(times), max(times)
+
+
+class _CachedLoadRepository:
+    """Key building shared by the blocking and the asyncio load cache wrapper."""
+
+    def __init__(self, repo, cache: QueryCache | None = None):
+        self.repo = repo
+        self.cache = cache or QueryCache()
+
+    def __getattr__(self, name: str):
+        return getattr(self.repo, name)
+
+    def _key(
+        self,
+        method: str,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str,
+        tablename: str,
+    ) -> CacheKey:
+        aligned_start, aligned_end = align_interval(start, end, LOAD_ALIGNMENT)
+        return CacheKey(
+            method, schema, (tablename,), bidding_zone.eic_code, aligned_start, aligned_end
+        )
+
+    def _invalidate(self, load_series: LoadSeries | LoadArraySeries, tablename: str) -> None:
+        for zone_code, (first, last) in _load_span(load_series).items():
+            self.cache.invalidate(tablename, zone_code, first, last)
+
+
+class CachedEntsoeRepository(_CachedLoadRepository):
+    """``EntsoePostgreRepository`` with cached ``get`` and ``get_arrays``.
+
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def get(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadSeries:
+        key = self._key("get", start, end, bidding_zone, schema, tablename)
+        series = self.cache.lookup(key)
+        if series is _MISSING:
+            series = self.repo.get(key.start, key.end, bidding_zone, schema, tablename)
+            self.cache.store(key, series)
+        return _trim_load_series(series, start, end)
+
+    def get_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArraySeries:
+        key = self._key("get_arrays", start, end, bidding_zone, schema, tablename)
+        series = self.cache.lookup(key)
+        if series is _MISSING:
+            series = self.repo.get_arrays(key.start, key.end, bidding_zone, schema, tablename)
+            self.cache.store(key, series)
+        return _trim_load_arrays(series, start, end)
+
+    def add(
+        self,
+        load_series: LoadSeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> None:
+        self.repo.add(load_series, schema, tablename)
+        self._invalidate(load_series, tablename)
+
+    def add_bulk(
+        self,
+        load_series: LoadSeries | LoadArraySeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ):
+        result = self.repo.add_bulk(load_series, schema, tablename)
+        self._invalidate(load_series, tablename)
+        return result
+
+
+class AsyncCachedEntsoeRepository(_CachedLoadRepository):
+    """``AsyncEntsoePostgreRepository`` with cached ``get`` and ``get_arrays``."""
+
+    async def get(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadSeries:
+        key = self._key("get", start, end, bidding_zone, schema, tablename)
+        series = self.cache.lookup(key)
+        if series is _MISSING:
+            series = await self.repo.get(key.start, key.end, bidding_zone, schema, tablename)
+            self.cache.store(key, series)
+        return _trim_load_series(series, start, end)
+
+    async def get_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArraySeries:
+        key = self._key("get_arrays", start, end, bidding_zone, schema, tablename)
+        series = self.cache.lookup(key)
+        if series is _MISSING:
+            series = await self.repo.get_arrays(
+                key.start, key.end, bidding_zone, schema, tablename
+            )
+            self.cache.store(key, series)
+        return _trim_load_arrays(series, start, end)
+
+    async def add(
+        self,
+        load_series: LoadSeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> None:
+        await self.repo.add(load_series, schema, tablename)
+        self._invalidate(load_series, tablename)
+
+    async def add_bulk(
+        self,
+        load_series: LoadSeries | LoadArraySeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ):
+        result = await self.repo.add_bulk(load_series, schema, tablename)
+        self._invalidate(load_series, tablename)
+        return result
+
+
+class _CachedEra5Repository:
+    """Key building shared by the blocking and the asyncio weather cache wrapper."""
+
+    def __init__(self, repo, cache: QueryCache | None = None):
+        self.repo = repo
+        self.cache = cache or QueryCache()
+
+    def __getattr__(self, name: str):
+        return getattr(self.repo, name)
+
+    def _series_key(
+        self, interval: TimeInterval, area: WeatherArea, variable: WeatherVariable, schema: str
+    ) -> CacheKey:
+        start, end = align_interval(interval.start, interval.end, WEATHER_ALIGNMENT)
+        return CacheKey(
+            "get", schema, (f"{variable}_country_avg",), area.code.value, start, end
+        )
+
+    def _frame_key(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: list[WeatherVariable],
+        schema: str,
+    ) -> CacheKey:
+        # Frames mix period starts of instant and interval-end variables and
+        # cannot be trimmed, so they are keyed by the exact interval.
+        return CacheKey(
+            "get_frame",
+            schema,
+            tuple(f"{variable}_country_avg" for variable in variables),
+            area.code.value,
+            interval.start,
+            interval.end,
+        )
+
+    def _invalidate_series(self, weather_series: Era5Series) -> None:
+        span = _era5_span(weather_series)
+        if span is not None:
+            self.cache.invalidate(
+                f"{weather_series.variable}_country_avg",
+                weather_series.area.code.value,
+                *span,
+            )
+
+    def _tracked(
+        self, weather_series: Iterable[Era5ArraySeries], written: list[Era5ArraySeries]
+    ) -> Iterator[Era5ArraySeries]:
+        # add_arrays accepts generators, remember what passes through.
+        for series in weather_series:
+            written.append(series)
+            yield series
+
+    def _invalidate_arrays(self, written: list[Era5ArraySeries]) -> None:
+        for series in written:
+            if len(series):
+                self.cache.invalidate(
+                    f"{series.variable}_country_avg",
+                    series.area.code.value,
+                    *datetime_bounds(series.valid_time),
+                )
+
+
+class CachedEra5Repository(_CachedEra5Repository):
+    """``Era5PostgreRepository`` with cached ``get`` and ``get_frame``.
+
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def get(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        schema: str = "public",
+    ) -> Era5Series:
+        key = self._series_key(interval, area, variable, schema)
+        series = self.cache.lookup(key)
+        if series is _MISSING:
+            series = self.repo.get(TimeInterval(key.start, key.end), area, variable, schema)
+            self.cache.store(key, series)
+        return _trim_era5_series(series, interval)
+
+    def get_frame(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: Iterable[WeatherVariable],
+        schema: str = "public",
+    ) -> Era5Frame:
+        variables = list(dict.fromkeys(variables))
+        key = self._frame_key(interval, area, variables, schema)
+        frame = self.cache.lookup(key)
+        if frame is _MISSING:
+            frame = self.repo.get_frame(interval, area, variables, schema)
+            self.cache.store(key, frame)
+        return frame
+
+    def add(self, weather_series: Era5Series, interval_seconds=None, schema: str = "public"):
+        result = self.repo.add(weather_series, interval_seconds, schema)
+        self._invalidate_series(weather_series)
+        return result
+
+    def add_arrays(
+        self, weather_series: Iterable[Era5ArraySeries], schema: str = "public"
+    ):
+        written: list[Era5ArraySeries] = []
+        try:
+            return self.repo.add_arrays(self._tracked(weather_series, written), schema)
+        finally:
+            self._invalidate_arrays(written)
+
+
+class AsyncCachedEra5Repository(_CachedEra5Repository):
+    """``AsyncEra5PostgreRepository`` with cached ``get`` and ``get_frame``."""
+
+    async def get(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        schema: str = "public",
+    ) -> Era5Series:
+        key = self._series_key(interval, area, variable, schema)
+        series = self.cache.lookup(key)
+        if series is _MISSING:
+            series = await self.repo.get(
+                TimeInterval(key.start, key.end), area, variable, schema
+            )
+            self.cache.store(key, series)
+        return _trim_era5_series(series, interval)
+
+    async def get_frame(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: Iterable[WeatherVariable],
+        schema: str = "public",
+    ) -> Era5Frame:
+        variables = list(dict.fromkeys(variables))
+        key = self._frame_key(interval, area, variables, schema)
+        frame = self.cache.lookup(key)
+        if frame is _MISSING:
+            frame = await self.repo.get_frame(interval, area, variables, schema)
+            self.cache.store(key, frame)
+        return frame
+
+    async def add(
+        self, weather_series: Era5Series, interval_seconds=None, schema: str = "public"
+    ) -> None:
+        await self.repo.add(weather_series, interval_seconds, schema)
+        self._invalidate_series(weather_series)
+
+    async def add_arrays(
+        self, weather_series: Iterable[Era5ArraySeries], schema: str = "public"
+    ):
+        written: list[Era5ArraySeries] = []
+        try:
+            return await self.repo.add_arrays(self._tracked(weather_series, written), schema)
+        finally:
+            self._invalidate_arrays(written)
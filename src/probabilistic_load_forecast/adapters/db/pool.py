@@ -0,0 +1,95 @@
+"""Connection pools shared by the PostgreSQL repositories."""
+
+from dataclasses import dataclass
+
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+from probabilistic_load_forecast.config import PoolSettings
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    """Snapshot of the counters reported by ``psycopg_pool``."""
+
+    min_size: int
+    max_size: int
+    size: int
+    available: int
+    in_use: int
+    requests_waiting: int
+    requests_total: int
+    requests_queued: int
+    requests_errors: int
+    requests_wait_ms: int
+    connections_errors: int
+    connections_lost: int
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """Average time a request waited for a connection."""
+        if not self.requests_queued:
+            return 0.0
+        return self.requests_wait_ms / self.requests_queued
+
+    @classmethod
+    def from_pool(cls, pool: ConnectionPool | AsyncConnectionPool) -> "PoolStatistics":
+        # psycopg_pool only reports counters that are non-zero.
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        available = stats.get("pool_available", 0)
+        return cls(
+            min_size=stats.get("pool_min", 0),
+            max_size=stats.get("pool_max", 0),
+            size=size,
+            available=available,
+            in_use=size - available,
+            requests_waiting=stats.get("requests_waiting", 0),
+            requests_total=stats.get("requests_num", 0),
+            requests_queued=stats.get("requests_queued", 0),
+            requests_errors=stats.get("requests_errors", 0),
+            requests_wait_ms=stats.get("requests_wait_ms", 0),
+            connections_errors=stats.get("connections_errors", 0),
+            connections_lost=stats.get("connections_lost", 0),
+        )
+
+
+def create_pool(
+    dsn: str, settings: PoolSettings = PoolSettings(), name: str = "plf"
+) -> ConnectionPool:
+    """Create and open a blocking connection pool.
+
+    The pool starts filling up in the background, the call does not wait for
+    ``min_size`` connections to be established.
+    """
+    return ConnectionPool(
+        dsn,
+        min_size=settings.min_size,
+        max_size=settings.max_size,
+        max_idle=settings.max_idle,
+        max_lifetime=settings.max_lifetime,
+        timeout=settings.timeout,
+        check=ConnectionPool.check_connection if settings.check else None,
+        name=name,
+        open=True,
+    )
+
+
+def create_async_pool(
+    dsn: str, settings: PoolSettings = PoolSettings(), name: str = "plf-async"
+) -> AsyncConnectionPool:
+    """Create an asyncio connection pool.
+
+    Async pools cannot be opened in the constructor, call ``await pool.open()``
+    from the running event loop before handing it to a repository.
+    """
+    return AsyncConnectionPool(
+        dsn,
+        min_size=settings.min_size,
+        max_size=settings.max_size,
+        max_idle=settings.max_idle,
+        max_lifetime=settings.max_lifetime,
+        timeout=settings.timeout,
+        check=AsyncConnectionPool.check_connection if settings.check else None,
+        name=name,
+        open=False,
+    )
@@ -0,0 +1,380 @@
+"""Range caches that only read the parts of a window not fetched before.
+
+Every key, a schema, table and zone or area, keeps the sorted arrays read so
+far and the disjoint segments of time they cover. A request subtracts the
+covered segments from its window, reads only the remaining gaps from the
+repository and stitches them into the stored arrays. Panning a window by a
+day then reads one day instead of the whole window.
+
+Coverage follows the predicates of the repository reads: a load segment
+``[start, end)`` holds every slot overlapping it, with the slot length of the
+read it came from, a weather segment holds the
+valid times in ``[start, end)`` for instant and in ``(start, end]`` for
+interval-end variables.
+
+Like ``QueryCache``, coverage reaching into the open window, where imports
+still add or correct rows, expires after ``open_ttl`` and is read again;
+whole keys expire after ``closed_ttl``. The ``add`` methods drop the written
+keys. Writes by other processes, e.g. the CLI importers, are only picked up
+when the coverage expires or ``invalidate_table`` drops it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Hashable, Iterable, Iterator
+
+import numpy as np
+
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    Era5ArraySeries,
+    Era5Frame,
+    Era5Series,
+    LoadArraySeries,
+    LoadSeries,
+    RESOLUTION_LENGTH,
+    Resolution,
+    TimeInterval,
+    VARIABLE_VALUE_KIND,
+    WeatherArea,
+    WeatherValueKind,
+    WeatherVariable,
+    slot_resolution,
+)
+
+# Values of a load key: the slot length of the read a row came from and the load.
+LOAD_VALUES = np.dtype([("slot", "timedelta64[us]"), ("load_mw", np.float64)])
+# Values of a weather key: the period start reported in frames and the value,
+# the stored timestamps are the valid times the read predicates compare.
+WEATHER_VALUES = np.dtype([("period_start", "datetime64[us]"), ("value", np.float64)])
+
+
+def _datetime64(value: datetime) -> np.datetime64:
+    return np.datetime64(value.astimezone(timezone.utc).replace(tzinfo=None), "us")
+
+
+def uncovered(
+    segments: list[tuple[datetime, datetime]], start: datetime, end: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Parts of ``[start, end)`` not covered by the sorted, disjoint ``segments``."""
+    gaps = []
+    cursor = start
+    for seg_start, seg_end in segments:
+        if seg_end <= cursor:
+            continue
+        if seg_start >= end:
+            break
+        if seg_start > cursor:
+            gaps.append((cursor, seg_start))
+        cursor = max(cursor, seg_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def cover(
+    segments: list[tuple[datetime, datetime]], start: datetime, end: datetime
+) -> list[tuple[datetime, datetime]]:
+    """``segments`` with ``[start, end)`` added, touching segments are merged."""
+    merged = []
+    for seg_start, seg_end in sorted(segments + [(start, end)]):
+        if merged and seg_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], seg_end))
+        else:
+            merged.append((seg_start, seg_end))
+    return merged
+
+
+def clip(
+    segments: list[tuple[datetime, datetime]], edge: datetime
+) -> list[tuple[datetime, datetime]]:
+    """The parts of ``segments`` before ``edge``."""
+    return [(seg_start, min(seg_end, edge)) for seg_start, seg_end in segments if seg_start < edge]
+
+
+@dataclass
+class _CoveredArrays:
+    expires_at: float
+    values_dtype: np.dtype = np.dtype(np.float64)
+    segments: list[tuple[datetime, datetime]] = field(default_factory=list)
+    # Monotonic time at which the coverage of the open window expires.
+    open_expires_at: float | None = None
+    timestamps: np.ndarray = field(
+        default_factory=lambda: np.array([], dtype="datetime64[us]")
+    )
+    values: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        if self.values is None:
+            self.values = np.array([], dtype=self.values_dtype)
+
+    def stitch(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """Merge fetched arrays, later reads win for equal timestamps."""
+        all_timestamps = np.concatenate([timestamps.astype("datetime64[us]"), self.timestamps])
+        all_values = np.concatenate([values, self.values])
+        # np.unique keeps the first occurrence, the fetched arrays come first.
+        self.timestamps, first = np.unique(all_timestamps, return_index=True)
+        self.values = all_values[first]
+
+    def forget_after(self, edge: datetime) -> None:
+        """Drop the coverage after ``edge``, it is read again on the next request."""
+        self.segments = clip(self.segments, edge)
+        # Rows at the edge may still belong to the coverage before it.
+        keep = self.timestamps <= _datetime64(edge)
+        self.timestamps = self.timestamps[keep]
+        self.values = self.values[keep]
+        self.open_expires_at = None
+
+
+class _RangeCache:
+    """Segment bookkeeping shared by the load and the weather range cache.
+
+    Args:
+        max_keys: Least recently used keys are dropped beyond this number.
+        closed_ttl: Lifetime of a key, after it every segment is read again.
+        open_ttl: Lifetime of the coverage after ``now - open_window``.
+        open_window: How far back from now imports still add or correct rows.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 32,
+        closed_ttl: timedelta = timedelta(hours=6),
+        open_ttl: timedelta = timedelta(minutes=1),
+        open_window: timedelta = timedelta(days=7),
+        clock: Callable[[], float] = time.monotonic,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self.max_keys = max_keys
+        self.closed_ttl = closed_ttl
+        self.open_ttl = open_ttl
+        self.open_window = open_window
+        self._clock = clock
+        self._now = now
+        self._keys: OrderedDict[Hashable, _CoveredArrays] = OrderedDict()
+        self._lock = threading.Lock()
+        self.fetched_ranges = 0
+        self.fetched_rows = 0
+
+    def _gaps(
+        self,
+        key: Hashable,
+        start: datetime,
+        end: datetime,
+        values_dtype: np.dtype = np.dtype(np.float64),
+    ) -> tuple[_CoveredArrays, list[tuple[datetime, datetime]]]:
+        """Entry of ``key`` and the parts of ``[start, end)`` it does not cover."""
+        with self._lock:
+            now = self._clock()
+            entry = self._keys.get(key)
+            if entry is None or entry.expires_at <= now:
+                entry = _CoveredArrays(
+                    expires_at=now + self.closed_ttl.total_seconds(), values_dtype=values_dtype
+                )
+                self._keys[key] = entry
+            elif entry.open_expires_at is not None and entry.open_expires_at <= now:
+                entry.forget_after(self._now() - self.open_window)
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+            return entry, uncovered(entry.segments, start, end)
+
+    def _fill(
+        self,
+        entry: _CoveredArrays,
+        gap_start: datetime,
+        gap_end: datetime,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        with self._lock:
+            entry.stitch(timestamps, values)
+            entry.segments = cover(entry.segments, gap_start, gap_end)
+            if gap_end > self._now() - self.open_window:
+                # The oldest open read decides when the open window is read again.
+                expires_at = self._clock() + self.open_ttl.total_seconds()
+                if entry.open_expires_at is None or expires_at < entry.open_expires_at:
+                    entry.open_expires_at = expires_at
+            self.fetched_ranges += 1
+            self.fetched_rows += len(timestamps)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Forget the arrays of ``key``, or of every key."""
+        with self._lock:
+            if key is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(key, None)
+
+    def invalidate_table(self, table: str, key: str) -> None:
+        """Forget the arrays of ``key`` in ``table`` in every schema."""
+        with self._lock:
+            for cache_key in [k for k in self._keys if k[1:] == (table, key)]:
+                del self._keys[cache_key]
+
+    def __getattr__(self, name: str):
+        return getattr(self.repo, name)
+
+
+class AsyncLoadRangeCache(_RangeCache):
+    """``AsyncEntsoePostgreRepository`` whose ``get_arrays`` only reads uncovered parts.
+
+    Every other method is passed on to ``repo``.
+    """
+
+    def __init__(self, repo, max_keys: int = 32, **ttls):
+        super().__init__(max_keys, **ttls)
+        self.repo = repo
+
+    async def get_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArraySeries:
+        """Load slots overlapping ``[start, end)``, reading only uncovered parts."""
+        entry, gaps = self._gaps(
+            (schema, tablename, bidding_zone.eic_code), start, end, LOAD_VALUES
+        )
+        for gap_start, gap_end in gaps:
+            series = await self.repo.get_arrays(
+                gap_start, gap_end, bidding_zone, schema, tablename
+            )
+            values = np.empty(len(series), dtype=LOAD_VALUES)
+            values["slot"] = RESOLUTION_LENGTH[series.resolution]
+            values["load_mw"] = series.load_mw
+            self._fill(entry, gap_start, gap_end, series.start_ts, values)
+
+        timestamps, values = entry.timestamps, entry.values
+        mask = (timestamps + values["slot"] > _datetime64(start)) & (
+            timestamps < _datetime64(end)
+        )
+        selected = values[mask]
+        return LoadArraySeries(
+            bidding_zone=bidding_zone,
+            resolution=slot_resolution(selected["slot"] / np.timedelta64(1, "s")),
+            start_ts=timestamps[mask],
+            load_mw=np.ascontiguousarray(selected["load_mw"]),
+        )
+
+    async def add(
+        self,
+        load_series: LoadSeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> None:
+        await self.repo.add(load_series, schema, tablename)
+        self._invalidate_zones(load_series, schema, tablename)
+
+    async def add_bulk(
+        self,
+        load_series: LoadSeries | LoadArraySeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ):
+        result = await self.repo.add_bulk(load_series, schema, tablename)
+        self._invalidate_zones(load_series, schema, tablename)
+        return result
+
+    def _invalidate_zones(
+        self, load_series: LoadSeries | LoadArraySeries, schema: str, tablename: str
+    ) -> None:
+        if isinstance(load_series, LoadArraySeries):
+            zone_codes = {load_series.bidding_zone.eic_code}
+        else:
+            zone_codes = {m.bidding_zone.eic_code for m in load_series.observations}
+        for zone_code in zone_codes:
+            self.invalidate((schema, tablename, zone_code))
+
+
+class AsyncWeatherRangeCache(_RangeCache):
+    """``AsyncEra5PostgreRepository`` whose single-variable ``get_frame`` only reads
+    uncovered parts.
+
+    The gaps are read with ``get_arrays``, which returns the valid times the
+    coverage is kept in. Interval-end values start one slot of the series
+    resolution before their valid time. Frames of several variables and
+    every other method are passed on to ``repo``.
+    """
+
+    def __init__(self, repo, max_keys: int = 32, **ttls):
+        super().__init__(max_keys, **ttls)
+        self.repo = repo
+
+    async def get_frame(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: Iterable[WeatherVariable],
+        schema: str = "public",
+    ) -> Era5Frame:
+        variables = list(dict.fromkeys(variables))
+        if len(variables) != 1:
+            return await self.repo.get_frame(interval, area, variables, schema)
+        [variable] = variables
+
+        entry, gaps = self._gaps(
+            (schema, f"{variable}_country_avg", area.code.value),
+            interval.start,
+            interval.end,
+            WEATHER_VALUES,
+        )
+        interval_end = VARIABLE_VALUE_KIND[variable] is not WeatherValueKind.INSTANT
+        for gap_start, gap_end in gaps:
+            series = await self.repo.get_arrays(
+                TimeInterval(gap_start, gap_end), area, variable, schema
+            )
+            values = np.empty(len(series), dtype=WEATHER_VALUES)
+            values["period_start"] = series.valid_time
+            if interval_end:
+                values["period_start"] -= np.timedelta64(RESOLUTION_LENGTH[series.resolution])
+            values["value"] = series.value
+            self._fill(entry, gap_start, gap_end, series.valid_time, values)
+
+        timestamps, values = entry.timestamps, entry.values
+        start, end = _datetime64(interval.start), _datetime64(interval.end)
+        if VARIABLE_VALUE_KIND[variable] is WeatherValueKind.INSTANT:
+            mask = (timestamps >= start) & (timestamps < end)
+        else:
+            mask = (timestamps > start) & (timestamps <= end)
+        selected = values[mask]
+        # Frames are ordered by period start, like the repository's frame query.
+        selected = selected[np.argsort(selected["period_start"], kind="stable")]
+        return Era5Frame(
+            area=area,
+            resolution=Resolution.PT1H,
+            timestamps=np.ascontiguousarray(selected["period_start"]),
+            values={variable: np.ascontiguousarray(selected["value"])},
+        )
+
+    async def add(
+        self, weather_series: Era5Series, interval_seconds=None, schema: str = "public"
+    ) -> None:
+        await self.repo.add(weather_series, interval_seconds, schema)
+        self.invalidate(
+            (schema, f"{weather_series.variable}_country_avg", weather_series.area.code.value)
+        )
+
+    async def add_arrays(
+        self, weather_series: Iterable[Era5ArraySeries], schema: str = "public"
+    ):
+        written: list[Hashable] = []
+
+        def tracked() -> Iterator[Era5ArraySeries]:
+            # add_arrays accepts generators, remember what passes through.
+            for series in weather_series:
+                written.append((schema, f"{series.variable}_country_avg", series.area.code.value))
+                yield series
+
+        try:
+            return await self.repo.add_arrays(tracked(), schema)
+        finally:
+            for key in written:
+                self.invalidate(key)
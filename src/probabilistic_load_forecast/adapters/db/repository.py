@@ -1,15 +1,23 @@
 """PostgreSQL repository implementations for Entsoe and Era5 data."""
 
-from typing import List
-from datetime import timedelta
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, NamedTuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta, timezone
+import numpy as np
 import psycopg
 import pandas as pd
 from psycopg import sql
+from psycopg_pool import ConnectionPool
 from datetime import datetime
 
 from probabilistic_load_forecast.domain.model import (
     LoadSeries,
+    LoadArraySeries,
+    LoadArrayBatch,
     LoadMeasurement,
+    ResampledSeries,
     BiddingZone,
     TimeInterval,
     Resolution,
@@ -17,65 +25,336 @@ from probabilistic_load_forecast.domain.model import (
     WeatherVariable,
     IntervalStatistic,
     Era5Series,
+    Era5ArraySeries,
+    Era5Frame,
     InstantWeatherValue,
     IntervalWeatherValue,
     CountryCode,
     VARIABLE_VALUE_KIND,
+    RESOLUTION_LENGTH,
     WeatherValueKind,
 )
 
-from probabilistic_load_forecast.domain.model import resolve_bidding_zone
+from probabilistic_load_forecast.domain.model import (
+    parse_aggregate,
+    resolve_bidding_zone,
+    slot_resolution,
+)
+from probabilistic_load_forecast.adapters.utils import datetime_bounds
+from probabilistic_load_forecast.adapters.db import binary_copy
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+
+# Longest measurement slot stored in the load table, see ``_select_params``.
+MAX_SLOT_LENGTH = timedelta(days=1)
+
+
+# date_bin origin of resampled reads, a Monday so weekly buckets start on Mondays.
+BUCKET_ORIGIN = datetime(2000, 1, 3, tzinfo=timezone.utc)
+
+# Aggregates a load roll-up can answer, quantiles need the slots themselves.
+ROLLUP_AGGREGATES = {
+    "mean": "sum(load_sum) / sum(slot_count)",
+    "min": "min(load_min)",
+    "max": "max(load_max)",
+    "sum": "sum(load_sum)",
+}
+
+
+@dataclass(frozen=True)
+class UpsertResult:
+    """Row counts reported by a bulk upsert.
+
+    ``unchanged`` counts the rows that already held the written value and
+    were left untouched, only load upserts report it.
+    """
+
+    inserted: int
+    updated: int
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+
+def _aggregate_columns(aggregates: Iterable[str], column: str) -> sql.Composed:
+    """``count(*)`` followed by one float8 aggregate of ``column`` per name.
+
+    Quantiles such as ``q90`` become ``percentile_cont(0.9)``, which
+    interpolates between the two closest values like pandas does.
+    """
+    value = sql.Identifier(column)
+    columns = [sql.SQL("count(*)")]
+    for name in aggregates:
+        aggregate = parse_aggregate(name)
+        if isinstance(aggregate, float):
+            columns.append(
+                sql.SQL("percentile_cont({}) WITHIN GROUP (ORDER BY {})").format(
+                    sql.Literal(aggregate), value
+                )
+            )
+        else:
+            function = "avg" if aggregate == "mean" else aggregate
+            columns.append(sql.SQL("{}({})::float8").format(sql.SQL(function), value))
+    return sql.SQL(", ").join(columns)
+
+
+def _bucket_stride(resolution: Resolution) -> timedelta:
+    return RESOLUTION_LENGTH[resolution]
+
+
+def _rows_to_resampled(
+    rows, resolution: Resolution, aggregates: list[str]
+) -> ResampledSeries:
+    table = np.array(
+        [tuple(row) for row in rows],
+        dtype=[("bucket", "datetime64[us]"), ("count", "i8")]
+        + [(f"agg{i}", "f8") for i in range(len(aggregates))],
+    )
+    return ResampledSeries(
+        resolution=resolution,
+        timestamps=table["bucket"],
+        # NULL aggregates, e.g. the sum of no values, are read as NaN.
+        values={name: table[f"agg{i}"] for i, name in enumerate(aggregates)},
+        counts=table["count"],
+    )
+
+
+class Watermark(NamedTuple):
+    """Latest timestamp of a source and key and the time of the last write to it.
+
+    ``updated_at`` also moves when a write rewrites older rows only, e.g. a
+    bulk re-import, and is ``None`` when read without the watermark table.
+    """
+
+    latest_ts: datetime
+    updated_at: datetime | None
+
+
+def _watermark_query(schema: str) -> sql.Composed:
+    """Upsert moving a watermark forward, never back, and stamping every write."""
+    return sql.SQL(
+        """
+        INSERT INTO {table} AS w (source, key, latest_ts) VALUES (%s, %s, %s)
+        ON CONFLICT (source, key) DO UPDATE SET
+            latest_ts = GREATEST(w.latest_ts, EXCLUDED.latest_ts),
+            updated_at = now()
+        """
+    ).format(table=sql.Identifier(schema, db_schema.WATERMARK_TABLE))
+
 
+def _watermark_rows(source: str, latest: dict[str, datetime]) -> list[tuple]:
+    # Sorted keys keep the row lock order stable between concurrent writers.
+    return [(source, key, latest_ts) for key, latest_ts in sorted(latest.items())]
 
-class EntsoePostgreRepository:
-    """PostgreSQL repository for actual load data from ENTSO-E."""
 
-    def __init__(self, dsn: str):
+class PostgresRepository:
+    """Base class handing out connections from a shared pool or a plain DSN.
+
+    Passing a ``pool`` avoids the TCP and authentication handshake on every
+    call, without one each call opens its own connection to ``dsn``.
+    """
+
+    def __init__(self, dsn: str | None = None, pool: ConnectionPool | None = None):
+        if dsn is None and pool is None:
+            raise ValueError("Either a dsn or a connection pool is required")
         self.dsn = dsn
+        self.pool = pool
+        self._known_tables: dict[tuple[str, str], bool] = {}
+        self._watermark_schemas: set[str] = set()
+
+    @contextmanager
+    def _connect(self) -> Iterator[psycopg.Connection]:
+        """Yield a connection whose transaction is committed when the block exits."""
+        if self.pool is not None:
+            with self.pool.connection() as con:
+                yield con
+        else:
+            with psycopg.connect(self.dsn) as con:
+                yield con
+
+    def _ensure_table(
+        self, tablename: str, cur: psycopg.Cursor, schema: str = "public"
+    ) -> bool:
+        """Create the table once per repository instance instead of on every write.
+
+        Returns whether the table is partitioned.
+        """
+        if (schema, tablename) not in self._known_tables:
+            self._create_table(tablename, cur, schema)
+            self._known_tables[(schema, tablename)] = db_schema.is_partitioned(
+                cur, schema, tablename
+            )
+        return self._known_tables[(schema, tablename)]
 
     def _create_table(
         self, tablename: str, cur: psycopg.Cursor, schema: str = "public"
     ):
-        cur.execute(
-            sql.SQL(
-                """
-                CREATE TABLE IF NOT EXISTS {} (
-                start_ts timestamptz NOT NULL,
-                end_ts timestamptz NOT NULL,
-                load_mw numeric(10, 2) NOT NULL,
-                created_at timestamp DEFAULT now() NULL,
-                zone_code varchar(30) DEFAULT '10YAT-APG------L'::character varying NULL,
-                CONSTRAINT unique_load_measurement_slot UNIQUE (start_ts, end_ts, zone_code)
-            );
+        for statement in self._table_ddl(schema, tablename):
+            cur.execute(statement)
+
+    def _advance_watermarks(
+        self,
+        cur: psycopg.Cursor,
+        schema: str,
+        source: str,
+        latest: dict[str, datetime],
+    ) -> None:
+        """Move the watermarks of ``source`` forward to the latest written timestamps.
+
+        Args:
+            latest: Latest timestamp written per zone or country code.
+        """
+        if not latest:
+            return
+        if schema not in self._watermark_schemas:
+            cur.execute(db_schema.watermark_table_ddl(schema))
+            self._watermark_schemas.add(schema)
+
+        cur.executemany(_watermark_query(schema), _watermark_rows(source, latest))
+
+    def _prepare_write(
+        self,
+        cur: psycopg.Cursor,
+        schema: str,
+        tablename: str,
+        first: datetime | None,
+        last: datetime | None,
+    ) -> None:
+        """Create the table and, if it is partitioned, the partitions covering [first, last]."""
+        if not self._ensure_table(tablename, cur, schema) or first is None:
+            return
+        for statement in self._partition_ddl(schema, tablename, first, last):
+            cur.execute(statement)
+
+
+class _TableQueries(ABC):
+    """Query mixin of a repository that creates the tables it writes to.
+
+    ``_ensure_table`` of the blocking and the asyncio base class runs the
+    statements of ``_table_ddl`` once per table, ``_prepare_write`` those of
+    ``_partition_ddl`` before every write into a partitioned table.
+    """
+
+    @abstractmethod
+    def _table_ddl(self, schema: str, tablename: str) -> list[sql.Composed]:
+        """Statements creating ``tablename`` and what belongs to it, if missing."""
+
+    @abstractmethod
+    def _partition_ddl(
+        self, schema: str, tablename: str, first: datetime, last: datetime
+    ) -> list[sql.Composed]:
+        """Statements creating the partitions covering [first, last], if missing."""
+
+
+class _EntsoeQueries(_TableQueries):
+    """SQL and row mapping shared by the blocking and the asyncio load repository."""
+
+    partitioned: bool
+
+    # Columns of the columnar streaming reads, see ``_rows_to_arrays``.
+    _stream_columns = sql.SQL(
+        "start_ts AT TIME ZONE 'UTC', extract(epoch FROM end_ts - start_ts)::int4, load_mw::float8"
+    )
+
+    def _table_ddl(self, schema: str, tablename: str) -> list[sql.Composed]:
+        # The roll-ups are left to migration 0005, which backfills them.
+        return db_schema.load_table_ddl(schema, tablename, self.partitioned)
+
+    def _partition_ddl(
+        self, schema: str, tablename: str, first: datetime, last: datetime
+    ) -> list[sql.Composed]:
+        return db_schema.monthly_partitions_ddl(schema, tablename, first, last)
+
+    def _write_bounds(
+        self, load_series: LoadSeries | LoadArraySeries
+    ) -> tuple[datetime | None, datetime | None]:
+        """First and last written slot start, the partitions have to cover both."""
+        written = self._written_starts(load_series).values()
+        if not written:
+            return None, None
+        return min(first for first, _ in written), max(last for _, last in written)
+
+    def _select_query(
+        self, schema: str, tablename: str, columns: sql.Composable | None = None
+    ) -> sql.Composed:
+        """Range read of one zone, the parameters come from ``_select_params``."""
+        if columns is None:
+            columns = sql.SQL("start_ts, end_ts, load_mw, zone_code")
+        return sql.SQL(
+            """
+            SELECT {}
+            FROM {}
+            WHERE zone_code = %(zone_code)s
+            AND start_ts < %(end)s
+            AND start_ts > %(earliest_start)s
+            AND end_ts > %(start)s
+            ORDER BY start_ts;
             """
-            ).format(sql.Identifier(schema, tablename))
+        ).format(columns, sql.Identifier(schema, tablename))
+
+    def _select_params(
+        self, bidding_zone: BiddingZone, start: datetime, end: datetime
+    ) -> dict:
+        # A slot overlapping [start, end) begins at most one slot length before
+        # start. Bounding start_ts on both sides keeps the index scan narrow and
+        # lets the planner prune monthly partitions.
+        return {
+            "zone_code": bidding_zone.eic_code,
+            "start": start,
+            "end": end,
+            "earliest_start": start - MAX_SLOT_LENGTH,
+        }
+
+    def _latest_start_query(self, schema: str, tablename: str) -> sql.Composed:
+        """Latest slot start of one zone, one probe of the ``(zone_code, start_ts)`` index."""
+        return sql.SQL("SELECT max(start_ts) FROM {} WHERE zone_code = %s").format(
+            sql.Identifier(schema, tablename)
         )
 
-    def get(
+    def _copy_query(
         self,
+        schema: str,
+        tablename: str,
+        bidding_zone: BiddingZone,
         start: datetime,
         end: datetime,
-        bidding_zone: BiddingZone,
-        schema: str = "public",
-        tablename: str = "actual_total_load",
-    ) -> LoadSeries:
-        """Retrieve actual load data between start and end timestamps."""
-        query = sql.SQL(
+    ) -> sql.Composed:
+        """Binary ``COPY ... TO STDOUT`` of the slot starts, lengths and loads of a range read."""
+        # COPY does not accept bind parameters, the values are passed as literals.
+        return sql.SQL(
             """
-            SELECT start_ts, end_ts, load_mw, zone_code
-            FROM {}
-            WHERE zone_code = %s
-            AND start_ts < %s
-            AND end_ts > %s
-            ORDER BY start_ts;
+            COPY (
+                SELECT start_ts, extract(epoch FROM end_ts - start_ts)::int4, load_mw::float8
+                FROM {}
+                WHERE zone_code = {zone_code}
+                AND start_ts < {end}
+                AND start_ts > {earliest_start}
+                AND end_ts > {start}
+                ORDER BY start_ts
+            ) TO STDOUT (FORMAT BINARY)
             """
-        ).format(sql.Identifier(schema, tablename))
+        ).format(
+            sql.Identifier(schema, tablename),
+            **{
+                name: sql.Literal(value)
+                for name, value in self._select_params(bidding_zone, start, end).items()
+            },
+        )
 
-        with psycopg.connect(self.dsn) as con:
-            with con.cursor() as cur:
-                cur.execute(query, (bidding_zone.eic_code, end, start))
-                rows = cur.fetchall()
+    def _copy_to_arrays(self, payload: bytes, bidding_zone: BiddingZone) -> LoadArraySeries:
+        """Decode the payload of ``_copy_query``, see ``_rows_to_arrays``."""
+        start_ts, seconds, load_mw = binary_copy.decode(
+            payload, ["timestamptz", "int4", "float8"]
+        )
+        return LoadArraySeries(
+            bidding_zone=bidding_zone,
+            resolution=slot_resolution(seconds),
+            start_ts=start_ts,
+            load_mw=load_mw,
+        )
 
+    def _rows_to_series(self, rows, bidding_zone: BiddingZone) -> LoadSeries:
         observations = tuple(
             LoadMeasurement(
                 bidding_zone=resolve_bidding_zone(zone_code),
@@ -87,10 +366,581 @@ class EntsoePostgreRepository:
 
         return LoadSeries(
             bidding_zone=bidding_zone,
-            resolution=Resolution.PT15M,
+            resolution=slot_resolution(
+                [(m.interval.end - m.interval.start).total_seconds() for m in observations]
+            ),
             observations=observations,
         )
 
+    def _rows_to_arrays(self, rows, bidding_zone: BiddingZone) -> LoadArraySeries:
+        """Map (start_ts, slot seconds, load_mw) rows of ``_stream_columns`` to arrays.
+
+        The resolution is the median slot length of the rows, zones switching
+        their resolution inside a range report the prevailing one.
+        """
+        chunk = np.array(
+            rows,
+            dtype=[("start_ts", "datetime64[us]"), ("seconds", "i4"), ("load_mw", "f8")],
+        )
+        return LoadArraySeries(
+            bidding_zone=bidding_zone,
+            resolution=slot_resolution(chunk["seconds"]),
+            start_ts=chunk["start_ts"],
+            load_mw=chunk["load_mw"],
+        )
+
+    def _insert_query(self, schema: str, tablename: str) -> sql.Composed:
+        return sql.SQL(
+            """
+            INSERT INTO {table} AS t (start_ts, end_ts, load_mw, zone_code)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT ON CONSTRAINT unique_load_measurement_slot DO UPDATE
+            SET load_mw = EXCLUDED.load_mw
+            WHERE t.load_mw IS DISTINCT FROM EXCLUDED.load_mw
+            """
+        ).format(table=sql.Identifier(schema, tablename))
+
+    def _insert_rows(self, load_series: LoadSeries) -> list[tuple]:
+        return [
+            (
+                m.interval.start,
+                m.interval.end,
+                m.load_mw,
+                m.bidding_zone.eic_code,
+            )
+            for m in load_series.observations
+        ]
+
+    def _staging_table(self, tablename: str) -> sql.Identifier:
+        return sql.Identifier(f"{tablename}_staging")
+
+    def _staging_ddl(self, tablename: str) -> sql.Composed:
+        """Temporary table ``add_bulk`` copies the rows of ``_insert_rows`` into."""
+        return sql.SQL(
+            """
+            CREATE TEMP TABLE {} (
+                start_ts timestamptz NOT NULL,
+                end_ts timestamptz NOT NULL,
+                load_mw numeric(10, 2) NOT NULL,
+                zone_code varchar(30) NOT NULL
+            ) ON COMMIT DROP
+            """
+        ).format(self._staging_table(tablename))
+
+    def _staging_copy_query(self, tablename: str) -> sql.Composed:
+        return sql.SQL("COPY {} (start_ts, end_ts, load_mw, zone_code) FROM STDIN").format(
+            self._staging_table(tablename)
+        )
+
+    def _array_staging_ddl(self, tablename: str) -> sql.Composed:
+        """Temporary table ``add_bulk`` copies a LoadArraySeries into.
+
+        The zone and the slot length are the same for the whole series, the
+        merge adds them, see ``_array_merge_params``.
+        """
+        return sql.SQL(
+            """
+            CREATE TEMP TABLE {} (
+                start_ts timestamptz NOT NULL,
+                load_mw double precision NOT NULL
+            ) ON COMMIT DROP
+            """
+        ).format(self._staging_table(tablename))
+
+    def _array_staging_copy_query(self, tablename: str) -> sql.Composed:
+        return sql.SQL("COPY {} (start_ts, load_mw) FROM STDIN (FORMAT BINARY)").format(
+            self._staging_table(tablename)
+        )
+
+    def _array_copy_payload(self, load_series: LoadArraySeries) -> bytes:
+        return binary_copy.encode(
+            [
+                ("timestamptz", load_series.start_ts),
+                ("float8", np.asarray(load_series.load_mw, dtype=np.float64)),
+            ]
+        )
+
+    def _array_merge_params(self, load_series: LoadArraySeries) -> dict:
+        return {
+            "slot": RESOLUTION_LENGTH[load_series.resolution],
+            "zone_code": load_series.bidding_zone.eic_code,
+        }
+
+    def _merge_query(self, schema: str, tablename: str, columnar: bool = False) -> sql.Composed:
+        """Upsert of the staged rows, returns the inserted, updated and staged slot counts.
+
+        With ``columnar`` the rows come from ``_array_staging_ddl`` and the
+        query takes ``_array_merge_params``.
+        """
+        staged = self._staging_table(tablename)
+        if columnar:
+            staged = sql.SQL(
+                """(
+                    SELECT start_ts, start_ts + %(slot)s AS end_ts, load_mw,
+                        %(zone_code)s::varchar AS zone_code
+                    FROM {}
+                ) AS staged"""
+            ).format(staged)
+        # DISTINCT ON keeps a single row per slot, a second row for the
+        # same slot would make ON CONFLICT DO UPDATE fail.
+        return sql.SQL(
+            """
+            WITH upserted AS (
+                INSERT INTO {target} AS t (start_ts, end_ts, load_mw, zone_code)
+                SELECT DISTINCT ON (start_ts, end_ts, zone_code)
+                    start_ts, end_ts, load_mw, zone_code
+                FROM {staging}
+                ORDER BY start_ts, end_ts, zone_code
+                ON CONFLICT ON CONSTRAINT unique_load_measurement_slot DO UPDATE
+                SET load_mw = EXCLUDED.load_mw
+                WHERE t.load_mw IS DISTINCT FROM EXCLUDED.load_mw
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                count(*) FILTER (WHERE inserted),
+                count(*) FILTER (WHERE NOT inserted),
+                (
+                    SELECT count(*) FROM (
+                        SELECT DISTINCT start_ts, end_ts, zone_code FROM {staging}
+                    ) AS slots
+                )
+            FROM upserted
+            """
+        ).format(target=sql.Identifier(schema, tablename), staging=staged)
+
+    def _merge_result(self, row) -> UpsertResult:
+        inserted, updated, slots = row
+        return UpsertResult(
+            inserted=inserted, updated=updated, unchanged=slots - inserted - updated
+        )
+
+    def _batch_query(self, schema: str, tablename: str) -> sql.Composed:
+        """Range read of several zones, the parameters come from ``_batch_params``."""
+        return sql.SQL(
+            """
+            SELECT array_position(%(zone_codes)s::text[], zone_code::text) - 1,
+                   start_ts AT TIME ZONE 'UTC',
+                   extract(epoch FROM end_ts - start_ts)::int4,
+                   load_mw::float8
+            FROM {}
+            WHERE zone_code = ANY(%(zone_codes)s)
+            AND start_ts < %(end)s
+            AND start_ts > %(earliest_start)s
+            AND end_ts > %(start)s
+            ORDER BY 1, 2
+            """
+        ).format(sql.Identifier(schema, tablename))
+
+    def _batch_params(
+        self, bidding_zones: list[BiddingZone], start: datetime, end: datetime
+    ) -> dict:
+        return {
+            "zone_codes": [zone.eic_code for zone in bidding_zones],
+            "start": start,
+            "end": end,
+            "earliest_start": start - MAX_SLOT_LENGTH,
+        }
+
+    def _rows_to_batch(
+        self, rows, bidding_zones: list[BiddingZone], start: datetime, end: datetime
+    ) -> LoadArrayBatch:
+        """Split the rows of ``_batch_query`` by zone and count the missing slots.
+
+        A zone's slot length is the median length of its rows, 15 minutes for
+        zones without rows. Missing slots are the part of ``[start, end)`` not
+        covered by any row, divided by that length.
+        """
+        table = np.array(
+            rows,
+            dtype=[
+                ("zone", "i4"),
+                ("start_ts", "datetime64[us]"),
+                ("seconds", "i4"),
+                ("load_mw", "f8"),
+            ],
+        )
+        bounds = np.searchsorted(table["zone"], np.arange(len(bidding_zones) + 1))
+        start64 = np.datetime64(start.astimezone(timezone.utc).replace(tzinfo=None), "us")
+        end64 = np.datetime64(end.astimezone(timezone.utc).replace(tzinfo=None), "us")
+
+        series, missing_slots = {}, {}
+        for i, zone in enumerate(bidding_zones):
+            chunk = table[bounds[i] : bounds[i + 1]]
+            resolution = slot_resolution(chunk["seconds"])
+            slot_end = chunk["start_ts"] + chunk["seconds"].astype("timedelta64[s]")
+            covered = (
+                np.minimum(slot_end, end64) - np.maximum(chunk["start_ts"], start64)
+            ).sum()
+            missing = (end64 - start64 - covered) / np.timedelta64(RESOLUTION_LENGTH[resolution])
+
+            series[zone.eic_code] = LoadArraySeries(
+                bidding_zone=zone,
+                resolution=resolution,
+                start_ts=chunk["start_ts"],
+                load_mw=chunk["load_mw"],
+            )
+            missing_slots[zone.eic_code] = max(int(round(missing)), 0)
+
+        return LoadArrayBatch(
+            interval=TimeInterval(start, end), series=series, missing_slots=missing_slots
+        )
+
+    def _resample_query(
+        self, schema: str, tablename: str, aggregates: list[str], grain: str | None = None
+    ) -> sql.Composed:
+        """Aggregates of one zone per bucket of slot starts in ``[start, end)``.
+
+        With a ``grain`` the buckets are combined from that roll-up table
+        instead of the slots, see ``_rollup_grain``. The parameters are those
+        of ``_select_params`` plus ``stride`` and ``origin``.
+        """
+        if grain is not None:
+            columns = sql.SQL(", ").join(
+                [sql.SQL("sum(slot_count)")]
+                + [
+                    sql.SQL("({})::float8").format(sql.SQL(ROLLUP_AGGREGATES[name]))
+                    for name in aggregates
+                ]
+            )
+            return sql.SQL(
+                """
+                SELECT date_bin(%(stride)s, bucket, %(origin)s) AT TIME ZONE 'UTC' AS resampled, {}
+                FROM {}
+                WHERE zone_code = %(zone_code)s
+                AND bucket >= %(start)s
+                AND bucket < %(end)s
+                GROUP BY resampled
+                ORDER BY resampled
+                """
+            ).format(
+                columns,
+                sql.Identifier(schema, db_schema.load_rollup_name(tablename, grain)),
+            )
+
+        return sql.SQL(
+            """
+            SELECT date_bin(%(stride)s, start_ts, %(origin)s) AT TIME ZONE 'UTC' AS bucket, {}
+            FROM {}
+            WHERE zone_code = %(zone_code)s
+            AND start_ts >= %(start)s
+            AND start_ts < %(end)s
+            GROUP BY bucket
+            ORDER BY bucket
+            """
+        ).format(_aggregate_columns(aggregates, "load_mw"), sql.Identifier(schema, tablename))
+
+    def _rollup_grain(
+        self,
+        start: datetime,
+        end: datetime,
+        resolution: Resolution,
+        aggregates: list[str],
+        grains: Iterable[str] = tuple(db_schema.LOAD_ROLLUP_GRAINS),
+    ) -> str | None:
+        """Coarsest of the existing roll-up ``grains`` answering a resampled read
+        exactly, ``None`` for the slots.
+
+        The roll-up buckets must tile both the requested buckets and the
+        window, and every aggregate must follow from sums, minima and maxima.
+        """
+        if not all(name in ROLLUP_AGGREGATES for name in aggregates):
+            return None
+        stride = _bucket_stride(resolution)
+        for grain, length in sorted(
+            db_schema.LOAD_ROLLUP_GRAINS.items(), key=lambda item: item[1], reverse=True
+        ):
+            if grain in grains and (
+                stride % length == timedelta(0)
+                and (start - BUCKET_ORIGIN) % length == timedelta(0)
+                and (end - BUCKET_ORIGIN) % length == timedelta(0)
+            ):
+                return grain
+        return None
+
+    def _resample_params(
+        self, bidding_zone: BiddingZone, start: datetime, end: datetime, resolution: Resolution
+    ) -> dict:
+        params = self._select_params(bidding_zone, start, end)
+        params.update(stride=_bucket_stride(resolution), origin=BUCKET_ORIGIN)
+        return params
+
+    def _rollup_tables_params(self, schema: str, tablename: str) -> tuple[str, list[str]]:
+        """Parameters of ``EXISTING_TABLES_QUERY`` looking up the roll-ups of a load table."""
+        return schema, [
+            db_schema.load_rollup_name(tablename, grain) for grain in db_schema.LOAD_ROLLUP_GRAINS
+        ]
+
+    def _rollup_grains_of(self, rows, tablename: str) -> frozenset[str]:
+        """Grains of the roll-up tables found by ``EXISTING_TABLES_QUERY``."""
+        names = {name for (name,) in rows}
+        return frozenset(
+            grain
+            for grain in db_schema.LOAD_ROLLUP_GRAINS
+            if db_schema.load_rollup_name(tablename, grain) in names
+        )
+
+    def _rollup_refresh_query(self, schema: str, tablename: str, grain: str) -> sql.Composed:
+        """Recompute the ``grain`` buckets of one zone touched by ``[first, last]``.
+
+        Upserts only add or replace slots, so every touched bucket still has
+        slots and is overwritten; no bucket has to be deleted. Buckets whose
+        aggregates did not change are not rewritten.
+        """
+        return sql.SQL(
+            """
+            INSERT INTO {rollup} AS r (zone_code, bucket, slot_count, load_sum, load_min, load_max)
+            SELECT zone_code, date_bin(%(stride)s, start_ts, %(origin)s),
+                   count(*), sum(load_mw), min(load_mw), max(load_mw)
+            FROM {table}
+            WHERE zone_code = %(zone_code)s
+            AND start_ts >= date_bin(%(stride)s, %(first)s, %(origin)s)
+            AND start_ts < date_bin(%(stride)s, %(last)s, %(origin)s) + %(stride)s
+            GROUP BY 1, 2
+            ON CONFLICT (zone_code, bucket) DO UPDATE SET
+                slot_count = EXCLUDED.slot_count,
+                load_sum = EXCLUDED.load_sum,
+                load_min = EXCLUDED.load_min,
+                load_max = EXCLUDED.load_max
+            WHERE (r.slot_count, r.load_sum, r.load_min, r.load_max)
+                IS DISTINCT FROM
+                (EXCLUDED.slot_count, EXCLUDED.load_sum, EXCLUDED.load_min, EXCLUDED.load_max)
+            """
+        ).format(
+            rollup=sql.Identifier(schema, db_schema.load_rollup_name(tablename, grain)),
+            table=sql.Identifier(schema, tablename),
+        )
+
+    def _written_starts(
+        self, load_series: LoadSeries | LoadArraySeries
+    ) -> dict[str, tuple[datetime, datetime]]:
+        """First and last written slot start per zone."""
+        if isinstance(load_series, LoadArraySeries):
+            if not len(load_series):
+                return {}
+            return {load_series.bidding_zone.eic_code: datetime_bounds(load_series.start_ts)}
+        written: dict[str, tuple[datetime, datetime]] = {}
+        for m in load_series.observations:
+            zone_code = m.bidding_zone.eic_code
+            first, last = written.get(zone_code, (m.interval.start, m.interval.start))
+            written[zone_code] = (min(first, m.interval.start), max(last, m.interval.start))
+        return written
+
+    def _rollup_refresh_params(
+        self, load_series: LoadSeries | LoadArraySeries, grain: str
+    ) -> list[dict]:
+        written = self._written_starts(load_series)
+        return [
+            {
+                "zone_code": zone_code,
+                "first": first,
+                "last": last,
+                "stride": db_schema.LOAD_ROLLUP_GRAINS[grain],
+                "origin": BUCKET_ORIGIN,
+            }
+            # Sorted zones keep the row lock order stable between concurrent writers.
+            for zone_code, (first, last) in sorted(written.items())
+        ]
+
+    def _latest_per_zone(self, load_series: LoadSeries | LoadArraySeries) -> dict[str, datetime]:
+        return {
+            zone_code: last for zone_code, (_, last) in self._written_starts(load_series).items()
+        }
+
+
+class EntsoePostgreRepository(_EntsoeQueries, PostgresRepository):
+    """PostgreSQL repository for actual load data from ENTSO-E.
+
+    With ``partitioned=True`` newly created load tables are range partitioned
+    by month on ``start_ts``; the monthly partitions are created on demand
+    before every write into a partitioned table.
+    """
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        pool: ConnectionPool | None = None,
+        partitioned: bool = False,
+    ):
+        super().__init__(dsn, pool)
+        self.partitioned = partitioned
+        self._known_rollups: dict[tuple[str, str], frozenset[str]] = {}
+
+    def _rollup_grains(
+        self, cur: psycopg.Cursor, schema: str, tablename: str
+    ) -> frozenset[str]:
+        """Grains of the roll-ups migration 0005 created next to the load table.
+
+        Looked up once per repository instance, roll-ups created later are
+        used after a restart.
+        """
+        if (schema, tablename) not in self._known_rollups:
+            cur.execute(
+                db_schema.EXISTING_TABLES_QUERY, self._rollup_tables_params(schema, tablename)
+            )
+            self._known_rollups[(schema, tablename)] = self._rollup_grains_of(
+                cur.fetchall(), tablename
+            )
+        return self._known_rollups[(schema, tablename)]
+
+    def _refresh_rollups(
+        self,
+        cur: psycopg.Cursor,
+        schema: str,
+        tablename: str,
+        load_series: LoadSeries | LoadArraySeries,
+    ) -> None:
+        """Recompute the roll-up buckets touched by ``load_series`` in the write transaction."""
+        for grain in self._rollup_grains(cur, schema, tablename):
+            params = self._rollup_refresh_params(load_series, grain)
+            if params:
+                cur.executemany(self._rollup_refresh_query(schema, tablename, grain), params)
+
+    def get(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadSeries:
+        """Retrieve actual load data between start and end timestamps."""
+        query = self._select_query(schema, tablename)
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                cur.execute(query, self._select_params(bidding_zone, start, end))
+                rows = cur.fetchall()
+
+        return self._rows_to_series(rows, bidding_zone)
+
+    def iter_batches(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        batch_size: int = 10_000,
+        columnar: bool = False,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> Iterator[LoadSeries | LoadArraySeries]:
+        """Stream actual load data in chunks of at most ``batch_size`` rows.
+
+        The rows are read through a named server-side cursor, so only one batch
+        is held in memory at a time. With ``columnar=True`` every chunk is a
+        LoadArraySeries, otherwise a LoadSeries of domain objects.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        columns = self._stream_columns if columnar else None
+        query = self._select_query(schema, tablename, columns)
+
+        with self._connect() as con:
+            with con.cursor(name=f"stream_{tablename}") as cur:
+                cur.itersize = batch_size
+                cur.execute(query, self._select_params(bidding_zone, start, end))
+                while rows := cur.fetchmany(batch_size):
+                    if columnar:
+                        yield self._rows_to_arrays(rows, bidding_zone)
+                    else:
+                        yield self._rows_to_series(rows, bidding_zone)
+
+    def get_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArraySeries:
+        """Retrieve actual load data as NumPy arrays without building domain objects.
+
+        The rows are read with a binary ``COPY ... TO STDOUT`` and decoded in
+        one go, which keeps multi-year reads free of per-row allocations.
+        """
+        query = self._copy_query(schema, tablename, bidding_zone, start, end)
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                with cur.copy(query) as copy:
+                    payload = b"".join(copy)
+
+        return self._copy_to_arrays(payload, bidding_zone)
+
+    def get_many(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zones: Iterable[BiddingZone],
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> LoadArrayBatch:
+        """Retrieve the load of several zones with one ``zone_code = ANY(...)`` query."""
+        bidding_zones = list(dict.fromkeys(bidding_zones))
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                cur.execute(
+                    self._batch_query(schema, tablename),
+                    self._batch_params(bidding_zones, start, end),
+                )
+                rows = cur.fetchall()
+
+        return self._rows_to_batch(rows, bidding_zones, start, end)
+
+    def get_resampled(
+        self,
+        start: datetime,
+        end: datetime,
+        bidding_zone: BiddingZone,
+        resolution: Resolution,
+        aggregates: Iterable[str] = ("mean",),
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> ResampledSeries:
+        """Aggregate the load of slots starting in ``[start, end)`` per ``resolution``.
+
+        Buckets are computed in Postgres with ``date_bin``, daily and weekly
+        ones start at midnight UTC and on Mondays. Empty buckets are left out.
+        Reads aligned to whole hours or days without quantiles combine the
+        hourly or daily roll-up rows instead of reading every slot, where
+        migration 0005 created the roll-ups.
+        """
+        aggregates = list(dict.fromkeys(aggregates))
+        params = self._resample_params(bidding_zone, start, end, resolution)
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                grain = self._rollup_grain(
+                    start, end, resolution, aggregates, self._rollup_grains(cur, schema, tablename)
+                )
+                cur.execute(self._resample_query(schema, tablename, aggregates, grain), params)
+                rows = cur.fetchall()
+
+        return _rows_to_resampled(rows, resolution, aggregates)
+
+    def get_latest_start(
+        self,
+        bidding_zone: BiddingZone,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> datetime | None:
+        """Start of the latest stored slot of ``bidding_zone``.
+
+        ``None`` when the zone has no load yet or the table does not exist.
+        """
+        try:
+            with self._connect() as con:
+                with con.cursor() as cur:
+                    cur.execute(
+                        self._latest_start_query(schema, tablename), (bidding_zone.eic_code,)
+                    )
+                    row = cur.fetchone()
+        except psycopg.errors.UndefinedTable:
+            return None
+
+        return row[0] if row else None
+
     def add(
         self,
         load_series: LoadSeries,
@@ -99,34 +949,69 @@ class EntsoePostgreRepository:
     ) -> None:
         """Add load measurements to the repository."""
 
-        with psycopg.connect(self.dsn) as conn:
+        with self._connect() as conn:
             with conn.cursor() as cur:
-                self._create_table(tablename, cur, schema)
+                self._prepare_write(cur, schema, tablename, *self._write_bounds(load_series))
                 cur.executemany(
-                    sql.SQL(
-                        """
-                        INSERT INTO {} (start_ts, end_ts, load_mw, zone_code) VALUES (%s, %s, %s, %s)
-                        ON CONFLICT ON CONSTRAINT unique_load_measurement_slot DO UPDATE 
-                        SET load_mw = EXCLUDED.load_mw
-                        """
-                    ).format(sql.Identifier(schema, tablename)),
-                    [
-                        (
-                            m.interval.start,
-                            m.interval.end,
-                            m.load_mw,
-                            m.bidding_zone.eic_code,
-                        )
-                        for m in load_series.observations
-                    ],
+                    self._insert_query(schema, tablename), self._insert_rows(load_series)
+                )
+                self._refresh_rollups(cur, schema, tablename, load_series)
+                self._advance_watermarks(
+                    cur, schema, tablename, self._latest_per_zone(load_series)
+                )
+
+    def add_bulk(
+        self,
+        load_series: LoadSeries | LoadArraySeries,
+        schema: str = "public",
+        tablename: str = "actual_total_load",
+    ) -> UpsertResult:
+        """Bulk upsert load measurements through a COPY-loaded staging table.
+
+        The rows are streamed with ``COPY FROM STDIN`` into a temporary table
+        and merged into the target table with a single ``INSERT ... ON CONFLICT``.
+        Slots that already hold the written load are not updated. A
+        LoadArraySeries is copied in binary format straight from its arrays,
+        without a Python object per slot.
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                self._prepare_write(cur, schema, tablename, *self._write_bounds(load_series))
+                if isinstance(load_series, LoadArraySeries):
+                    cur.execute(self._array_staging_ddl(tablename))
+                    with cur.copy(self._array_staging_copy_query(tablename)) as copy:
+                        copy.write(self._array_copy_payload(load_series))
+                    cur.execute(
+                        self._merge_query(schema, tablename, columnar=True),
+                        self._array_merge_params(load_series),
+                    )
+                else:
+                    cur.execute(self._staging_ddl(tablename))
+                    with cur.copy(self._staging_copy_query(tablename)) as copy:
+                        for row in self._insert_rows(load_series):
+                            copy.write_row(row)
+                    cur.execute(self._merge_query(schema, tablename))
+                result = self._merge_result(cur.fetchone())
+                self._refresh_rollups(cur, schema, tablename, load_series)
+                self._advance_watermarks(
+                    cur, schema, tablename, self._latest_per_zone(load_series)
                 )
 
+        return result
 
-class Era5PostgreRepository:
-    """PostgreSQL repository for storing ERA5 country averages."""
 
-    def __init__(self, dsn: str):
-        self.dsn = dsn
+class _Era5Queries(_TableQueries):
+    """SQL and row mapping shared by the blocking and the asyncio ERA5 repository."""
+
+    partitioned: bool
+
+    def _table_ddl(self, schema: str, tablename: str) -> list[sql.Composed]:
+        return db_schema.weather_table_ddl(schema, tablename, self.partitioned)
+
+    def _partition_ddl(
+        self, schema: str, tablename: str, first: datetime, last: datetime
+    ) -> list[sql.Composed]:
+        return db_schema.yearly_partitions_ddl(schema, tablename, first, last)
 
     def _resolution_to_seconds(self, resolution: Resolution) -> int:
         if resolution == Resolution.PT1H:
@@ -201,24 +1086,258 @@ class Era5PostgreRepository:
 
         raise ValueError(f"unsupported stat value: {stat}")
 
-    def _create_table(
-        self, tablename: str, cur: psycopg.Cursor, schema: str = "public"
-    ):
-        cur.execute(
-            sql.SQL(
-                """
-            CREATE TABLE IF NOT EXISTS {} (
-                valid_time TIMESTAMPTZ NOT NULL,
-                value DOUBLE PRECISION NOT NULL,
-                stat TEXT NOT NULL CHECK (stat IN ('total', 'mean', 'instant')),
-                interval_seconds INTEGER NOT NULL DEFAULT 3600,
-                country_code VARCHAR(5) NOT NULL,
-                PRIMARY KEY (country_code, valid_time)
-            );
+    def _time_predicate(self, variable: WeatherVariable) -> sql.SQL:
+        """Instant values are valid at [start, end), interval values end in (start, end]."""
+        if VARIABLE_VALUE_KIND[variable] is WeatherValueKind.INSTANT:
+            return sql.SQL("valid_time >= %s AND valid_time < %s")
+        return sql.SQL("valid_time > %s AND valid_time <= %s")
+
+    def _select_query(
+        self,
+        schema: str,
+        variable: WeatherVariable,
+        columns: sql.Composable | None = None,
+    ) -> sql.Composed:
+        """Range read of one area, the parameters are (country_code, start, end)."""
+        if columns is None:
+            columns = sql.SQL("valid_time, value, stat, interval_seconds, country_code")
+        return sql.SQL(
+            """
+            SELECT {}
+            FROM {}
+            WHERE country_code = %s
+            AND {}
+            ORDER BY valid_time
             """
-            ).format(sql.Identifier(schema, tablename))
+        ).format(
+            columns,
+            sql.Identifier(schema, f"{variable}_country_avg"),
+            self._time_predicate(variable),
+        )
+
+    # Columns of the array reads, mapped by ``_rows_to_arrays``.
+    _array_columns = sql.SQL("valid_time AT TIME ZONE 'UTC', value")
+
+    def _rows_to_arrays(
+        self, rows, area: WeatherArea, variable: WeatherVariable
+    ) -> Era5ArraySeries:
+        chunk = np.array(rows, dtype=[("valid_time", "datetime64[us]"), ("value", "f8")])
+        return Era5ArraySeries(
+            area=area,
+            resolution=Resolution.PT1H,
+            variable=variable,
+            valid_time=chunk["valid_time"],
+            value=chunk["value"],
         )
 
+    def _period_start(self, variable: WeatherVariable) -> sql.SQL:
+        if VARIABLE_VALUE_KIND[variable] is WeatherValueKind.INSTANT:
+            return sql.SQL("valid_time")
+        return sql.SQL("valid_time - make_interval(secs => interval_seconds)")
+
+    def _resample_query(
+        self, schema: str, variable: WeatherVariable, aggregates: list[str]
+    ) -> sql.Composed:
+        """Aggregates of one area per bucket of period starts.
+
+        Interval-end values are binned by the start of their interval, so an
+        hourly total ending at midnight counts towards the previous day. The
+        parameters are (stride, origin, country_code, start, end).
+        """
+        return sql.SQL(
+            """
+            SELECT date_bin(%s, {}, %s) AT TIME ZONE 'UTC' AS bucket, {}
+            FROM {}
+            WHERE country_code = %s
+            AND {}
+            GROUP BY bucket
+            ORDER BY bucket
+            """
+        ).format(
+            self._period_start(variable),
+            _aggregate_columns(aggregates, "value"),
+            sql.Identifier(schema, f"{variable}_country_avg"),
+            self._time_predicate(variable),
+        )
+
+    def _resample_params(
+        self, interval: TimeInterval, area: WeatherArea, resolution: Resolution
+    ) -> tuple:
+        return (
+            _bucket_stride(resolution),
+            BUCKET_ORIGIN,
+            area.code.value,
+            interval.start,
+            interval.end,
+        )
+
+    def _rows_to_series(self, rows, area: WeatherArea, variable: WeatherVariable) -> Era5Series:
+        return Era5Series(
+            area=area,
+            resolution=Resolution.PT1H,
+            observations=tuple(self._row_to_observation(row, variable) for row in rows),
+            variable=variable,
+        )
+
+    def _insert_query(self, schema: str, tablename: str) -> sql.Composed:
+        return sql.SQL(
+            """
+            INSERT INTO {} (valid_time, value, stat, interval_seconds, country_code) VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (country_code, valid_time) DO UPDATE SET
+                value = EXCLUDED.value,
+                stat = EXCLUDED.stat,
+                interval_seconds = EXCLUDED.interval_seconds;
+            """
+        ).format(sql.Identifier(schema, tablename))
+
+    def _write_rows(self, weather_series: Era5Series) -> list[tuple]:
+        return [
+            self._observation_to_row(weather_series, observation)
+            for observation in weather_series.observations
+        ]
+
+    def _write_bounds(self, rows: list[tuple]) -> tuple[datetime | None, datetime | None]:
+        """First and last written valid time, the partitions have to cover both."""
+        valid_times = [row[0] for row in rows]
+        return min(valid_times, default=None), max(valid_times, default=None)
+
+    # Temporary table ``add_arrays`` copies every series into before merging it.
+    _staging = sql.Identifier("era5_country_avg_staging")
+
+    _staging_ddl = sql.SQL(
+        """
+        CREATE TEMP TABLE {} (
+            valid_time timestamptz NOT NULL,
+            value double precision NOT NULL
+        ) ON COMMIT DROP
+        """
+    ).format(_staging)
+
+    _staging_copy_query = sql.SQL(
+        "COPY {} (valid_time, value) FROM STDIN (FORMAT BINARY)"
+    ).format(_staging)
+
+    _staging_truncate = sql.SQL("TRUNCATE {}").format(_staging)
+
+    def _copy_payload(self, series: Era5ArraySeries) -> bytes:
+        return binary_copy.encode(
+            [
+                ("timestamptz", series.valid_time),
+                ("float8", np.asarray(series.value, dtype=np.float64)),
+            ]
+        )
+
+    def _merge_query(self, schema: str, tablename: str) -> sql.Composed:
+        """Upsert of the staged series, returns the inserted and updated row counts."""
+        return sql.SQL(
+            """
+            WITH upserted AS (
+                INSERT INTO {target} (valid_time, value, stat, interval_seconds, country_code)
+                SELECT DISTINCT ON (valid_time)
+                    valid_time, value, %s::text, %s::integer, %s::varchar
+                FROM {staging}
+                ORDER BY valid_time
+                ON CONFLICT (country_code, valid_time) DO UPDATE SET
+                    value = EXCLUDED.value,
+                    stat = EXCLUDED.stat,
+                    interval_seconds = EXCLUDED.interval_seconds
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                count(*) FILTER (WHERE inserted),
+                count(*) FILTER (WHERE NOT inserted)
+            FROM upserted
+            """
+        ).format(target=sql.Identifier(schema, tablename), staging=self._staging)
+
+    def _merge_params(self, series: Era5ArraySeries) -> tuple:
+        if VARIABLE_VALUE_KIND[series.variable] is WeatherValueKind.INSTANT:
+            stat = "instant"
+        else:
+            stat = IntervalStatistic.TOTAL.value
+        return (stat, self._resolution_to_seconds(series.resolution), series.area.code.value)
+
+    def _frame_query(
+        self,
+        schema: str,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: list[WeatherVariable],
+    ) -> tuple[sql.Composed, list]:
+        """One query pivoting ``variables`` onto a shared axis of period starts."""
+        if not variables:
+            raise ValueError("at least one weather variable is required")
+
+        branches = []
+        params: list = []
+        for variable in variables:
+            branches.append(
+                sql.SQL(
+                    """
+                    SELECT {} AS period_start, {} AS variable, value
+                    FROM {}
+                    WHERE country_code = %s
+                    AND {}
+                    """
+                ).format(
+                    self._period_start(variable),
+                    sql.Literal(variable.value),
+                    sql.Identifier(schema, f"{variable}_country_avg"),
+                    self._time_predicate(variable),
+                )
+            )
+            params.extend((area.code.value, interval.start, interval.end))
+
+        pivot = sql.SQL(", ").join(
+            sql.SQL("max(value) FILTER (WHERE variable = {})").format(
+                sql.Literal(variable.value)
+            )
+            for variable in variables
+        )
+        query = sql.SQL(
+            """
+            SELECT period_start AT TIME ZONE 'UTC', {}
+            FROM ({}) AS observations
+            GROUP BY period_start
+            ORDER BY period_start
+            """
+        ).format(pivot, sql.SQL(" UNION ALL ").join(branches))
+
+        return query, params
+
+    def _rows_to_frame(
+        self, rows, area: WeatherArea, variables: list[WeatherVariable]
+    ) -> Era5Frame:
+        frame = np.array(
+            rows,
+            dtype=[("timestamp", "datetime64[us]")]
+            + [(variable.value, "f8") for variable in variables],
+        )
+        return Era5Frame(
+            area=area,
+            resolution=Resolution.PT1H,
+            timestamps=frame["timestamp"],
+            values={variable: frame[variable.value] for variable in variables},
+        )
+
+
+class Era5PostgreRepository(_Era5Queries, PostgresRepository):
+    """PostgreSQL repository for storing ERA5 country averages.
+
+    With ``partitioned=True`` newly created variable tables are range
+    partitioned by year on ``valid_time``; the yearly partitions are created
+    on demand before every write into a partitioned table.
+    """
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        pool: ConnectionPool | None = None,
+        partitioned: bool = False,
+    ):
+        super().__init__(dsn, pool)
+        self.partitioned = partitioned
+
     def add(
         self,
         weather_series: Era5Series,
@@ -229,28 +1348,56 @@ class Era5PostgreRepository:
         tablename = f"{weather_series.variable}_country_avg"
         interval_seconds = interval_seconds or 3600
 
-        with psycopg.connect(self.dsn) as con:
+        rows = self._write_rows(weather_series)
+        first, last = self._write_bounds(rows)
+
+        with self._connect() as con:
             with con.cursor() as cur:
-                # Create Table if not exists
-                self._create_table(tablename, cur, schema)
+                # Create Table and partitions if not exists
+                self._prepare_write(cur, schema, tablename, first, last)
+                cur.executemany(self._insert_query(schema, tablename), rows)
+                if last is not None:
+                    self._advance_watermarks(
+                        cur, schema, tablename, {weather_series.area.code.value: last}
+                    )
 
-                insert_sql = sql.SQL(
-                    """
-                    INSERT INTO {} (valid_time, value, stat, interval_seconds, country_code) VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (country_code, valid_time) DO UPDATE SET
-                        value = EXCLUDED.value,
-                        stat = EXCLUDED.stat,
-                        interval_seconds = EXCLUDED.interval_seconds;
-                """
-                ).format(sql.Identifier(schema, tablename))
+    def add_arrays(
+        self,
+        weather_series: Iterable[Era5ArraySeries],
+        schema: str = "public",
+    ) -> dict[WeatherVariable, UpsertResult]:
+        """Bulk upsert columnar ERA5 series in a single transaction.
 
-                cur.executemany(
-                    insert_sql,
-                    (
-                        self._observation_to_row(weather_series, observation)
-                        for observation in weather_series.observations
-                    ),
-                )
+        Every series is written with a binary ``COPY`` into a temporary staging
+        table and merged into its ``<variable>_country_avg`` table with one
+        ``INSERT ... ON CONFLICT`` statement.
+        """
+        results: dict[WeatherVariable, UpsertResult] = {}
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                cur.execute(self._staging_ddl)
+
+                for series in weather_series:
+                    tablename = f"{series.variable}_country_avg"
+                    first, last = datetime_bounds(series.valid_time)
+                    self._prepare_write(cur, schema, tablename, first, last)
+
+                    with cur.copy(self._staging_copy_query) as copy:
+                        copy.write(self._copy_payload(series))
+
+                    cur.execute(self._merge_query(schema, tablename), self._merge_params(series))
+                    inserted, updated = cur.fetchone()
+                    results[series.variable] = UpsertResult(
+                        inserted=inserted, updated=updated
+                    )
+                    if last is not None:
+                        self._advance_watermarks(
+                            cur, schema, tablename, {series.area.code.value: last}
+                        )
+                    cur.execute(self._staging_truncate)
+
+        return results
 
     def get(
         self,
@@ -259,44 +1406,15 @@ class Era5PostgreRepository:
         variable: WeatherVariable,
         schema: str = "public",
     ) -> Era5Series:
-        tablename = f"{variable}_country_avg"
-        with psycopg.connect(self.dsn) as con:
-            with con.cursor() as cur:
-                value_kind = VARIABLE_VALUE_KIND[variable]
-
-                if value_kind is WeatherValueKind.INSTANT:
-                    time_predicate = sql.SQL("valid_time >= %s AND valid_time < %s")
-                    params = (area.code.value, interval.start, interval.end)
-                else:
-                    time_predicate = sql.SQL("valid_time > %s AND valid_time <= %s")
-                    params = (area.code.value, interval.start, interval.end)
-
-                select_stmt = sql.SQL(
-                    """
-                    SELECT valid_time, value, stat, interval_seconds, country_code
-                    FROM {}
-                    WHERE country_code = %s
-                    AND {}
-                    ORDER BY valid_time
-                    """
-                ).format(
-                    sql.Identifier(schema, tablename),
-                    time_predicate,
-                )
+        select_stmt = self._select_query(schema, variable)
+        params = (area.code.value, interval.start, interval.end)
 
+        with self._connect() as con:
+            with con.cursor() as cur:
                 cur.execute(select_stmt, params)
                 rows = cur.fetchall()
 
-                observations = tuple(
-                    self._row_to_observation(row, variable) for row in rows
-                )
-
-                return Era5Series(
-                    area=area,
-                    resolution=Resolution.PT1H,
-                    observations=observations,
-                    variable=variable,
-                )
+                return self._rows_to_series(rows, area, variable)
 
                 # df = pd.DataFrame(data=rows, columns=["valid_time", "value"])
                 # df["valid_time"] = pd.to_datetime(df["valid_time"], utc=True)
@@ -313,46 +1431,288 @@ class Era5PostgreRepository:
                 # df.set_index("valid_time", inplace=True)
                 # return df
 
+    def get_frame(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variables: Iterable[WeatherVariable],
+        schema: str = "public",
+    ) -> Era5Frame:
+        """Retrieve several variables of one area with a single query.
 
-class ForecastMetadataRepository:
-    def __init__(self, dsn: str):
-        self.dsn = dsn
-        self.timestamp_sources = [
-            ("ssrd_country_avg", "valid_time"),
-            ("actual_total_load", "start_ts"),
-            ("t2m_country_avg", "valid_time"),
-            ("tp_country_avg", "valid_time"),
-            ("u10_country_avg", "valid_time"),
-            ("v10_country_avg", "valid_time"),
+        Every variable keeps its own time predicate from ``VARIABLE_VALUE_KIND``.
+        Interval-end values are shifted to the start of their interval, so all
+        variables share one time axis of period starts in [start, end).
+        """
+        variables = list(dict.fromkeys(variables))
+        query, params = self._frame_query(schema, interval, area, variables)
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                cur.execute(query, params)
+                rows = cur.fetchall()
+
+        return self._rows_to_frame(rows, area, variables)
+
+    def get_resampled(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        resolution: Resolution,
+        aggregates: Iterable[str] = ("mean",),
+        schema: str = "public",
+    ) -> ResampledSeries:
+        """Aggregate one variable per ``resolution`` bucket of period starts.
+
+        The values read are the same as for ``get``; interval-end values are
+        binned by the start of their interval, like ``get_frame`` aligns them.
+        """
+        aggregates = list(dict.fromkeys(aggregates))
+        query = self._resample_query(schema, variable, aggregates)
+        params = self._resample_params(interval, area, resolution)
+
+        with self._connect() as con:
+            with con.cursor() as cur:
+                cur.execute(query, params)
+                rows = cur.fetchall()
+
+        return _rows_to_resampled(rows, resolution, aggregates)
+
+    def iter_batches(
+        self,
+        interval: TimeInterval,
+        area: WeatherArea,
+        variable: WeatherVariable,
+        batch_size: int = 10_000,
+        columnar: bool = False,
+        schema: str = "public",
+    ) -> Iterator[Era5Series | Era5ArraySeries]:
+        """Stream ERA5 country averages in chunks of at most ``batch_size`` rows.
+
+        The rows are read through a named server-side cursor, so only one batch
+        is held in memory at a time. With ``columnar=True`` every chunk is an
+        Era5ArraySeries of stored valid times, otherwise an Era5Series.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        columns = self._array_columns if columnar else None
+        select_stmt = self._select_query(schema, variable, columns)
+        params = (area.code.value, interval.start, interval.end)
+
+        with self._connect() as con:
+            with con.cursor(name=f"stream_{variable}_country_avg") as cur:
+                cur.itersize = batch_size
+                cur.execute(select_stmt, params)
+                while rows := cur.fetchmany(batch_size):
+                    if columnar:
+                        yield self._rows_to_arrays(rows, area, variable)
+                    else:
+                        yield self._rows_to_series(rows, area, variable)
+
+
+class _ForecastMetadataQueries:
+    """SQL shared by the blocking and the asyncio forecast metadata repository."""
+
+    load_table = "actual_total_load"
+    weather_tables = [
+        "ssrd_country_avg",
+        "t2m_country_avg",
+        "tp_country_avg",
+        "u10_country_avg",
+        "v10_country_avg",
+    ]
+
+    def _zone_and_area(
+        self, bidding_zone: BiddingZone | None, area: WeatherArea | None
+    ) -> tuple[BiddingZone, WeatherArea]:
+        bidding_zone = bidding_zone or resolve_bidding_zone("10YAT-APG------L")
+        return bidding_zone, area or WeatherArea(bidding_zone.country_code)
+
+    def _sources(self, bidding_zone: BiddingZone, area: WeatherArea) -> list[tuple[str, str]]:
+        """``(source table, key)`` of the load and every weather variable."""
+        return [(self.load_table, bidding_zone.eic_code)] + [
+            (table_name, area.code.value) for table_name in self.weather_tables
         ]
 
-    def get_latest_common_timestamp(self, schema: str = "public") -> datetime | None:
-        least_parts = [
-            sql.SQL("(SELECT MAX({}) FROM {})").format(
-                sql.Identifier(column),
-                sql.Identifier(schema, table_name),
+    def _source_columns(self, source: str) -> tuple[str, str]:
+        """Key and timestamp column of the ``source`` table."""
+        if source == self.load_table:
+            return "zone_code", "start_ts"
+        return "country_code", "valid_time"
+
+    def _latest_common_query(
+        self,
+        bidding_zone: BiddingZone | None,
+        area: WeatherArea | None,
+        schema: str,
+    ) -> tuple[sql.Composed, list]:
+        """Query and parameters of ``get_latest_common_timestamp``.
+
+        The common watermark is the smallest of the load watermark of
+        ``bidding_zone`` and the weather watermarks of ``area``. A source
+        without a watermark row, e.g. in a table created by a write instead of
+        migration 0004, falls back to the latest timestamp of its data table.
+        """
+        bidding_zone, area = self._zone_and_area(bidding_zone, area)
+        sources = self._sources(bidding_zone, area)
+        latest = [
+            sql.SQL("COALESCE(({}), ({}))").format(
+                self._watermark_select_query(schema), self._latest_in_table_query(schema, source)
             )
-            for table_name, column in self.timestamp_sources
+            for source, _ in sources
         ]
+        params = [value for source, key in sources for value in (source, key, key)]
+        params.append(bidding_zone.eic_code)
 
-        query = sql.SQL(
+        return self._latest_common_select(schema, latest), params
+
+    def _latest_in_table_query(self, schema: str, source: str) -> sql.Composed:
+        """Latest timestamp of one key in the ``source`` table, parametrized by the key."""
+        key_column, ts_column = self._source_columns(source)
+        return sql.SQL("SELECT max({ts}) FROM {table} WHERE {key} = %s").format(
+            ts=sql.Identifier(ts_column),
+            table=sql.Identifier(schema, source),
+            key=sql.Identifier(key_column),
+        )
+
+    def _latest_common_fallback_query(
+        self,
+        bidding_zone: BiddingZone | None,
+        area: WeatherArea | None,
+        schema: str,
+    ) -> tuple[sql.Composed, list]:
+        """``_latest_common_query`` for a schema without the watermark table.
+
+        Scans the latest timestamp of every source table instead of reading
+        its watermark, as before migration 0004.
+        """
+        bidding_zone, area = self._zone_and_area(bidding_zone, area)
+        sources = self._sources(bidding_zone, area)
+        latest = [self._latest_in_table_query(schema, source) for source, _ in sources]
+        params = [key for _, key in sources] + [bidding_zone.eic_code]
+
+        return self._latest_common_select(schema, latest), params
+
+    def _latest_common_select(
+        self, schema: str, latest: list[sql.Composable]
+    ) -> sql.Composed:
+        """Latest load slot at or before the smallest of the ``latest`` timestamps.
+
+        Without a timestamp for every source there is no common one and the
+        query returns no row. The load slot is found with one probe of the
+        ``(zone_code, start_ts)`` index, the zone code is the last parameter.
+        """
+        return sql.SQL(
             """
-            WITH last_common_hour AS (
-                SELECT LEAST({}) AS ts
+            WITH latest (ts) AS (
+                VALUES {latest}
+            ),
+            last_common AS (
+                SELECT min(ts) AS ts
+                FROM latest
+                HAVING count(ts) = {sources}
+            )
+            SELECT (
+                SELECT max(atl.start_ts)
+                FROM {load} atl
+                WHERE atl.zone_code = %s
+                AND atl.start_ts <= lc.ts
             )
-            SELECT MAX(atl.start_ts)
-            FROM {} atl
-            CROSS JOIN last_common_hour lch
-            WHERE atl.start_ts <= lch.ts
+            FROM last_common lc
             """
         ).format(
-            sql.SQL(", ").join(least_parts),
-            sql.Identifier(schema, "actual_total_load"),
+            latest=sql.SQL(", ").join(sql.SQL("(({}))").format(query) for query in latest),
+            sources=sql.Literal(len(latest)),
+            load=sql.Identifier(schema, self.load_table),
         )
 
-        with psycopg.connect(self.dsn) as con:
+    def _watermark_select_query(self, schema: str) -> sql.Composed:
+        """Query of ``get_watermark``, parametrized by source and key."""
+        return sql.SQL(
+            "SELECT latest_ts FROM {} WHERE source = %s AND key = %s"
+        ).format(sql.Identifier(schema, db_schema.WATERMARK_TABLE))
+
+    def _watermark_version_query(self, schema: str) -> sql.Composed:
+        """Query of ``get_watermark_version``, parametrized by source and key."""
+        return sql.SQL(
+            "SELECT latest_ts, updated_at FROM {} WHERE source = %s AND key = %s"
+        ).format(sql.Identifier(schema, db_schema.WATERMARK_TABLE))
+
+
+class ForecastMetadataRepository(_ForecastMetadataQueries, PostgresRepository):
+    """Reads the data availability recorded in the ``data_watermarks`` table.
+
+    On a database without the table, before migration 0004 and before the
+    first write, the latest timestamps are read from the data tables instead.
+    A data table that does not exist yet has no latest timestamp.
+    """
+
+    def get_latest_common_timestamp(
+        self,
+        bidding_zone: BiddingZone | None = None,
+        area: WeatherArea | None = None,
+        schema: str = "public",
+    ) -> datetime | None:
+        """Latest load slot start for which load and every weather variable exist.
+
+        Args:
+            bidding_zone: Defaults to Austria.
+            area: Defaults to the country of ``bidding_zone``.
+        """
+        try:
+            return self._fetch_latest(*self._latest_common_query(bidding_zone, area, schema))
+        except psycopg.errors.UndefinedTable:
+            pass
+        try:
+            return self._fetch_latest(
+                *self._latest_common_fallback_query(bidding_zone, area, schema)
+            )
+        except psycopg.errors.UndefinedTable:
+            # A source table that was never written to has no timestamp.
+            return None
+
+    def get_watermark(
+        self, source: str, key: str, schema: str = "public"
+    ) -> datetime | None:
+        """Latest timestamp written for ``key`` into the ``source`` table.
+
+        Args:
+            source: Table name, e.g. ``actual_total_load`` or ``t2m_country_avg``.
+            key: EIC code of a bidding zone or country code of a weather area.
+        """
+        try:
+            return self._fetch_latest(self._watermark_select_query(schema), (source, key))
+        except psycopg.errors.UndefinedTable:
+            pass
+        try:
+            return self._fetch_latest(self._latest_in_table_query(schema, source), (key,))
+        except psycopg.errors.UndefinedTable:
+            return None
+
+    def get_watermark_version(
+        self, source: str, key: str, schema: str = "public"
+    ) -> Watermark | None:
+        """Watermark of ``key`` in ``source`` together with the time of the last write.
+
+        Without the watermark table ``updated_at`` is ``None``.
+        """
+        try:
+            with self._connect() as con:
+                with con.cursor() as cur:
+                    cur.execute(self._watermark_version_query(schema), (source, key))
+                    row = cur.fetchone()
+            return Watermark(*row) if row else None
+        except psycopg.errors.UndefinedTable:
+            pass
+        latest = self.get_watermark(source, key, schema)
+        return Watermark(latest, None) if latest is not None else None
+
+    def _fetch_latest(self, query: sql.Composed, params) -> datetime | None:
+        with self._connect() as con:
             with con.cursor() as cur:
-                cur.execute(query)
+                cur.execute(query, params)
                 row = cur.fetchone()
 
         return row[0] if row else None
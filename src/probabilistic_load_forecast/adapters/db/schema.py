@@ -0,0 +1,280 @@
+"""DDL for the tables managed by the PostgreSQL repositories.
+
+The repositories create their tables on first use, the Alembic migrations in
+``migrations/`` apply the same statements to existing databases.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+import psycopg
+from psycopg import sql
+
+LOAD_TABLE = "actual_total_load"
+WATERMARK_TABLE = "data_watermarks"
+
+
+def load_index_name(tablename: str) -> str:
+    return f"{tablename}_zone_start_idx"
+
+
+def load_table_ddl(
+    schema: str, tablename: str = LOAD_TABLE, partitioned: bool = False
+) -> list[sql.Composed]:
+    """Statements creating the load table and its range-read index.
+
+    The ``(zone_code, start_ts)`` index serves the repository's read query,
+    which filters on one zone and orders by ``start_ts``. A partitioned table
+    is range partitioned by ``start_ts``, see ``ensure_monthly_partitions``.
+    """
+    partition_clause = sql.SQL(" PARTITION BY RANGE (start_ts)" if partitioned else "")
+    return [
+        sql.SQL(
+            """
+            CREATE TABLE IF NOT EXISTS {} (
+                start_ts timestamptz NOT NULL,
+                end_ts timestamptz NOT NULL,
+                load_mw numeric(10, 2) NOT NULL,
+                created_at timestamp DEFAULT now() NULL,
+                zone_code varchar(30) DEFAULT '10YAT-APG------L'::character varying NULL,
+                CONSTRAINT unique_load_measurement_slot UNIQUE (start_ts, end_ts, zone_code)
+            ){};
+            """
+        ).format(sql.Identifier(schema, tablename), partition_clause),
+        sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} (zone_code, start_ts);").format(
+            sql.Identifier(load_index_name(tablename)),
+            sql.Identifier(schema, tablename),
+        ),
+    ]
+
+
+# Bucket length of the load roll-up tables kept next to every load table.
+LOAD_ROLLUP_GRAINS = {
+    "hourly": timedelta(hours=1),
+    "daily": timedelta(days=1),
+}
+
+
+def load_rollup_name(tablename: str, grain: str) -> str:
+    return f"{tablename}_{grain}"
+
+
+def load_rollup_ddl(schema: str, tablename: str, grain: str) -> sql.Composed:
+    """Statement creating the ``grain`` roll-up of a load table.
+
+    One row per zone and bucket holds the number of slots starting in the
+    bucket with the sum, minimum and maximum of their loads; mean, sum, min
+    and max of any coarser bucket follow from these. The sum is an unbounded
+    numeric, so reads from the roll-up match reads from the load table.
+    """
+    return sql.SQL(
+        """
+        CREATE TABLE IF NOT EXISTS {} (
+            zone_code varchar(30) NOT NULL,
+            bucket timestamptz NOT NULL,
+            slot_count integer NOT NULL,
+            load_sum numeric NOT NULL,
+            load_min numeric(10, 2) NOT NULL,
+            load_max numeric(10, 2) NOT NULL,
+            PRIMARY KEY (zone_code, bucket)
+        );
+        """
+    ).format(sql.Identifier(schema, load_rollup_name(tablename, grain)))
+
+
+def load_rollup_backfill(
+    schema: str, tablename: str, grain: str, origin: datetime
+) -> sql.Composed:
+    """Statement filling the ``grain`` roll-up from every slot of the load table.
+
+    Only migration 0005 creates the roll-ups, with this backfill, so a
+    roll-up that exists covers every slot. The writes keep it up to date.
+    """
+    return sql.SQL(
+        """
+        INSERT INTO {rollup} (zone_code, bucket, slot_count, load_sum, load_min, load_max)
+        SELECT zone_code, date_bin({stride}, start_ts, {origin}),
+               count(*), sum(load_mw), min(load_mw), max(load_mw)
+        FROM {table}
+        WHERE zone_code IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (zone_code, bucket) DO NOTHING;
+        """
+    ).format(
+        rollup=sql.Identifier(schema, load_rollup_name(tablename, grain)),
+        stride=sql.Literal(LOAD_ROLLUP_GRAINS[grain]),
+        origin=sql.Literal(origin),
+        table=sql.Identifier(schema, tablename),
+    )
+
+
+def weather_index_name(tablename: str) -> str:
+    return f"{tablename}_valid_time_brin"
+
+
+def weather_table_ddl(
+    schema: str, tablename: str, partitioned: bool = False
+) -> list[sql.Composed]:
+    """Statements creating an ERA5 country average table and its BRIN index.
+
+    Rows arrive in ``valid_time`` order, so a BRIN index on ``valid_time``
+    narrows range reads over all countries for a fraction of a B-tree's size.
+    A partitioned table is range partitioned by year on ``valid_time``, see
+    ``ensure_yearly_partitions``.
+    """
+    partition_clause = sql.SQL(" PARTITION BY RANGE (valid_time)" if partitioned else "")
+    return [
+        sql.SQL(
+            """
+            CREATE TABLE IF NOT EXISTS {} (
+                valid_time TIMESTAMPTZ NOT NULL,
+                value DOUBLE PRECISION NOT NULL,
+                stat TEXT NOT NULL CHECK (stat IN ('total', 'mean', 'instant')),
+                interval_seconds INTEGER NOT NULL DEFAULT 3600,
+                country_code VARCHAR(5) NOT NULL,
+                PRIMARY KEY (country_code, valid_time)
+            ){};
+            """
+        ).format(sql.Identifier(schema, tablename), partition_clause),
+        sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} USING brin (valid_time);").format(
+            sql.Identifier(weather_index_name(tablename)),
+            sql.Identifier(schema, tablename),
+        ),
+    ]
+
+
+def watermark_table_ddl(schema: str) -> sql.Composed:
+    """Statement creating the table of per-source, per-key latest timestamps.
+
+    ``source`` is the name of a data table and ``key`` the zone or country code
+    within it. The repositories advance ``latest_ts`` in the transaction that
+    writes the data, so reading it replaces a ``MAX()`` over the data table.
+    Every write stamps ``updated_at``, also one rewriting older rows only.
+    """
+    return sql.SQL(
+        """
+        CREATE TABLE IF NOT EXISTS {} (
+            source TEXT NOT NULL,
+            key TEXT NOT NULL,
+            latest_ts TIMESTAMPTZ NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (source, key)
+        );
+        """
+    ).format(sql.Identifier(schema, WATERMARK_TABLE))
+
+
+def month_starts(start: datetime, end: datetime) -> Iterator[datetime]:
+    """Yield the UTC month starts of every month touched by [start, end]."""
+    start = start.astimezone(timezone.utc)
+    end = end.astimezone(timezone.utc)
+    month = datetime(start.year, start.month, 1, tzinfo=timezone.utc)
+    while month <= end:
+        yield month
+        month = _next_month(month)
+
+
+def _next_month(month: datetime) -> datetime:
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def monthly_partition_name(tablename: str, month: datetime) -> str:
+    return f"{tablename}_p{month:%Y%m}"
+
+
+def monthly_partition_ddl(schema: str, tablename: str, month: datetime) -> sql.Composed:
+    """Statement creating the partition of ``tablename`` holding ``month``."""
+    return _partition_ddl(
+        schema, tablename, monthly_partition_name(tablename, month), month, _next_month(month)
+    )
+
+
+def year_starts(start: datetime, end: datetime) -> Iterator[datetime]:
+    """Yield the UTC year starts of every year touched by [start, end]."""
+    start = start.astimezone(timezone.utc)
+    end = end.astimezone(timezone.utc)
+    for year in range(start.year, end.year + 1):
+        yield datetime(year, 1, 1, tzinfo=timezone.utc)
+
+
+def yearly_partition_name(tablename: str, year: datetime) -> str:
+    return f"{tablename}_y{year:%Y}"
+
+
+def yearly_partition_ddl(schema: str, tablename: str, year: datetime) -> sql.Composed:
+    """Statement creating the partition of ``tablename`` holding ``year``."""
+    return _partition_ddl(
+        schema,
+        tablename,
+        yearly_partition_name(tablename, year),
+        year,
+        year.replace(year=year.year + 1),
+    )
+
+
+def _partition_ddl(
+    schema: str, tablename: str, partition: str, lower: datetime, upper: datetime
+) -> sql.Composed:
+    return sql.SQL(
+        "CREATE TABLE IF NOT EXISTS {} PARTITION OF {} FOR VALUES FROM ({}) TO ({});"
+    ).format(
+        sql.Identifier(schema, partition),
+        sql.Identifier(schema, tablename),
+        sql.Literal(lower),
+        sql.Literal(upper),
+    )
+
+
+IS_PARTITIONED_QUERY = """
+    SELECT c.relkind = 'p'
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %s AND c.relname = %s
+"""
+
+
+EXISTING_TABLES_QUERY = """
+    SELECT c.relname
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %s AND c.relname = ANY(%s)
+"""
+
+
+def is_partitioned(cur: psycopg.Cursor, schema: str, tablename: str) -> bool:
+    """Whether the table exists and is declaratively partitioned."""
+    cur.execute(IS_PARTITIONED_QUERY, (schema, tablename))
+    row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def monthly_partitions_ddl(
+    schema: str, tablename: str, start: datetime, end: datetime
+) -> list[sql.Composed]:
+    """Statements creating the monthly partitions covering [start, end], if missing."""
+    return [monthly_partition_ddl(schema, tablename, month) for month in month_starts(start, end)]
+
+
+def yearly_partitions_ddl(
+    schema: str, tablename: str, start: datetime, end: datetime
+) -> list[sql.Composed]:
+    """Statements creating the yearly partitions covering [start, end], if missing."""
+    return [yearly_partition_ddl(schema, tablename, year) for year in year_starts(start, end)]
+
+
+def ensure_monthly_partitions(
+    cur: psycopg.Cursor, schema: str, tablename: str, start: datetime, end: datetime
+) -> None:
+    """Create the missing monthly partitions covering [start, end]."""
+    for statement in monthly_partitions_ddl(schema, tablename, start, end):
+        cur.execute(statement)
+
+
+def ensure_yearly_partitions(
+    cur: psycopg.Cursor, schema: str, tablename: str, start: datetime, end: datetime
+) -> None:
+    """Create the missing yearly partitions covering [start, end]."""
+    for statement in yearly_partitions_ddl(schema, tablename, start, end):
+        cur.execute(statement)
@@ -0,0 +1,61 @@
+"""Stage timings of the repository reads for Prometheus and ``Server-Timing``.
+
+A read is split into the stages ``connect`` (pool checkout), ``execute``,
+``fetch`` and ``map`` (rows to domain objects or arrays); the API adds
+``serialize`` for writing the response body. Every stage is observed in a
+histogram labelled by operation. While a request is tracked with
+``track_stages`` the durations are also summed per stage for that request,
+the API reports them in its ``Server-Timing`` header.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator
+
+from prometheus_client import Counter, Histogram
+
+STAGE_SECONDS = Histogram(
+    "plf_read_stage_seconds",
+    "Duration of the connect, execute, fetch, map and serialize stages of reads.",
+    ["operation", "stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+ROWS_RETURNED = Counter(
+    "plf_repository_rows_total",
+    "Rows returned by repository reads.",
+    ["operation"],
+)
+
+_request_stages: ContextVar[dict[str, float] | None] = ContextVar(
+    "plf_request_stages", default=None
+)
+
+
+@contextmanager
+def track_stages() -> Iterator[dict[str, float]]:
+    """Sum the stage durations of the current context into the yielded dict."""
+    stages: dict[str, float] = {}
+    token = _request_stages.set(stages)
+    try:
+        yield stages
+    finally:
+        _request_stages.reset(token)
+
+
+@contextmanager
+def stage(name: str, operation: str) -> Iterator[None]:
+    """Time the enclosed block as stage ``name`` of ``operation``."""
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        STAGE_SECONDS.labels(operation, name).observe(elapsed)
+        stages = _request_stages.get()
+        if stages is not None:
+            stages[name] = stages.get(name, 0.0) + elapsed
+
+
+def record_rows(operation: str, rows: int) -> None:
+    ROWS_RETURNED.labels(operation).inc(rows)
@@ -4,12 +4,17 @@ the ENTSO-E API for probabilistic load forecasting."""
 
 from .provider import EntsoeDataProvider
 from .fetcher import EntsoeFetcher
-from .mapper import XmlLoadMapper
+from .mapper import IterparseLoadMapper, XmlLoadMapper
 from .api_client import EntsoeAPIClient
+from .resilience import CircuitBreaker, CircuitOpenError, TokenBucket
 
 __all__ = [
     "EntsoeDataProvider",
     "EntsoeFetcher",
     "XmlLoadMapper",
+    "IterparseLoadMapper",
     "EntsoeAPIClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "TokenBucket",
 ]
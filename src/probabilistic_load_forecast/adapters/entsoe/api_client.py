@@ -3,35 +3,152 @@ This module contains the basic logic to fetch data from the public ENTSOE API En
 """
 
 import logging
+import time
 import requests
+from requests.adapters import HTTPAdapter
+
+from probabilistic_load_forecast.adapters.entsoe.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    backoff_delay,
+    retry_after_seconds,
+)
 
 TIMEOUT = 30
+# ENTSO-E allows 400 requests per minute and user, stay clearly below.
+DEFAULT_RATE = 4.0
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
 logger = logging.getLogger(__name__)
 
 
 class EntsoeAPIClient:
-    """Client to interact with the ENTSO-E API."""
+    """Client to interact with the ENTSO-E API.
+
+    All requests go through one ``requests.Session``, so connections to the
+    API are kept alive and reused. ``pool_size`` should be at least the
+    number of threads fetching through the client at the same time.
 
-    def __init__(self, endpoint, security_token):
+    Requests are paced by ``rate_limiter``. Throttling (429), server errors
+    and connection errors are retried up to ``max_retries`` times after the
+    ``Retry-After`` of the response or an exponential backoff with jitter,
+    a 429 pauses the rate limiter for every thread. Server and connection
+    errors count towards ``circuit_breaker``, while it is open requests fail
+    without being sent. Any other answer, a 429 included, closes it again.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        security_token,
+        pool_size: int = 10,
+        rate_limiter: TokenBucket | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_cap: float = BACKOFF_CAP,
+        sleep=time.sleep,
+    ):
         self._endpoint = endpoint
         self._security_token = security_token
         self._timeout = TIMEOUT
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._rate_limiter = rate_limiter or TokenBucket(DEFAULT_RATE)
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_cap = backoff_cap
+        self._sleep = sleep
 
     def fetch_load_data(self, params):
-        """Fetch load data from ENTSO-E API with given parameters."""
-        params["securityToken"] = self._security_token
-        try:
-            response = requests.get(
-                url=self._endpoint, params=params, timeout=self._timeout
-            )
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            logging.warning(
-                "An error occured while fetching the load data: "
-                "Parameters: %s"
-                "Error: %s",
-                params,
-                e,
+        """Fetch load data from ENTSO-E API with given parameters.
+
+        Returns the response text, or ``None`` once the request failed for
+        good: a non-retryable status, retries exhausted or an open breaker.
+        """
+        logged_params = dict(params)
+        params = {**params, "securityToken": self._security_token}
+        error = None
+
+        for attempt in range(self._max_retries + 1):
+            self._rate_limiter.acquire()
+            try:
+                self._circuit_breaker.before_call()
+            except CircuitOpenError as e:
+                error = e
+                break
+
+            retry_after = None
+            throttled = False
+            try:
+                response = self._session.get(
+                    url=self._endpoint, params=params, timeout=self._timeout
+                )
+            except requests.exceptions.RequestException as e:
+                self._circuit_breaker.record_failure()
+                error = e
+            else:
+                if response.ok:
+                    self._circuit_breaker.record_success()
+                    return response.text
+                error = requests.exceptions.HTTPError(
+                    f"{response.status_code} {response.reason}", response=response
+                )
+                if response.status_code not in RETRYABLE_STATUS:
+                    # The API answered, a bad request says nothing about its health.
+                    self._circuit_breaker.record_success()
+                    break
+                retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                if response.status_code == 429:
+                    # Throttling shows the API is alive, it also ends a half-open trial.
+                    self._circuit_breaker.record_success()
+                    throttled = True
+                    self._rate_limiter.pause(
+                        retry_after if retry_after is not None else self._delay(attempt)
+                    )
+                else:
+                    self._circuit_breaker.record_failure()
+
+            if attempt == self._max_retries:
+                break
+            if throttled:
+                # The paused rate limiter holds back the retry and every other thread.
+                logger.info("ENTSO-E throttled the request, retrying. Parameters: %s", logged_params)
+                continue
+            delay = retry_after if retry_after is not None else self._delay(attempt)
+            logger.info(
+                "Retrying ENTSO-E request in %.1fs after: %s Parameters: %s",
+                delay,
+                error,
+                logged_params,
             )
-            return None
+            self._sleep(delay)
+
+        logger.warning(
+            "An error occured while fetching the load data: "
+            "Parameters: %s "
+            "Error: %s",
+            logged_params,
+            error,
+        )
+        return None
+
+    def _delay(self, attempt: int) -> float:
+        return backoff_delay(attempt, self._backoff_base, self._backoff_cap)
+
+    def close(self):
+        """Close the pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -2,11 +2,13 @@
 This module contains the logic for fetching data from the ENTSOE API
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from datetime import timedelta, datetime
 from probabilistic_load_forecast.adapters.entsoe.api_client import EntsoeAPIClient
-from probabilistic_load_forecast.domain.model import LoadMeasurement
 from probabilistic_load_forecast.adapters import utils
+from probabilistic_load_forecast.domain.exceptions import IncompleteDataError
+from probabilistic_load_forecast.domain.model import TimeInterval
 
 MAX_TIMEINTERVAL = timedelta(days=365)
 ENTSOE_FMT = "%Y%m%d%H%M"
@@ -24,12 +26,19 @@ class EntsoeFetcher:
     """
     This class wraps an EntsoeAPIClient and adds logic to handle
     API constraints, such as chunking requests.
+
+    With ``max_concurrency`` above 1 the chunks are requested from a thread
+    pool of that size, so a long backfill is no longer bounded by one round
+    trip after another. Keep it low, ENTSO-E limits the requests per user.
     """
 
-    def __init__(self, api_client: EntsoeAPIClient):
+    def __init__(self, api_client: EntsoeAPIClient, max_concurrency: int = 1):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self._api_client = api_client
+        self._max_concurrency = max_concurrency
 
-    def fetch(self, start, end, **kwargs) -> List[LoadMeasurement]:
+    def fetch(self, start, end, **kwargs) -> List[str]:
         """Fetches the data from the ENTSOE API given the timeframe"
         "and handles the chunking logic if the timeframe is larger then the API limit.
 
@@ -39,27 +48,55 @@ class EntsoeFetcher:
             **kwargs: Optional source-specific parameters.
 
         Returns:
-            List[Measurement]: The measurements fetched from the data source.
+            List[str]: The response documents of the chunks in chronological order.
+
+        Raises:
+            IncompleteDataError: Some chunks failed for good. ``failed_intervals``
+                holds their time windows and ``partial`` the documents of the
+                others, in order.
         """
-        results = []
+        intervals = self.chunk_intervals(start, end)
+        chunks = [self._chunk_params(interval, **kwargs) for interval in intervals]
+        if self._max_concurrency == 1 or len(chunks) < 2:
+            results = [self._api_client.fetch_load_data(params) for params in chunks]
+        else:
+            workers = min(self._max_concurrency, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="entsoe") as pool:
+                # map returns the results in the order of the chunks.
+                results = list(pool.map(self._api_client.fetch_load_data, chunks))
+
+        failed = [interval for interval, result in zip(intervals, results) if result is None]
+        if failed:
+            raise IncompleteDataError(
+                failed, [result for result in results if result is not None]
+            )
+        return results
+
+    @staticmethod
+    def chunk_intervals(start, end) -> List[TimeInterval]:
+        """The chronological chunks of at most ``MAX_TIMEINTERVAL``, in UTC."""
+        intervals = []
         chunk_start = start
 
         while chunk_start < end:
             chunk_end = min(end, chunk_start + MAX_TIMEINTERVAL)
+            intervals.append(TimeInterval(utils.to_utc(chunk_start), utils.to_utc(chunk_end)))
+            chunk_start = chunk_end
 
-            period_start_utc = utils.to_utc(chunk_start)
-            period_end_utc = utils.to_utc(chunk_end)
-
-            query_params = {
-                "documentType": "A65",
-                "processType": "A16",
-                "outBiddingZone_Domain": "10YAT-APG------L",
-                "periodStart": period_start_utc.strftime(ENTSOE_FMT),
-                "periodEnd": floor_to_minutes(period_end_utc, 15).strftime(ENTSOE_FMT),
-                **kwargs,
-            }
-            results.append(self._api_client.fetch_load_data(query_params))
+        return intervals
 
-            chunk_start = chunk_end
+    @staticmethod
+    def _chunk_params(interval: TimeInterval, **kwargs) -> dict:
+        return {
+            "documentType": "A65",
+            "processType": "A16",
+            "outBiddingZone_Domain": "10YAT-APG------L",
+            "periodStart": interval.start.strftime(ENTSOE_FMT),
+            "periodEnd": floor_to_minutes(interval.end, 15).strftime(ENTSOE_FMT),
+            **kwargs,
+        }
 
-        return results
+    @classmethod
+    def chunk_params(cls, start, end, **kwargs) -> List[dict]:
+        """Query parameters of the chronological chunks of at most ``MAX_TIMEINTERVAL``."""
+        return [cls._chunk_params(interval, **kwargs) for interval in cls.chunk_intervals(start, end)]
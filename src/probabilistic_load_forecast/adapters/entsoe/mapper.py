@@ -1,12 +1,22 @@
 """Mapper for ENTSO-E XML load data to LoadMeasurement objects."""
 
-from datetime import datetime, timedelta
+import io
+from array import array
+from datetime import datetime, timedelta, timezone
 from typing import List
+import numpy as np
 from lxml import etree #type: ignore
 from probabilistic_load_forecast.domain.model import (
-    LoadMeasurement, TimeInterval, resolve_bidding_zone
+    RESOLUTION_LENGTH,
+    LoadArraySeries,
+    LoadMeasurement,
+    Resolution,
+    TimeInterval,
+    resolve_bidding_zone,
 )
 
+NAMESPACE = "urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0"
+
 
 class XmlLoadMapper:
     """Mapper to convert ENTSO-E XML load data into LoadMeasurement objects."""
@@ -15,7 +25,7 @@ class XmlLoadMapper:
     def map(xml: str) -> List[LoadMeasurement]:
         """Map ENTSO-E XML load data to a list of LoadMeasurement objects."""
 
-        ns = {"ns": "urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0"}
+        ns = {"ns": NAMESPACE}
         tree = etree.fromstring(xml.encode())  # pylint: disable=c-extension-no-member
         # Find Period
         period = tree.find(".//ns:Period", namespaces=ns)
@@ -46,3 +56,156 @@ class XmlLoadMapper:
             )
             result.append(load_measure)
         return result
+
+
+def _tag(name: str) -> str:
+    return f"{{{NAMESPACE}}}{name}"
+
+
+POINT, PERIOD, TIME_SERIES = _tag("Point"), _tag("Period"), _tag("TimeSeries")
+ZONE, CURVE_TYPE = _tag("outBiddingZone_Domain.mRID"), _tag("curveType")
+POSITION, QUANTITY = _tag("position"), _tag("quantity")
+PERIOD_START = f"{_tag('timeInterval')}/{_tag('start')}"
+PERIOD_END = f"{_tag('timeInterval')}/{_tag('end')}"
+RESOLUTION = _tag("resolution")
+
+# ENTSO-E resolution codes with a fixed length. P1M and P1Y are not used by
+# load documents and have no fixed length, they are rejected.
+ENTSOE_RESOLUTIONS = {
+    "PT15M": Resolution.PT15M,
+    "PT30M": Resolution.PT30M,
+    "PT60M": Resolution.PT1H,
+    "P1D": Resolution.P1D,
+    "P7D": Resolution.P1W,
+}
+# Curve type A03: a point holds until the next position, omitted positions repeat it.
+VARIABLE_SIZED_BLOCK = "A03"
+
+
+def _utc_datetime64(value: str) -> np.datetime64:
+    start = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return np.datetime64(start.astimezone(timezone.utc).replace(tzinfo=None), "us")
+
+
+def expand_period(
+    start: np.datetime64,
+    end: np.datetime64 | None,
+    step: np.timedelta64,
+    positions: np.ndarray,
+    quantities: np.ndarray,
+    curve_type: str | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Slot starts and values of one Period.
+
+    For curve type A03 every point is repeated over the positions up to the
+    next point, the last one up to the end of the period. Other curve types
+    keep one slot per point.
+    """
+    if curve_type == VARIABLE_SIZED_BLOCK and len(positions):
+        order = np.argsort(positions, kind="stable")
+        positions, quantities = positions[order], quantities[order]
+        last = positions[-1] if end is None else (end - start) // step
+        repeats = np.diff(np.append(positions, last + 1))
+        quantities = np.repeat(quantities, repeats)
+        positions = np.arange(positions[0], positions[0] + len(quantities))
+    return start + (positions - 1) * step, quantities
+
+
+class IterparseLoadMapper:
+    """Streaming mapper for ENTSO-E load documents.
+
+    The document is read with ``etree.iterparse`` instead of being built
+    into a tree first. Every ``Point`` is cleared right after its position
+    and quantity were appended to typed arrays, so memory stays flat for
+    year-long documents, and every ``TimeSeries`` and ``Period`` of the
+    document is mapped, not just the first one. Periods are converted to
+    slot starts with NumPy, whatever their resolution and curve type.
+    """
+
+    @staticmethod
+    def map_arrays(xml: str | bytes) -> List[LoadArraySeries]:
+        """Map an ENTSO-E document to one LoadArraySeries per bidding zone and resolution."""
+        if isinstance(xml, str):
+            xml = xml.encode()
+
+        periods: dict[tuple[str, Resolution], list[tuple[np.ndarray, np.ndarray]]] = {}
+        zone_code = curve_type = None
+        positions, quantities = array("q"), array("d")
+
+        for _, elem in etree.iterparse(  # pylint: disable=c-extension-no-member
+            io.BytesIO(xml),
+            events=("end",),
+            tag=(POSITION, QUANTITY, POINT, PERIOD, TIME_SERIES, ZONE, CURVE_TYPE),
+        ):
+            tag = elem.tag
+            if tag == POSITION:
+                positions.append(int(elem.text))
+            elif tag == QUANTITY:
+                quantities.append(float(elem.text))
+            elif tag == POINT:
+                elem.clear()
+                # Drop the cleared Point before this one from the Period as well,
+                # its timeInterval and resolution are still needed.
+                previous = elem.getprevious()
+                if previous is not None and previous.tag == POINT:
+                    elem.getparent().remove(previous)
+            elif tag == PERIOD:
+                code = elem.findtext(RESOLUTION)
+                if code not in ENTSOE_RESOLUTIONS:
+                    raise ValueError(f"Unsupported resolution {code}")
+                resolution = ENTSOE_RESOLUTIONS[code]
+                end = elem.findtext(PERIOD_END)
+                periods.setdefault((zone_code, resolution), []).append(
+                    expand_period(
+                        _utc_datetime64(elem.findtext(PERIOD_START)),
+                        None if end is None else _utc_datetime64(end),
+                        np.timedelta64(RESOLUTION_LENGTH[resolution], "us"),
+                        np.frombuffer(positions, dtype=np.int64),
+                        np.frombuffer(quantities, dtype=np.float64),
+                        curve_type,
+                    )
+                )
+                positions, quantities = array("q"), array("d")
+                elem.clear()
+            elif tag == ZONE:
+                zone_code = elem.text
+            elif tag == CURVE_TYPE:
+                curve_type = elem.text
+            else:
+                curve_type = None
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+        result = []
+        for (code, resolution), zone_periods in periods.items():
+            start_ts = np.concatenate([start_ts for start_ts, _ in zone_periods])
+            load_mw = np.concatenate([load_mw for _, load_mw in zone_periods])
+            order = np.argsort(start_ts, kind="stable")
+            result.append(
+                LoadArraySeries(
+                    bidding_zone=resolve_bidding_zone(code),
+                    resolution=resolution,
+                    start_ts=start_ts[order],
+                    load_mw=load_mw[order],
+                )
+            )
+        return result
+
+    @classmethod
+    def map(cls, xml: str | bytes) -> List[LoadMeasurement]:
+        """Map an ENTSO-E document to a list of LoadMeasurement objects."""
+        result = []
+        for series in cls.map_arrays(xml):
+            step = RESOLUTION_LENGTH[series.resolution]
+            starts = series.start_ts.astype("datetime64[us]").tolist()
+            for start, load_mw in zip(starts, series.load_mw.tolist()):
+                start = start.replace(tzinfo=timezone.utc)
+                result.append(
+                    LoadMeasurement(
+                        bidding_zone=series.bidding_zone,
+                        interval=TimeInterval(start, start + step),
+                        load_mw=load_mw,
+                    )
+                )
+        return result
@@ -1,7 +1,13 @@
 """Data provider adapter for ENTSO-E load data."""
 
 from itertools import chain
+from typing import List
+
+import numpy as np
+
 from probabilistic_load_forecast.application.ports import DataProvider
+from probabilistic_load_forecast.domain.exceptions import IncompleteDataError
+from probabilistic_load_forecast.domain.model import LoadArraySeries, Resolution
 
 
 class EntsoeDataProvider(DataProvider):
@@ -12,6 +18,59 @@ class EntsoeDataProvider(DataProvider):
         self.mapper = mapper
 
     def get_data(self, interval, **kwargs):
-        raw_data = self.fetcher.fetch(interval.start, interval.end, **kwargs)
+        """Measurements of ``interval``.
+
+        Raises ``IncompleteDataError`` with the measurements of the fetched
+        chunks as ``partial`` when some chunks could not be fetched.
+        """
+        try:
+            raw_data = self.fetcher.fetch(interval.start, interval.end, **kwargs)
+        except IncompleteDataError as error:
+            raise IncompleteDataError(
+                error.failed_intervals, list(self._map(error.partial))
+            ) from error
+        return self._map(raw_data)
+
+    def get_arrays(self, interval, **kwargs) -> List[LoadArraySeries]:
+        """Load of ``interval`` as one LoadArraySeries per bidding zone and resolution.
+
+        Needs a mapper with ``map_arrays``, no LoadMeasurement is built.
+        Raises ``IncompleteDataError`` like ``get_data``, with the series of
+        the fetched chunks as ``partial``.
+        """
+        try:
+            raw_data = self.fetcher.fetch(interval.start, interval.end, **kwargs)
+        except IncompleteDataError as error:
+            raise IncompleteDataError(
+                error.failed_intervals, self._map_arrays(error.partial)
+            ) from error
+        return self._map_arrays(raw_data)
+
+    def _map(self, raw_data):
         mapped_data = [self.mapper.map(data) for data in raw_data if data is not None]
         return chain.from_iterable(mapped_data)
+
+    def _map_arrays(self, raw_data) -> List[LoadArraySeries]:
+        """Concatenate the series of every fetched document per zone and resolution."""
+        chunks: dict[tuple[str, Resolution], list[LoadArraySeries]] = {}
+        for data in raw_data:
+            if data is None:
+                continue
+            for series in self.mapper.map_arrays(data):
+                key = (series.bidding_zone.eic_code, series.resolution)
+                chunks.setdefault(key, []).append(series)
+
+        result = []
+        for zone_series in chunks.values():
+            start_ts = np.concatenate([series.start_ts for series in zone_series])
+            load_mw = np.concatenate([series.load_mw for series in zone_series])
+            order = np.argsort(start_ts, kind="stable")
+            result.append(
+                LoadArraySeries(
+                    bidding_zone=zone_series[0].bidding_zone,
+                    resolution=zone_series[0].resolution,
+                    start_ts=start_ts[order],
+                    load_mw=load_mw[order],
+                )
+            )
+        return result
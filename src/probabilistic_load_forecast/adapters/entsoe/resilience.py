@@ -0,0 +1,157 @@
+"""
+Rate limiting, retry delays and circuit breaking for the ENTSO-E API client.
+
+ENTSO-E throttles a user that sends too many requests and answers with 429
+until the penalty has passed. Pacing all threads through one token bucket
+below the limit, and pausing the whole bucket for the ``Retry-After`` of a
+429, keeps the importer out of that penalty, so it sustains a higher
+throughput than workers that retry independently.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of a request while the circuit breaker is open."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every thread of a client.
+
+    Args:
+        rate: Tokens added per second, the sustained requests per second.
+        capacity: Tokens the bucket holds at most, the size of a burst.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - max(self._updated, self._paused_until))
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(now, self._updated)
+
+    def acquire(self) -> None:
+        """Take a token, blocking until it is available.
+
+        The token is reserved right away, so waiting threads are served in
+        the order they arrived.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            available_at = max(now, self._paused_until) + max(0.0, -self._tokens) / self.rate
+        if available_at > now:
+            self._sleep(available_at - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds``, no burst builds up meanwhile."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+class CircuitBreaker:
+    """Stops requests after ``failure_threshold`` consecutive failures.
+
+    The open breaker rejects calls for ``reset_timeout`` seconds, then lets
+    one trial call through. Its success closes the breaker again, its
+    failure opens it for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(self._clock())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may be made now."""
+        with self._lock:
+            state = self._state(self._clock())
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return
+        raise CircuitOpenError("ENTSO-E circuit breaker is open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_running = False
+
+
+def backoff_delay(
+    attempt: int, base: float, cap: float, rng: Callable[[], float] = random.random
+) -> float:
+    """Exponential backoff with full jitter for the zero-based ``attempt``."""
+    return rng() * min(cap, base * 2**attempt)
+
+
+def retry_after_seconds(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header, in seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
@@ -2,6 +2,8 @@
 
 from datetime import datetime, timezone
 
+import numpy as np
+
 
 def to_utc(dt: datetime) -> datetime:
     """Convert any aware datetime to UTC."""
@@ -15,3 +17,13 @@ def remove_tz_info(dt: datetime) -> datetime:
     if dt.tzinfo is not None:
         dt = dt.replace(tzinfo=None)
     return dt
+
+
+def datetime_bounds(values: np.ndarray) -> tuple[datetime | None, datetime | None]:
+    """Earliest and latest value of a UTC datetime64 array as aware datetimes."""
+    if not len(values):
+        return None, None
+    values = np.asarray(values, dtype="datetime64[us]")
+    return tuple(
+        value.item().replace(tzinfo=timezone.utc) for value in (values.min(), values.max())
+    )
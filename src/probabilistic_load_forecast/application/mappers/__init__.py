@@ -1,7 +1,27 @@
 from .load_series import(
-    load_series_to_dataframe
+    load_series_to_dataframe,
+    load_array_series_to_dataframe,
 )
 
 from .era5_series import(
-    era5_series_to_dataframe
-)
\ No newline at end of file
+    era5_series_to_dataframe,
+    era5_frame_to_dataframe,
+)
+
+from .arrow import(
+    load_array_series_to_arrow,
+    era5_frame_to_arrow,
+    resampled_series_to_arrow,
+    IpcStreamEncoder,
+    arrow_to_ipc_stream,
+    arrow_to_parquet,
+)
+
+from .columnar import(
+    load_array_series_to_columnar,
+    load_array_batch_to_columnar,
+    era5_frame_to_columnar,
+    resampled_series_to_columnar,
+    load_array_series_to_ndjson,
+    columnar_to_json,
+)
@@ -0,0 +1,122 @@
+"""Arrow tables of the columnar domain types, used for compact API responses.
+
+Every table has two columns, a UTC ``timestamp`` and the value, and carries
+its zone or area in the schema metadata instead of repeating it per row.
+"""
+
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from probabilistic_load_forecast.domain.model import (
+    Era5Frame,
+    LoadArraySeries,
+    ResampledSeries,
+    WeatherVariable,
+)
+
+TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+
+
+def load_array_series_to_arrow(load_series: LoadArraySeries) -> pa.Table:
+    """Table with the slot start ``timestamp`` and ``load_mw`` columns."""
+    schema = pa.schema(
+        [("timestamp", TIMESTAMP_TYPE), ("load_mw", pa.float64())],
+        metadata={
+            "eic_code": load_series.bidding_zone.eic_code,
+            "resolution": str(load_series.resolution),
+        },
+    )
+    return pa.Table.from_arrays(
+        [
+            pa.array(load_series.start_ts.astype("datetime64[us]"), type=TIMESTAMP_TYPE),
+            pa.array(load_series.load_mw, type=pa.float64()),
+        ],
+        schema=schema,
+    )
+
+
+def era5_frame_to_arrow(frame: Era5Frame, variable: WeatherVariable) -> pa.Table:
+    """Table with the period start ``timestamp`` and ``value`` of one variable."""
+    schema = pa.schema(
+        [("timestamp", TIMESTAMP_TYPE), ("value", pa.float64())],
+        metadata={
+            "variable": variable.value,
+            "area_code": frame.area.code.value,
+            "resolution": str(frame.resolution),
+        },
+    )
+    return pa.Table.from_arrays(
+        [
+            pa.array(frame.timestamps.astype("datetime64[us]"), type=TIMESTAMP_TYPE),
+            # NaN marks hours the variable has no value for, keep them as nulls.
+            pa.array(frame.values[variable], type=pa.float64(), from_pandas=True),
+        ],
+        schema=schema,
+    )
+
+
+def resampled_series_to_arrow(series: ResampledSeries, metadata: dict[str, str]) -> pa.Table:
+    """Table with the bucket start ``timestamp``, ``count`` and one column per aggregate.
+
+    ``metadata`` names the zone or area, the resolution is added to it.
+    """
+    schema = pa.schema(
+        [("timestamp", TIMESTAMP_TYPE), ("count", pa.int64())]
+        + [(name, pa.float64()) for name in series.values],
+        metadata={**metadata, "resolution": str(series.resolution)},
+    )
+    return pa.Table.from_arrays(
+        [
+            pa.array(series.timestamps.astype("datetime64[us]"), type=TIMESTAMP_TYPE),
+            pa.array(series.counts, type=pa.int64()),
+        ]
+        + [
+            pa.array(values, type=pa.float64(), from_pandas=True)
+            for values in series.values.values()
+        ],
+        schema=schema,
+    )
+
+
+class IpcStreamEncoder:
+    """Encode record batches as one Arrow IPC stream, piece by piece.
+
+    ``write`` returns the bytes of every batch as soon as it is written, the
+    first call prefixed with the schema, and ``close`` the end-of-stream
+    marker. Concatenated they form a stream ``pa.ipc.open_stream`` reads.
+    """
+
+    def __init__(self, schema: pa.Schema):
+        self._buffer = io.BytesIO()
+        self._writer = pa.ipc.new_stream(self._buffer, schema)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def write(self, table: pa.Table) -> bytes:
+        self._writer.write_table(table)
+        return self._drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._drain()
+
+
+def arrow_to_ipc_stream(table: pa.Table) -> bytes:
+    """Serialize a table in the Arrow IPC streaming format."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_to_parquet(table: pa.Table) -> bytes:
+    """Serialize a table as a single Parquet file."""
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="zstd")
+    return buffer.getvalue()
@@ -0,0 +1,118 @@
+"""Compact columnar JSON of the columnar domain types.
+
+The series metadata is written once, followed by parallel ``timestamps`` and
+``values`` arrays. Timestamps are ISO 8601 strings in UTC or, with
+``epoch=True``, integer Unix seconds. The NumPy arrays are handed to orjson
+as they are, so no per-row Python objects are created.
+
+Streamed responses use newline-delimited JSON instead, one object per row,
+so every chunk of rows can be written as soon as it is read.
+"""
+
+import numpy as np
+import orjson
+
+from probabilistic_load_forecast.domain.model import (
+    Era5Frame,
+    LoadArrayBatch,
+    LoadArraySeries,
+    ResampledSeries,
+    WeatherVariable,
+)
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _timestamps(timestamps: np.ndarray, epoch: bool) -> np.ndarray:
+    if epoch:
+        return timestamps.astype("datetime64[s]").astype(np.int64)
+    # orjson writes datetime64 arrays as RFC 3339 strings itself.
+    return timestamps.astype("datetime64[s]")
+
+
+def load_array_series_to_columnar(load_series: LoadArraySeries, epoch: bool = False) -> dict:
+    """Zone, resolution and the slot starts with their loads."""
+    zone = load_series.bidding_zone
+    return {
+        "bidding_zone": {
+            "eic_code": zone.eic_code,
+            "display_name": zone.display_name,
+            "country_code": zone.country_code.value,
+        },
+        "resolution": str(load_series.resolution),
+        "timestamps": _timestamps(load_series.start_ts, epoch),
+        "values": np.ascontiguousarray(load_series.load_mw, dtype=np.float64),
+    }
+
+
+def load_array_batch_to_columnar(batch: LoadArrayBatch, epoch: bool = False) -> dict:
+    """Interval and, keyed by EIC code, every zone's arrays and missing slots."""
+    return {
+        "start": batch.interval.start,
+        "end": batch.interval.end,
+        "zones": {
+            eic_code: {
+                "display_name": series.bidding_zone.display_name,
+                "country_code": series.bidding_zone.country_code.value,
+                "resolution": str(series.resolution),
+                "missing_slots": batch.missing_slots[eic_code],
+                "timestamps": _timestamps(series.start_ts, epoch),
+                "values": np.ascontiguousarray(series.load_mw, dtype=np.float64),
+            }
+            for eic_code, series in batch.series.items()
+        },
+    }
+
+
+def era5_frame_to_columnar(
+    frame: Era5Frame, variable: WeatherVariable, epoch: bool = False
+) -> dict:
+    """Area, variable, resolution and the period starts with one variable's values.
+
+    Hours without a value are written as ``null``.
+    """
+    return {
+        "area_code": frame.area.code.value,
+        "variable": variable.value,
+        "resolution": str(frame.resolution),
+        "timestamps": _timestamps(frame.timestamps, epoch),
+        # orjson serializes NaN as null.
+        "values": np.ascontiguousarray(frame.values[variable], dtype=np.float64),
+    }
+
+
+def resampled_series_to_columnar(series: ResampledSeries, epoch: bool = False) -> dict:
+    """Resolution, the bucket starts, their value counts and one array per aggregate.
+
+    Aggregates without a value, such as the mean of only missing values, are
+    written as ``null``.
+    """
+    return {
+        "resolution": str(series.resolution),
+        "timestamps": _timestamps(series.timestamps, epoch),
+        "counts": np.ascontiguousarray(series.counts, dtype=np.int64),
+        "values": {
+            name: np.ascontiguousarray(values, dtype=np.float64)
+            for name, values in series.values.items()
+        },
+    }
+
+
+def load_array_series_to_ndjson(load_series: LoadArraySeries, epoch: bool = False) -> bytes:
+    """One ``{"timestamp": ..., "load_mw": ...}`` line per slot."""
+    timestamps = _timestamps(load_series.start_ts, epoch).tolist()
+    loads = np.asarray(load_series.load_mw, dtype=np.float64).tolist()
+    # orjson keeps a few KiB allocated per returned object, so the lines are
+    # appended one by one instead of being collected for a join.
+    body = bytearray()
+    for timestamp, load_mw in zip(timestamps, loads):
+        body += orjson.dumps(
+            {"timestamp": timestamp, "load_mw": load_mw},
+            option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return bytes(body)
+
+
+def columnar_to_json(payload: dict) -> bytes:
+    """Serialize a columnar payload with orjson."""
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from probabilistic_load_forecast.domain.model import (
+    Era5Frame,
     Era5Series,
     InstantWeatherValue,
 )
@@ -24,3 +25,12 @@ def era5_series_to_dataframe(series: Era5Series):
     return df
 
 
+
+
+def era5_frame_to_dataframe(frame: Era5Frame) -> pd.DataFrame:
+    """Wide frame indexed by the UTC period start with one column per variable."""
+    index = pd.DatetimeIndex(frame.timestamps, name="valid_time").tz_localize("UTC")
+    return pd.DataFrame(
+        {variable.value: values for variable, values in frame.values.items()},
+        index=index,
+    )
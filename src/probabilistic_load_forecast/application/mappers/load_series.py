@@ -19,9 +19,19 @@ def load_series_to_dataframe(load_series) -> pd.DataFrame:
     df["actual_load_mw"] = pd.to_numeric(df["actual_load_mw"])
 
     df["period"] = (
-        df["datetime"].dt.tz_convert(None).dt.to_period("15min")
+        df["datetime"].dt.tz_convert(None).dt.to_period(str(load_series.resolution))
     )  # dropping the tz infromation before converting to a period
     df = df[["period","actual_load_mw"]]
     df = df.set_index("period")
 
     return df
+
+
+def load_array_series_to_dataframe(load_series) -> pd.DataFrame:
+    """Build the same period-indexed frame as load_series_to_dataframe from arrays."""
+    period = pd.DatetimeIndex(load_series.start_ts).to_period(str(load_series.resolution))
+    period.name = "period"
+    return pd.DataFrame(
+        {"actual_load_mw": load_series.load_mw.astype("float64")},
+        index=period,
+    )
@@ -2,13 +2,21 @@
 
 from .entsoe_services import (
     ImportHistoricalLoadData,
+    ImportIncrementalLoadData,
     GetActualLoadData,
+    GetActualLoadArrays,
+    StreamActualLoadArrays,
+    GetActualLoadBatch,
+    GetResampledLoad,
     GetActualLoadDataFrame,
 )
 from .cds_services import (
     CreateCDSCountryAverages,
     GetERA5DataFromCDSStore,
     GetERA5DataFromDB,
+    GetERA5DataFrameFromDB,
+    GetERA5FrameFromDB,
+    GetResampledERA5FromDB,
     GetMultipleERA5DataFrameFromDB,
 )
 from .ecmwf_services import ImportWeatherForecast
@@ -17,10 +25,18 @@ from .forecast_services import GetLatestCommonTimestamp
 
 __all__ = [
     "ImportHistoricalLoadData",
+    "ImportIncrementalLoadData",
     "GetActualLoadData",
+    "GetActualLoadArrays",
+    "StreamActualLoadArrays",
+    "GetActualLoadBatch",
+    "GetResampledLoad",
     "CreateCDSCountryAverages",
     "GetERA5DataFromCDSStore",
     "GetERA5DataFromDB",
     "GetActualLoadDataFrame",
     "GetMultipleERA5DataFrameFromDB",
+    "GetERA5FrameFromDB",
+    "GetERA5DataFrameFromDB",
+    "GetResampledERA5FromDB",
 ]
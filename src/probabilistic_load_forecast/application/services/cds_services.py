@@ -3,9 +3,6 @@
 import xarray as xr
 import pandas as pd
 import regionmask
-from datetime import datetime
-from typing import cast
-
 from probabilistic_load_forecast.application.ports import CountryCodeNormalizer
 
 from probabilistic_load_forecast.domain.model import (
@@ -13,12 +10,10 @@ from probabilistic_load_forecast.domain.model import (
     WeatherArea,
     WeatherVariable,
     Era5Series,
+    Era5ArraySeries,
+    Era5Frame,
+    ResampledSeries,
     Resolution,
-    VARIABLE_VALUE_KIND,
-    WeatherValueKind,
-    InstantWeatherValue,
-    IntervalWeatherValue,
-    IntervalStatistic
 )
 
 from probabilistic_load_forecast.adapters.db import(
@@ -26,7 +21,8 @@ from probabilistic_load_forecast.adapters.db import(
 )
 
 from probabilistic_load_forecast.application.mappers import (
-    era5_series_to_dataframe
+    era5_series_to_dataframe,
+    era5_frame_to_dataframe,
 )
 
 # STAT_BY_VAR: dict = {
@@ -82,51 +78,20 @@ class CreateCDSCountryAverages:
         # Remove non ERA5 variable columns
         era5_variables_df = averages_df.drop(columns=["number", "expver", "country"])
 
-        # Store results
-        for col_label, content in era5_variables_df.items():
-            variable = WeatherVariable(col_label)
-            area = WeatherArea(code=country_code)
-            value_kind = VARIABLE_VALUE_KIND[variable]
-            observations = []
-
-            for valid_time, value in content.items():
-                valid_at = cast(datetime, valid_time)
-                value = float(value)
-
-                if value_kind is WeatherValueKind.INSTANT:
-                    observations.append(
-                        InstantWeatherValue(
-                            area=area,
-                            variable=variable,
-                            valid_at=valid_at,
-                            value=value,
-                        )
-                    )
-                else:
-                    observations.append(
-                        IntervalWeatherValue(
-                            area=area,
-                            variable=variable,
-                            interval=TimeInterval(
-                                start=valid_at - pd.Timedelta(hours=1),
-                                end=valid_at,
-                            ),
-                            statistic=IntervalStatistic.TOTAL,
-                            value=value,
-                        )
-                    )
-            # content.name = "value"
-            # sub_df = pd.DataFrame(data=content, index=era5_variables_df.index)
-
-            series = Era5Series(
-                WeatherArea(code=country_code),
+        # Store results, all variables are written in a single transaction
+        valid_time = idx.tz_convert(None).to_numpy()
+        area = WeatherArea(code=country_code)
+        series = [
+            Era5ArraySeries(
+                area=area,
                 resolution=Resolution.PT1H,
-                observations=tuple(observations),
-                variable=variable
-            )
-            self.db_repo.add(
-                weather_series=series
+                variable=WeatherVariable(col_label),
+                valid_time=valid_time,
+                value=content.to_numpy(dtype="float64"),
             )
+            for col_label, content in era5_variables_df.items()
+        ]
+        self.db_repo.add_arrays(series)
 
     def _convert_accumulated_to_hourly(
         self, ds: xr.Dataset, variables: list[str]
@@ -209,6 +174,73 @@ class GetMultipleERA5DataFrameFromDB:
                 print(f"Could not fetch {variable}: {e}")
         return results
 
+class GetERA5FrameFromDB:
+    """Use case that retrieves several weather variables with one repository query."""
+
+    def __init__(self, repo: Era5PostgreRepository):
+        self.repo = repo
+
+    def __call__(
+        self,
+        variables: list[WeatherVariable],
+        area: WeatherArea,
+        interval: TimeInterval,
+        schema: str = "public",
+    ) -> Era5Frame:
+        """
+        Fetch the variables as one frame aligned on the period start.
+
+        Returns an Era5Frame with one float64 array per variable.
+        """
+        return self.repo.get_frame(interval, area, variables, schema=schema)
+
+
+class GetResampledERA5FromDB:
+    """Use case that retrieves one weather variable aggregated in the database."""
+
+    def __init__(self, repo: Era5PostgreRepository):
+        self.repo = repo
+
+    def __call__(
+        self,
+        variable: WeatherVariable,
+        area: WeatherArea,
+        interval: TimeInterval,
+        resolution: Resolution,
+        aggregates: tuple[str, ...] = ("mean",),
+        schema: str = "public",
+    ) -> ResampledSeries:
+        """
+        Aggregate the variable per resolution bucket of period starts.
+
+        Returns a ResampledSeries with one float64 array per aggregate.
+        """
+        return self.repo.get_resampled(
+            interval, area, variable, resolution, aggregates, schema=schema
+        )
+
+
+class GetERA5DataFrameFromDB:
+    """Use case that retrieves several weather variables as a wide DataFrame."""
+
+    def __init__(self, repo: Era5PostgreRepository):
+        self.repo = repo
+
+    def __call__(
+        self,
+        variables: list[WeatherVariable],
+        area: WeatherArea,
+        interval: TimeInterval,
+        schema: str = "public",
+    ) -> pd.DataFrame:
+        """
+        Fetch the variables with a single query.
+
+        Returns a DataFrame indexed by valid_time with one column per variable.
+        """
+        frame = self.repo.get_frame(interval, area, variables, schema=schema)
+        return era5_frame_to_dataframe(frame)
+
 class GetERA5DataFromDB:
     """Use case that retrieves actual load data from a repository."""
 
@@ -2,12 +2,16 @@
 Application use case for fetching load measurements and persisting them.
 """
 
+from datetime import datetime, timedelta
 from typing import Any, List
 
 from probabilistic_load_forecast.application.ports import DataProvider
-from probabilistic_load_forecast.application.mappers import load_series_to_dataframe
+from probabilistic_load_forecast.application.mappers import load_array_series_to_dataframe
 
+from probabilistic_load_forecast.domain.exceptions import IncompleteDataError
 from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    LoadArraySeries,
     LoadSeries,
     TimeInterval,
     LoadMeasurement
@@ -21,16 +25,96 @@ class ImportHistoricalLoadData:
     This class depends on:
       - dataprovider: a MeasurementProvider that supplies measurement data
       - repo: a Repository responsible for persisting the data
+
+    With ``bulk=True`` the load is fetched with the provider's ``get_arrays``
+    and every LoadArraySeries is written through the repository's COPY-based
+    ``add_bulk`` path, which is meant for large backfills. No LoadMeasurement
+    is built per slot on that path.
+
+    When parts of the interval cannot be fetched the rest is still stored
+    and the ``IncompleteDataError`` naming the missing parts is re-raised,
+    so they can be imported again.
     """
 
-    def __init__(self, provider: DataProvider, repo):
+    def __init__(self, provider: DataProvider, repo, bulk: bool = False):
         self.dataprovider = provider
         self.repo = repo
+        self.bulk = bulk
+
+    def __call__(self, interval: TimeInterval, **kwargs) -> None:
+        if self.bulk:
+            fetch, store = self.dataprovider.get_arrays, self._store_arrays
+        else:
+            fetch, store = self.dataprovider.get_data, self._store
+        try:
+            data = list(fetch(interval, **kwargs))
+        except IncompleteDataError as error:
+            store(error.partial)
+            raise
+        store(data)
+
+    def _store(self, measurements: List[LoadMeasurement]) -> None:
+        if not measurements:
+            return
+        self.repo.add(LoadSeries.from_measurements(measurements))
+
+    def _store_arrays(self, series: List[LoadArraySeries]) -> None:
+        for load_series in series:
+            if len(load_series):
+                self.repo.add_bulk(load_series)
+
+
+class ImportIncrementalLoadData:
+    """
+    Use case that imports only the load of a bidding zone not stored yet.
+
+    The import starts ``overlap`` before the latest stored slot of the zone,
+    floored to the full hour, so late corrections of recent values are
+    picked up, and ends at ``end``.
+    Slots whose load did not change are skipped by the repository's upsert.
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        repo,
+        bulk: bool = False,
+        overlap: timedelta = timedelta(hours=24),
+    ):
+        self.repo = repo
+        self.overlap = overlap
+        self.importer = ImportHistoricalLoadData(provider, repo, bulk=bulk)
+
+    def __call__(
+        self,
+        bidding_zone: BiddingZone,
+        end: datetime,
+        initial_start: datetime | None = None,
+    ) -> TimeInterval | None:
+        """Import the missing load up to ``end`` and return the fetched interval.
+
+        Args:
+            initial_start: Start of the import of a zone without stored load.
+
+        Returns ``None`` when the zone is already up to date.
+        """
+        latest = self.repo.get_latest_start(bidding_zone)
+        if latest is not None:
+            # ENTSO-E takes whole hours as periodStart.
+            start = (latest - self.overlap).replace(minute=0, second=0, microsecond=0)
+        elif initial_start is not None:
+            start = initial_start
+        else:
+            raise ValueError(
+                f"No load stored for {bidding_zone.eic_code} yet, "
+                "pass a start for its first import"
+            )
+        if start >= end:
+            return None
 
-    def __call__(self, interval: TimeInterval) -> None:
-        measurements = list(self.dataprovider.get_data(interval))
-        series = LoadSeries.from_measurements(measurements)
-        self.repo.add(series)
+        interval = TimeInterval(start, end)
+        self.importer(interval, outBiddingZone_Domain=bidding_zone.eic_code)
+        return interval
 
 
 class GetActualLoadData:
@@ -42,12 +126,54 @@ class GetActualLoadData:
     def __call__(self, start, end, bidding_zone) -> LoadSeries:
         return self.repo.get(start, end, bidding_zone)
 
+class GetActualLoadArrays:
+    """Use case that retrieves actual load data as a columnar LoadArraySeries."""
+
+    def __init__(self, repo):
+        self.repo = repo
+
+    def __call__(self, start, end, bidding_zone):
+        return self.repo.get_arrays(start, end, bidding_zone)
+
+class StreamActualLoadArrays:
+    """Use case that streams actual load data as LoadArraySeries chunks."""
+
+    def __init__(self, repo):
+        self.repo = repo
+
+    def __call__(self, start, end, bidding_zone, batch_size=50_000):
+        return self.repo.iter_batches(
+            start, end, bidding_zone, batch_size=batch_size, columnar=True
+        )
+
+class GetActualLoadBatch:
+    """Use case that retrieves the load of several bidding zones in one read."""
+
+    def __init__(self, repo):
+        self.repo = repo
+
+    def __call__(self, start, end, bidding_zones):
+        return self.repo.get_many(start, end, bidding_zones)
+
+class GetResampledLoad:
+    """Use case that retrieves load aggregated per resolution bucket in the database."""
+
+    def __init__(self, repo):
+        self.repo = repo
+
+    def __call__(self, start, end, bidding_zone, resolution, aggregates=("mean",)):
+        return self.repo.get_resampled(start, end, bidding_zone, resolution, aggregates)
+
 class GetActualLoadDataFrame:
-    """Use case that retrieves actual load data from a repository."""
+    """Use case that retrieves actual load data from a repository as a DataFrame.
+
+    Reads through the repository's columnar ``get_arrays`` path, so no domain
+    object is created per measurement.
+    """
 
     def __init__(self, repo):
         self.repo = repo
 
     def __call__(self, start, end, bidding_zone):
-        load_series = self.repo.get(start, end, bidding_zone)
-        return load_series_to_dataframe(load_series)
\ No newline at end of file
+        load_series = self.repo.get_arrays(start, end, bidding_zone)
+        return load_array_series_to_dataframe(load_series)
\ No newline at end of file
@@ -1,9 +1,16 @@
 from probabilistic_load_forecast.adapters.db import(
     ForecastMetadataRepository
 )
+from probabilistic_load_forecast.domain.model import BiddingZone, WeatherArea
+
+
 class GetLatestCommonTimestamp():
     def __init__(self, repo: ForecastMetadataRepository):
         self.repo = repo
 
-    def __call__(self):
-        return self.repo.get_latest_common_timestamp()
\ No newline at end of file
+    def __call__(
+        self,
+        bidding_zone: BiddingZone | None = None,
+        area: WeatherArea | None = None,
+    ):
+        return self.repo.get_latest_common_timestamp(bidding_zone=bidding_zone, area=area)
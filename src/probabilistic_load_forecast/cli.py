@@ -1,7 +1,8 @@
 import argparse
 import json
+import sys
 from dataclasses import asdict, is_dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import cdsapi
@@ -15,15 +16,17 @@ from probabilistic_load_forecast.adapters.db import EntsoePostgreRepository, Era
 from probabilistic_load_forecast.adapters.ecmwf.api_client import ECMWFAPIClient
 from probabilistic_load_forecast.adapters.ecmwf.mapper import ECMWFMapper
 from probabilistic_load_forecast.adapters.ecmwf.provider import ECMWFDataProvider
-from probabilistic_load_forecast.adapters.entsoe import EntsoeAPIClient, EntsoeDataProvider, EntsoeFetcher, XmlLoadMapper
+from probabilistic_load_forecast.adapters.entsoe import EntsoeAPIClient, EntsoeDataProvider, EntsoeFetcher, IterparseLoadMapper, TokenBucket
 from probabilistic_load_forecast.application.services import (
     CreateCDSCountryAverages,
     GetActualLoadData,
     GetERA5DataFromCDSStore,
     GetERA5DataFromDB,
     ImportHistoricalLoadData,
+    ImportIncrementalLoadData,
     ImportWeatherForecast,
 )
+from probabilistic_load_forecast.domain.exceptions import IncompleteDataError
 from probabilistic_load_forecast.domain.model import (
     TimeInterval,
     WeatherArea,
@@ -41,12 +44,16 @@ def load_env() -> None:
     if not load_dotenv(ROOT_DIR / ".env"):
         raise FileNotFoundError("Could not load .env file in project root.")
 
-def build_entsoe_provider() -> EntsoeDataProvider:
+def build_entsoe_provider(max_concurrency: int | None = None) -> EntsoeDataProvider:
+    if max_concurrency is None:
+        max_concurrency = config.get_entsoe_max_concurrency()
     client = EntsoeAPIClient(
         endpoint=config.get_entsoe_url(),
         security_token=config.get_entsoe_security_token(),
+        pool_size=max_concurrency,
+        rate_limiter=TokenBucket(config.get_entsoe_rate_limit()),
     )
-    return EntsoeDataProvider(EntsoeFetcher(client), XmlLoadMapper())
+    return EntsoeDataProvider(EntsoeFetcher(client, max_concurrency), IterparseLoadMapper())
 
 def build_load_repo() -> EntsoePostgreRepository:
     return EntsoePostgreRepository(config.get_postgre_uri())
@@ -90,10 +97,67 @@ def to_json(value) -> str:
         value = asdict(value)
     return json.dumps(value, default=str, indent=2)
 
+def _print_failed_intervals(error: IncompleteDataError) -> None:
+    print(
+        to_json(
+            {
+                "status": "incomplete",
+                "failed_intervals": [
+                    {"start": failed.start, "end": failed.end}
+                    for failed in error.failed_intervals
+                ],
+            }
+        )
+    )
+
 def cmd_load_import(args: argparse.Namespace) -> int:
-    service = ImportHistoricalLoadData(build_entsoe_provider(), build_load_repo())
+    if args.incremental:
+        return cmd_load_import_incremental(args)
+    if args.start is None or args.end is None:
+        print("plf load import: --start and --end are required without --incremental", file=sys.stderr)
+        return 2
+
+    service = ImportHistoricalLoadData(
+        build_entsoe_provider(args.concurrency), build_load_repo(), bulk=args.bulk
+    )
     interval = TimeInterval(start=parse_dt(args.start), end=parse_dt(args.end))
-    service(interval)
+    try:
+        service(interval, outBiddingZone_Domain=resolve_bidding_zone(args.eic_code).eic_code)
+    except IncompleteDataError as error:
+        _print_failed_intervals(error)
+        return 1
+    return 0
+
+def cmd_load_import_incremental(args: argparse.Namespace) -> int:
+    service = ImportIncrementalLoadData(
+        build_entsoe_provider(args.concurrency),
+        build_load_repo(),
+        bulk=args.bulk,
+        overlap=timedelta(hours=args.overlap_hours),
+    )
+    end = parse_dt(args.end) if args.end else datetime.now(timezone.utc)
+    try:
+        interval = service(
+            resolve_bidding_zone(args.eic_code),
+            end=end,
+            initial_start=parse_dt(args.start) if args.start else None,
+        )
+    except IncompleteDataError as error:
+        _print_failed_intervals(error)
+        return 1
+
+    if interval is None:
+        print(to_json({"status": "up_to_date", "eic_code": args.eic_code}))
+    else:
+        print(
+            to_json(
+                {
+                    "status": "ok",
+                    "eic_code": args.eic_code,
+                    "imported_interval": {"start": interval.start, "end": interval.end},
+                }
+            )
+        )
     return 0
 
 def cmd_load_get(args: argparse.Namespace) -> int:
@@ -210,8 +274,37 @@ def build_parser() -> argparse.ArgumentParser:
     load_sub = load.add_subparsers(dest="load_command", required=True)
 
     load_import = load_sub.add_parser("import")
-    load_import.add_argument("--start", required=True)
-    load_import.add_argument("--end", required=True)
+    load_import.add_argument(
+        "--start",
+        help="Required without --incremental, with it only used for a zone without stored load.",
+    )
+    load_import.add_argument(
+        "--end", help="Required without --incremental, with it defaults to now."
+    )
+    load_import.add_argument("--eic-code", default="10YAT-APG------L")
+    load_import.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Import from the latest stored slot of the zone, minus --overlap-hours.",
+    )
+    load_import.add_argument(
+        "--overlap-hours",
+        type=int,
+        default=24,
+        help="Hours before the latest stored slot fetched again for late corrections.",
+    )
+    load_import.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Write through the COPY-based bulk upsert (recommended for backfills).",
+    )
+    load_import.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Yearly ENTSO-E chunks requested at the same time "
+        "(default: ENTSOE_MAX_CONCURRENCY or 4).",
+    )
     load_import.set_defaults(handler=cmd_load_import)
 
     load_get = load_sub.add_parser("get")
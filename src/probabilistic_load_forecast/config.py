@@ -1,6 +1,7 @@
 """This module handles configuration retrieval from environment variables."""
 
 import os
+from dataclasses import dataclass
 
 
 def get_postgre_uri() -> str:
@@ -34,6 +35,16 @@ def get_entsoe_security_token():
     return entsoe_token
 
 
+def get_entsoe_max_concurrency() -> int:
+    """Number of ENTSO-E requests the load import runs at the same time."""
+    return int(os.getenv("ENTSOE_MAX_CONCURRENCY", "4"))
+
+
+def get_entsoe_rate_limit() -> float:
+    """Sustained ENTSO-E requests per second of the load import."""
+    return float(os.getenv("ENTSOE_RATE_LIMIT", "4"))
+
+
 def get_cdsapi_url() -> str:
     """Fetches the CDS API URL from environment variables."""
     cdsapi_url = os.getenv("CDSAPI_URL")
@@ -52,3 +63,56 @@ def get_cdsapi_key() -> str:
             "CDS API key is missing. Set the CDSAPI_KEY environment variable."
         )
     return cdsapi_key
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Sizing, idle timeout and health-check settings of a connection pool.
+
+    Attributes:
+        min_size: Connections kept open even when the pool is idle.
+        max_size: Upper bound of concurrently open connections.
+        max_idle: Seconds an unused connection above ``min_size`` may stay open.
+        max_lifetime: Seconds after which a connection is replaced.
+        timeout: Seconds a caller waits for a free connection before failing.
+        check: Verify a connection with a round trip before handing it out.
+    """
+
+    min_size: int = 1
+    max_size: int = 10
+    max_idle: float = 300.0
+    max_lifetime: float = 3600.0
+    timeout: float = 30.0
+    check: bool = True
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("min_size must not be negative")
+        if self.max_size < max(self.min_size, 1):
+            raise ValueError("max_size must be at least min_size and at least 1")
+
+
+def get_pool_settings() -> PoolSettings:
+    """Builds the connection pool settings from optional environment variables."""
+    defaults = PoolSettings()
+    check = os.getenv("PG_POOL_CHECK")
+    return PoolSettings(
+        min_size=int(os.getenv("PG_POOL_MIN_SIZE", str(defaults.min_size))),
+        max_size=int(os.getenv("PG_POOL_MAX_SIZE", str(defaults.max_size))),
+        max_idle=float(os.getenv("PG_POOL_MAX_IDLE", str(defaults.max_idle))),
+        max_lifetime=float(
+            os.getenv("PG_POOL_MAX_LIFETIME", str(defaults.max_lifetime))
+        ),
+        timeout=float(os.getenv("PG_POOL_TIMEOUT", str(defaults.timeout))),
+        check=defaults.check if check is None else check.lower() in ("1", "true", "yes"),
+    )
+
+
+def get_query_cache_size() -> int:
+    """Maximum number of entries of the API's query cache, 0 disables it."""
+    return int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256"))
+
+
+def get_range_cache_max_keys() -> int:
+    """Zones and weather variables kept by the API's range caches, 0 disables them."""
+    return int(os.getenv("RANGE_CACHE_MAX_KEYS", "32"))
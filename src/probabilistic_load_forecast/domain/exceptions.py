@@ -4,3 +4,26 @@ class UnknownBiddingZoneError(KeyError):
 
 class InvalidCountryCodeError(ValueError):
     pass
+
+
+class InvalidAggregateError(ValueError):
+    pass
+
+
+class IncompleteDataError(RuntimeError):
+    """Parts of a requested interval could not be fetched.
+
+    ``failed_intervals`` lists the parts to fetch again, ``partial`` holds
+    what was fetched for the rest of the interval.
+    """
+
+    def __init__(self, failed_intervals, partial):
+        self.failed_intervals = list(failed_intervals)
+        self.partial = partial
+        super().__init__(
+            "Could not fetch "
+            + ", ".join(
+                f"{interval.start.isoformat()} to {interval.end.isoformat()}"
+                for interval in self.failed_intervals
+            )
+        )
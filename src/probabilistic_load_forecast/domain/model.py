@@ -4,18 +4,44 @@ This module contains the core business entities.
 
 from enum import StrEnum
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 import re
 
+import numpy as np
+
 from probabilistic_load_forecast.domain.exceptions import (
+    InvalidAggregateError,
     InvalidCountryCodeError,
     UnknownBiddingZoneError,
 )
 
 class Resolution(StrEnum):
     PT15M = "15min"
+    PT30M = "30min"
     PT1H = "1h"
     PT3H = "3h"
+    P1D = "1D"
+    P1W = "1W"
+
+RESOLUTION_LENGTH = {
+    Resolution.PT15M: timedelta(minutes=15),
+    Resolution.PT30M: timedelta(minutes=30),
+    Resolution.PT1H: timedelta(hours=1),
+    Resolution.PT3H: timedelta(hours=3),
+    Resolution.P1D: timedelta(days=1),
+    Resolution.P1W: timedelta(weeks=1),
+}
+RESOLUTION_BY_LENGTH = {length: resolution for resolution, length in RESOLUTION_LENGTH.items()}
+
+
+def slot_resolution(seconds) -> Resolution:
+    """Resolution of the median slot length in ``seconds``, 15 minutes without slots."""
+    if not len(seconds):
+        return Resolution.PT15M
+    return RESOLUTION_BY_LENGTH.get(
+        timedelta(seconds=int(np.median(seconds))), Resolution.PT15M
+    )
+
 
 class WeatherVariable(StrEnum):
     T2M = "t2m"
@@ -141,9 +167,10 @@ class LoadSeries:
 
         ordered = tuple(sorted(measurements, key=lambda m: m.interval.start))
         first = ordered[0]
+        length = first.interval.end - first.interval.start
         return cls(
             bidding_zone=first.bidding_zone,
-            resolution=Resolution.PT15M,
+            resolution=RESOLUTION_BY_LENGTH.get(length, Resolution.PT15M),
             observations=ordered,
         )
 
@@ -162,12 +189,251 @@ class Era5Series:
         if any(obs.variable != self.variable for obs in self.observations):
             raise ValueError("all observations must of the same weather variable type")
 
+@dataclass(frozen=True, eq=False)
+class LoadArraySeries:
+    """Columnar counterpart of LoadSeries for large range reads.
+
+    ``start_ts`` holds the interval starts as datetime64 values in UTC and
+    ``load_mw`` the matching float64 loads, sorted by ``start_ts``.
+    """
+    bidding_zone: BiddingZone
+    resolution: Resolution
+    start_ts: np.ndarray
+    load_mw: np.ndarray
+
+    def __post_init__(self) -> None:
+        if len(self.start_ts) != len(self.load_mw):
+            raise ValueError("start_ts and load_mw must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.start_ts)
+
+@dataclass(frozen=True, eq=False)
+class LoadArrayBatch:
+    """Load of several bidding zones read over the same interval.
+
+    ``series`` maps EIC codes to their LoadArraySeries. ``missing_slots``
+    counts, per zone, the slots of the zone's own length in ``interval``
+    that have no value.
+    """
+    interval: TimeInterval
+    series: dict[str, LoadArraySeries]
+    missing_slots: dict[str, int]
+
+    def __post_init__(self) -> None:
+        if self.series.keys() != self.missing_slots.keys():
+            raise ValueError("series and missing_slots must cover the same zones")
+
+@dataclass(frozen=True, eq=False)
+class Era5ArraySeries:
+    """Columnar counterpart of Era5Series used for bulk reads and writes.
+
+    ``valid_time`` holds datetime64 values in UTC and ``value`` the matching
+    float64 values, both in the same order.
+    """
+    area: WeatherArea
+    resolution: Resolution
+    variable: WeatherVariable
+    valid_time: np.ndarray
+    value: np.ndarray
+
+    def __post_init__(self) -> None:
+        if len(self.valid_time) != len(self.value):
+            raise ValueError("valid_time and value must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.valid_time)
+
+@dataclass(frozen=True, eq=False)
+class ResampledSeries:
+    """Load or one weather variable aggregated into buckets of ``resolution``.
+
+    ``timestamps`` holds the bucket starts as datetime64 values in UTC,
+    ``values`` maps every aggregate name, e.g. ``mean`` or ``q90``, to a
+    float64 array of the same length and ``counts`` the number of stored
+    values that went into each bucket.
+    """
+    resolution: Resolution
+    timestamps: np.ndarray
+    values: dict[str, np.ndarray]
+    counts: np.ndarray
+
+    def __post_init__(self) -> None:
+        if len(self.counts) != len(self.timestamps) or any(
+            len(values) != len(self.timestamps) for values in self.values.values()
+        ):
+            raise ValueError("every aggregate must have one value per timestamp")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+@dataclass(frozen=True, eq=False)
+class Era5Frame:
+    """Several weather variables of one area aligned on a common time axis.
+
+    ``timestamps`` holds the period starts as datetime64 values in UTC: the
+    valid time of instant values and ``valid_time - interval`` of interval-end
+    values. ``values`` maps every variable to a float64 array of the same
+    length with NaN where the variable has no value for a timestamp.
+    """
+    area: WeatherArea
+    resolution: Resolution
+    timestamps: np.ndarray
+    values: dict[WeatherVariable, np.ndarray]
+
+    def __post_init__(self) -> None:
+        if any(len(values) != len(self.timestamps) for values in self.values.values()):
+            raise ValueError("every variable must have one value per timestamp")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
 BIDDING_ZONE_REGISTRY = {
     "10YAT-APG------L": BiddingZone(
         eic_code="10YAT-APG------L",
         display_name="Austria",
         country_code=CountryCode("AT"),
     ),
+    "10YBE----------2": BiddingZone(
+        eic_code="10YBE----------2",
+        display_name="Belgium",
+        country_code=CountryCode("BE"),
+    ),
+    "10YCA-BULGARIA-R": BiddingZone(
+        eic_code="10YCA-BULGARIA-R",
+        display_name="Bulgaria",
+        country_code=CountryCode("BG"),
+    ),
+    "10YCH-SWISSGRIDZ": BiddingZone(
+        eic_code="10YCH-SWISSGRIDZ",
+        display_name="Switzerland",
+        country_code=CountryCode("CH"),
+    ),
+    "10YCZ-CEPS-----N": BiddingZone(
+        eic_code="10YCZ-CEPS-----N",
+        display_name="Czech Republic",
+        country_code=CountryCode("CZ"),
+    ),
+    "10Y1001A1001A82H": BiddingZone(
+        eic_code="10Y1001A1001A82H",
+        display_name="Germany-Luxembourg",
+        country_code=CountryCode("DE"),
+    ),
+    "10YDK-1--------W": BiddingZone(
+        eic_code="10YDK-1--------W",
+        display_name="Denmark DK1",
+        country_code=CountryCode("DK"),
+    ),
+    "10YDK-2--------M": BiddingZone(
+        eic_code="10YDK-2--------M",
+        display_name="Denmark DK2",
+        country_code=CountryCode("DK"),
+    ),
+    "10Y1001A1001A39I": BiddingZone(
+        eic_code="10Y1001A1001A39I",
+        display_name="Estonia",
+        country_code=CountryCode("EE"),
+    ),
+    "10YES-REE------0": BiddingZone(
+        eic_code="10YES-REE------0",
+        display_name="Spain",
+        country_code=CountryCode("ES"),
+    ),
+    "10YFI-1--------U": BiddingZone(
+        eic_code="10YFI-1--------U",
+        display_name="Finland",
+        country_code=CountryCode("FI"),
+    ),
+    "10YFR-RTE------C": BiddingZone(
+        eic_code="10YFR-RTE------C",
+        display_name="France",
+        country_code=CountryCode("FR"),
+    ),
+    "10YGR-HTSO-----Y": BiddingZone(
+        eic_code="10YGR-HTSO-----Y",
+        display_name="Greece",
+        country_code=CountryCode("GR"),
+    ),
+    "10YHR-HEP------M": BiddingZone(
+        eic_code="10YHR-HEP------M",
+        display_name="Croatia",
+        country_code=CountryCode("HR"),
+    ),
+    "10YHU-MAVIR----U": BiddingZone(
+        eic_code="10YHU-MAVIR----U",
+        display_name="Hungary",
+        country_code=CountryCode("HU"),
+    ),
+    "10Y1001A1001A59C": BiddingZone(
+        eic_code="10Y1001A1001A59C",
+        display_name="Ireland (SEM)",
+        country_code=CountryCode("IE"),
+    ),
+    "10Y1001A1001A73I": BiddingZone(
+        eic_code="10Y1001A1001A73I",
+        display_name="Italy North",
+        country_code=CountryCode("IT"),
+    ),
+    "10YLT-1001A0008Q": BiddingZone(
+        eic_code="10YLT-1001A0008Q",
+        display_name="Lithuania",
+        country_code=CountryCode("LT"),
+    ),
+    "10YLV-1001A00074": BiddingZone(
+        eic_code="10YLV-1001A00074",
+        display_name="Latvia",
+        country_code=CountryCode("LV"),
+    ),
+    "10YNL----------L": BiddingZone(
+        eic_code="10YNL----------L",
+        display_name="Netherlands",
+        country_code=CountryCode("NL"),
+    ),
+    "10YNO-1--------2": BiddingZone(
+        eic_code="10YNO-1--------2",
+        display_name="Norway NO1",
+        country_code=CountryCode("NO"),
+    ),
+    "10YNO-2--------T": BiddingZone(
+        eic_code="10YNO-2--------T",
+        display_name="Norway NO2",
+        country_code=CountryCode("NO"),
+    ),
+    "10YPL-AREA-----S": BiddingZone(
+        eic_code="10YPL-AREA-----S",
+        display_name="Poland",
+        country_code=CountryCode("PL"),
+    ),
+    "10YPT-REN------W": BiddingZone(
+        eic_code="10YPT-REN------W",
+        display_name="Portugal",
+        country_code=CountryCode("PT"),
+    ),
+    "10YRO-TEL------P": BiddingZone(
+        eic_code="10YRO-TEL------P",
+        display_name="Romania",
+        country_code=CountryCode("RO"),
+    ),
+    "10Y1001A1001A46L": BiddingZone(
+        eic_code="10Y1001A1001A46L",
+        display_name="Sweden SE3",
+        country_code=CountryCode("SE"),
+    ),
+    "10Y1001A1001A47J": BiddingZone(
+        eic_code="10Y1001A1001A47J",
+        display_name="Sweden SE4",
+        country_code=CountryCode("SE"),
+    ),
+    "10YSI-ELES-----O": BiddingZone(
+        eic_code="10YSI-ELES-----O",
+        display_name="Slovenia",
+        country_code=CountryCode("SI"),
+    ),
+    "10YSK-SEPS-----K": BiddingZone(
+        eic_code="10YSK-SEPS-----K",
+        display_name="Slovakia",
+        country_code=CountryCode("SK"),
+    ),
 }
 
 VARIABLE_VALUE_KIND = {
@@ -178,6 +444,25 @@ VARIABLE_VALUE_KIND = {
     WeatherVariable.TP: WeatherValueKind.INTERVAL_END,
 }
 
+AGGREGATES = ("mean", "min", "max", "sum")
+
+
+def parse_aggregate(name: str) -> str | float:
+    """Validate an aggregate name, returns it or the quantile of ``q<percent>``.
+
+    ``mean``, ``min``, ``max`` and ``sum`` are returned as they are, quantiles
+    are written as percentages, e.g. ``q10`` or ``q97.5``.
+    """
+    if name in AGGREGATES:
+        return name
+    match = re.fullmatch(r"q(\d{1,2}(?:\.\d+)?)", name)
+    if match and 0 < float(match.group(1)) < 100:
+        return float(match.group(1)) / 100
+    raise InvalidAggregateError(
+        f"Unknown aggregate {name!r}, use one of {', '.join(AGGREGATES)} or q<percent>"
+    )
+
+
 def resolve_bidding_zone(eic_code):
     try:
         return BIDDING_ZONE_REGISTRY[eic_code]
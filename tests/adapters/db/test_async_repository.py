@@ -0,0 +1,316 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import psycopg
+import pytest
+
+from probabilistic_load_forecast.adapters.db import (
+    AsyncEntsoePostgreRepository,
+    AsyncEra5PostgreRepository,
+    AsyncForecastMetadataRepository,
+    EntsoePostgreRepository,
+    ForecastMetadataRepository,
+    UpsertResult,
+    timing,
+)
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5ArraySeries,
+    Era5Series,
+    InstantWeatherValue,
+    LoadMeasurement,
+    LoadSeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+
+class FakeAsyncCursor:
+    def __init__(self, row):
+        self.row = row
+        self.executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    async def fetchone(self):
+        return self.row
+
+
+class FakeAsyncConnection:
+    def __init__(self, row):
+        self.cursor_instance = FakeAsyncCursor(row)
+
+    def cursor(self):
+        return self.cursor_instance
+
+
+class FakeAsyncPool:
+    def __init__(self, row=None):
+        self.connection_instance = FakeAsyncConnection(row)
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        self.checkouts += 1
+        yield self.connection_instance
+
+
+def test_async_repository_requires_dsn_or_pool():
+    with pytest.raises(ValueError, match="dsn or a connection pool"):
+        AsyncEntsoePostgreRepository()
+
+
+def test_async_metadata_repository_runs_the_blocking_repository_query():
+    latest = datetime(2026, 3, 27, 23, 0, tzinfo=timezone.utc)
+    pool = FakeAsyncPool(row=(latest,))
+    repo = AsyncForecastMetadataRepository(pool=pool)
+
+    assert asyncio.run(repo.get_latest_common_timestamp()) == latest
+
+    query, params = pool.connection_instance.cursor_instance.executed[0]
+    expected_query, expected_params = ForecastMetadataRepository(
+        pool=pool
+    )._latest_common_query(None, None, "public")
+    assert query.as_string() == expected_query.as_string()
+    assert params == expected_params
+    assert pool.checkouts == 1
+
+
+class MissingWatermarksCursor(FakeAsyncCursor):
+    """Fails like a database that has not run migration 0004."""
+
+    async def execute(self, query, params=None):
+        await super().execute(query, params)
+        if "data_watermarks" in query.as_string():
+            raise psycopg.errors.UndefinedTable('relation "data_watermarks" does not exist')
+
+
+def test_async_metadata_repository_falls_back_to_the_data_tables():
+    latest = datetime(2026, 3, 27, 23, 0, tzinfo=timezone.utc)
+    pool = FakeAsyncPool(row=(latest,))
+    cursor = MissingWatermarksCursor(row=(latest,))
+    pool.connection_instance.cursor_instance = cursor
+    repo = AsyncForecastMetadataRepository(pool=pool)
+
+    assert asyncio.run(repo.get_latest_common_timestamp()) == latest
+    assert asyncio.run(repo.get_watermark("t2m_country_avg", "AT")) == latest
+
+    expected_query, expected_params = repo._latest_common_fallback_query(None, None, "public")
+    assert cursor.executed[1] == (expected_query, expected_params)
+    assert expected_params == ["10YAT-APG------L"] + ["AT"] * 5 + ["10YAT-APG------L"]
+    query, params = cursor.executed[3]
+    assert query.as_string() == (
+        'SELECT max("valid_time") FROM "public"."t2m_country_avg" WHERE "country_code" = %s'
+    )
+    assert params == ("AT",)
+
+
+def test_async_repository_reports_connect_and_execute_stages():
+    latest = datetime(2026, 3, 27, 23, 0, tzinfo=timezone.utc)
+    repo = AsyncForecastMetadataRepository(pool=FakeAsyncPool(row=(latest,)))
+
+    async def read():
+        with timing.track_stages() as stages:
+            await repo.get_latest_common_timestamp()
+        return stages
+
+    stages = asyncio.run(read())
+
+    assert {"connect", "execute", "fetch"} <= stages.keys()
+    assert all(seconds >= 0 for seconds in stages.values())
+    observed = timing.STAGE_SECONDS.labels("metadata.latest_common_timestamp", "execute")
+    assert observed._sum.get() >= stages["execute"]
+
+
+def test_async_repositories_roundtrip(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    start = datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc)
+    area = WeatherArea(CountryCode("AT"))
+    load_series = LoadSeries(
+        bidding_zone=bidding_zone,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=bidding_zone,
+                interval=TimeInterval(
+                    start=start + timedelta(minutes=15 * i),
+                    end=start + timedelta(minutes=15 * (i + 1)),
+                ),
+                load_mw=4500.0 + i,
+            )
+            for i in range(4)
+        ),
+    )
+    weather_series = Era5Series(
+        area=area,
+        resolution=Resolution.PT1H,
+        variable=WeatherVariable.T2M,
+        observations=(
+            InstantWeatherValue(
+                area=area, variable=WeatherVariable.T2M, valid_at=start, value=281.5
+            ),
+        ),
+    )
+
+    async def roundtrip():
+        load_repo = AsyncEntsoePostgreRepository(postgres_dsn)
+        era5_repo = AsyncEra5PostgreRepository(postgres_dsn)
+        await load_repo.add(load_series, schema=test_schema)
+        await era5_repo.add(weather_series, schema=test_schema)
+        return await asyncio.gather(
+            load_repo.get(start, start + timedelta(hours=1), bidding_zone, schema=test_schema),
+            era5_repo.get(
+                TimeInterval(start, start + timedelta(hours=1)),
+                area,
+                WeatherVariable.T2M,
+                schema=test_schema,
+            ),
+        )
+
+    loads, weather = asyncio.run(roundtrip())
+
+    assert [m.load_mw for m in loads.observations] == [4500.0, 4501.0, 4502.0, 4503.0]
+    assert [o.value for o in weather.observations] == [281.5]
+
+
+class FakeAsyncCopy:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def write_row(self, row):
+        self.cursor.copied.append(row)
+
+
+class FakeAsyncWriteCursor(FakeAsyncCursor):
+    """Answers the table, roll-up and merge queries of ``add_bulk``."""
+
+    def __init__(self):
+        super().__init__(None)
+        self.copied = []
+
+    async def executemany(self, query, params):
+        self.executed.append((query, list(params)))
+
+    async def fetchone(self):
+        query, _ = self.executed[-1]
+        if query == db_schema.IS_PARTITIONED_QUERY:
+            return (True,)
+        return (3, 1, 5)
+
+    async def fetchall(self):
+        return []
+
+    def copy(self, query):
+        self.executed.append((query, None))
+        return FakeAsyncCopy(self)
+
+
+def test_async_add_bulk_runs_the_blocking_repository_statements(bidding_zone: BiddingZone):
+    start = datetime(2025, 7, 31, 23, 30, tzinfo=timezone.utc)
+    load_series = LoadSeries(
+        bidding_zone=bidding_zone,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=bidding_zone,
+                interval=TimeInterval(
+                    start=start + timedelta(minutes=15 * i),
+                    end=start + timedelta(minutes=15 * (i + 1)),
+                ),
+                load_mw=4500.0 + i,
+            )
+            for i in range(4)
+        ),
+    )
+    pool = FakeAsyncPool()
+    cur = FakeAsyncWriteCursor()
+    pool.connection_instance.cursor_instance = cur
+    repo = AsyncEntsoePostgreRepository(pool=pool, partitioned=True)
+    blocking = EntsoePostgreRepository(pool=pool, partitioned=True)
+
+    result = asyncio.run(repo.add_bulk(load_series, schema="s", tablename="load"))
+
+    assert result == UpsertResult(inserted=3, updated=1, unchanged=1)
+    executed = [query for query, _ in cur.executed]
+    # The series spans July and August, both monthly partitions are created.
+    partitions = blocking._partition_ddl("s", "load", start, start + timedelta(minutes=45))
+    assert len(partitions) == 2
+    assert all(statement in executed for statement in partitions)
+    assert blocking._staging_copy_query("load") in executed
+    assert blocking._merge_query("s", "load") in executed
+    assert cur.copied == blocking._insert_rows(load_series)
+
+
+def test_async_repositories_bulk_roundtrip(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    start = datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc)
+    area = WeatherArea(CountryCode("AT"))
+    load_series = LoadSeries(
+        bidding_zone=bidding_zone,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=bidding_zone,
+                interval=TimeInterval(
+                    start=start + timedelta(minutes=15 * i),
+                    end=start + timedelta(minutes=15 * (i + 1)),
+                ),
+                load_mw=4500.0 + i,
+            )
+            for i in range(4)
+        ),
+    )
+    valid_time = np.array([start + timedelta(hours=i) for i in range(3)], dtype="datetime64[us]")
+    weather_series = Era5ArraySeries(
+        area=area,
+        resolution=Resolution.PT1H,
+        variable=WeatherVariable.T2M,
+        valid_time=valid_time,
+        value=np.array([281.5, 281.0, 280.5]),
+    )
+
+    async def roundtrip():
+        load_repo = AsyncEntsoePostgreRepository(postgres_dsn)
+        era5_repo = AsyncEra5PostgreRepository(postgres_dsn)
+        load_result = await load_repo.add_bulk(load_series, schema=test_schema)
+        again = await load_repo.add_bulk(load_series, schema=test_schema)
+        weather_result = await era5_repo.add_arrays([weather_series], schema=test_schema)
+        loads = await load_repo.get(
+            start, start + timedelta(hours=1), bidding_zone, schema=test_schema
+        )
+        weather = await era5_repo.get_arrays(
+            TimeInterval(start, start + timedelta(hours=3)),
+            area,
+            WeatherVariable.T2M,
+            schema=test_schema,
+        )
+        return load_result, again, weather_result, loads, weather
+
+    load_result, again, weather_result, loads, weather = asyncio.run(roundtrip())
+
+    assert load_result == UpsertResult(inserted=4, updated=0, unchanged=0)
+    assert again == UpsertResult(inserted=0, updated=0, unchanged=4)
+    assert weather_result == {WeatherVariable.T2M: UpsertResult(inserted=3, updated=0)}
+    assert [m.load_mw for m in loads.observations] == [4500.0, 4501.0, 4502.0, 4503.0]
+    assert weather.value.tolist() == [281.5, 281.0, 280.5]
@@ -0,0 +1,52 @@
+import struct
+
+import numpy as np
+import pytest
+
+from probabilistic_load_forecast.adapters.db import binary_copy
+
+
+def test_encode_writes_postgres_binary_copy_layout():
+    payload = binary_copy.encode(
+        [
+            ("timestamptz", np.array(["2000-01-01T00:00:01"], dtype="datetime64[s]")),
+            ("float8", np.array([1.5])),
+        ]
+    )
+
+    assert payload.startswith(b"PGCOPY\n\xff\r\n\x00")
+    header_length = len(binary_copy.PGCOPY_HEADER)
+    field_count, ts_len, ts, value_len, value = struct.unpack(
+        ">hiqid", payload[header_length : header_length + 26]
+    )
+    assert (field_count, ts_len, ts, value_len, value) == (2, 8, 1_000_000, 8, 1.5)
+    assert payload.endswith(b"\xff\xff")
+
+
+def test_decode_roundtrips_encoded_columns():
+    valid_time = np.array(
+        ["2018-10-01T00:00", "2018-10-01T01:00", "2026-03-27T23:00"],
+        dtype="datetime64[ns]",
+    )
+    value = np.array([275.1, np.nan, -3.25])
+
+    payload = binary_copy.encode([("timestamptz", valid_time), ("float8", value)])
+    decoded_time, decoded_value = binary_copy.decode(payload, ["timestamptz", "float8"])
+
+    np.testing.assert_array_equal(decoded_time, valid_time.astype("datetime64[us]"))
+    np.testing.assert_array_equal(decoded_value, value)
+
+
+def test_encode_rejects_columns_of_different_length():
+    with pytest.raises(ValueError, match="same length"):
+        binary_copy.encode(
+            [
+                ("timestamptz", np.array(["2018-10-01"], dtype="datetime64[us]")),
+                ("float8", np.array([1.0, 2.0])),
+            ]
+        )
+
+
+def test_decode_rejects_foreign_payload():
+    with pytest.raises(ValueError, match="binary COPY format"):
+        binary_copy.decode(b"start_ts,load_mw\n", ["timestamptz", "float8"])
@@ -0,0 +1,283 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from probabilistic_load_forecast.adapters.db import (
+    AsyncCachedEntsoeRepository,
+    CachedEntsoeRepository,
+    CachedEra5Repository,
+    QueryCache,
+)
+from probabilistic_load_forecast.adapters.db.cache import align_interval
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5ArraySeries,
+    Era5Series,
+    InstantWeatherValue,
+    LoadArraySeries,
+    LoadMeasurement,
+    LoadSeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+BIDDING_ZONE = BiddingZone(
+    eic_code="10YAT-APG------L",
+    display_name="Austria",
+    country_code=CountryCode("AT"),
+)
+AREA = WeatherArea(CountryCode("AT"))
+START = datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc)
+
+
+def _load_series(start: datetime, end: datetime) -> LoadSeries:
+    slots = int((end - start) / timedelta(minutes=15))
+    return LoadSeries(
+        bidding_zone=BIDDING_ZONE,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=BIDDING_ZONE,
+                interval=TimeInterval(
+                    start + timedelta(minutes=15 * i), start + timedelta(minutes=15 * (i + 1))
+                ),
+                load_mw=float(i),
+            )
+            for i in range(slots)
+        ),
+    )
+
+
+class FakeLoadRepository:
+    def __init__(self):
+        self.reads = []
+        self.writes = 0
+
+    def get(self, start, end, bidding_zone, schema="public", tablename="actual_total_load"):
+        self.reads.append((start, end))
+        return _load_series(start, end)
+
+    def add(self, load_series, schema="public", tablename="actual_total_load"):
+        self.writes += 1
+
+    add_bulk = add
+
+
+class FakeAsyncLoadRepository(FakeLoadRepository):
+    async def get(self, *args, **kwargs):
+        return super().get(*args, **kwargs)
+
+
+class FakeHourlyLoadRepository:
+    """A zone with hourly slots, reads return the slots overlapping a window."""
+
+    def __init__(self):
+        self.start_ts = np.datetime64("2025-07-13T00:00", "us") + np.arange(24) * np.timedelta64(
+            1, "h"
+        )
+        self.reads = []
+
+    async def get_arrays(
+        self, start, end, bidding_zone, schema="public", tablename="actual_total_load"
+    ):
+        self.reads.append((start, end))
+        start64 = np.datetime64(start.replace(tzinfo=None), "us")
+        end64 = np.datetime64(end.replace(tzinfo=None), "us")
+        mask = (self.start_ts + np.timedelta64(1, "h") > start64) & (self.start_ts < end64)
+        return LoadArraySeries(
+            bidding_zone,
+            Resolution.PT1H,
+            self.start_ts[mask],
+            np.arange(24, dtype=np.float64)[mask],
+        )
+
+
+class FakeEra5Repository:
+    def __init__(self):
+        self.reads = []
+        self.written = []
+
+    def get(self, interval, area, variable, schema="public"):
+        self.reads.append(interval)
+        hours = int((interval.end - interval.start) / timedelta(hours=1))
+        return Era5Series(
+            area=area,
+            resolution=Resolution.PT1H,
+            variable=variable,
+            observations=tuple(
+                InstantWeatherValue(
+                    area=area,
+                    variable=variable,
+                    valid_at=interval.start + timedelta(hours=i),
+                    value=float(i),
+                )
+                for i in range(hours)
+            ),
+        )
+
+    def add_arrays(self, weather_series, schema="public"):
+        self.written.extend(weather_series)
+        return {}
+
+
+def test_align_interval_widens_to_whole_slots():
+    start, end = align_interval(
+        START + timedelta(minutes=7), START + timedelta(hours=1, minutes=1), timedelta(minutes=15)
+    )
+
+    assert start == START
+    assert end == START + timedelta(hours=1, minutes=15)
+
+
+def test_windows_within_one_slot_share_an_entry_and_are_trimmed():
+    repo = FakeLoadRepository()
+    cached = CachedEntsoeRepository(repo, QueryCache())
+
+    first = cached.get(START + timedelta(minutes=20), START + timedelta(hours=2), BIDDING_ZONE)
+    second = cached.get(START + timedelta(minutes=16), START + timedelta(hours=2), BIDDING_ZONE)
+
+    assert repo.reads == [(START + timedelta(minutes=15), START + timedelta(hours=2))]
+    assert first == second
+    assert first.observations[0].interval.start == START + timedelta(minutes=15)
+    assert cached.cache.statistics().hits == 1
+    assert cached.cache.statistics().misses == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    repo = FakeLoadRepository()
+    cached = CachedEntsoeRepository(repo, QueryCache(max_entries=2))
+    windows = [(START + timedelta(days=i), START + timedelta(days=i + 1)) for i in range(3)]
+
+    cached.get(*windows[0], BIDDING_ZONE)
+    cached.get(*windows[1], BIDDING_ZONE)
+    cached.get(*windows[0], BIDDING_ZONE)
+    cached.get(*windows[2], BIDDING_ZONE)
+    cached.get(*windows[0], BIDDING_ZONE)
+    cached.get(*windows[1], BIDDING_ZONE)
+
+    stats = cached.cache.statistics()
+    assert repo.reads == [windows[0], windows[1], windows[2], windows[1]]
+    assert stats.entries == 2
+    assert stats.evictions == 2
+
+
+def test_open_intervals_expire_before_closed_ones():
+    clock = [0.0]
+    cache = QueryCache(
+        closed_ttl=timedelta(hours=1),
+        open_ttl=timedelta(minutes=1),
+        open_window=timedelta(days=1),
+        clock=lambda: clock[0],
+        now=lambda: START + timedelta(days=10),
+    )
+    repo = FakeLoadRepository()
+    cached = CachedEntsoeRepository(repo, cache)
+    closed = (START, START + timedelta(days=1))
+    open_ = (START + timedelta(days=9), START + timedelta(days=10))
+
+    cached.get(*closed, BIDDING_ZONE)
+    cached.get(*open_, BIDDING_ZONE)
+    clock[0] = 120.0
+    cached.get(*closed, BIDDING_ZONE)
+    cached.get(*open_, BIDDING_ZONE)
+
+    assert repo.reads == [closed, open_, open_]
+
+
+def test_add_invalidates_overlapping_entries_only():
+    repo = FakeLoadRepository()
+    cached = CachedEntsoeRepository(repo, QueryCache())
+    day_one = (START, START + timedelta(days=1))
+    day_three = (START + timedelta(days=2), START + timedelta(days=3))
+    cached.get(*day_one, BIDDING_ZONE)
+    cached.get(*day_three, BIDDING_ZONE)
+
+    cached.add(_load_series(START + timedelta(hours=6), START + timedelta(hours=7)))
+    cached.get(*day_one, BIDDING_ZONE)
+    cached.get(*day_three, BIDDING_ZONE)
+
+    assert repo.writes == 1
+    assert repo.reads == [day_one, day_three, day_one]
+    assert cached.cache.statistics().invalidations == 1
+
+
+def test_bulk_add_of_arrays_invalidates_the_written_slots_only():
+    repo = FakeLoadRepository()
+    cached = CachedEntsoeRepository(repo, QueryCache())
+    day_one = (START, START + timedelta(days=1))
+    day_three = (START + timedelta(days=2), START + timedelta(days=3))
+    cached.get(*day_one, BIDDING_ZONE)
+    cached.get(*day_three, BIDDING_ZONE)
+
+    cached.add_bulk(
+        LoadArraySeries(
+            bidding_zone=BIDDING_ZONE,
+            resolution=Resolution.PT15M,
+            start_ts=np.array(["2025-07-13T23:45"], dtype="datetime64[us]"),
+            load_mw=np.array([4500.0]),
+        )
+    )
+    cached.get(*day_one, BIDDING_ZONE)
+    cached.get(*day_three, BIDDING_ZONE)
+
+    assert repo.reads == [day_one, day_three, day_one]
+
+
+def test_add_arrays_invalidates_the_written_variables():
+    repo = FakeEra5Repository()
+    cached = CachedEra5Repository(repo, QueryCache())
+    interval = TimeInterval(START, START + timedelta(days=1))
+    cached.get(interval, AREA, WeatherVariable.T2M)
+    cached.get(interval, AREA, WeatherVariable.U10)
+
+    cached.add_arrays(
+        Era5ArraySeries(
+            area=AREA,
+            resolution=Resolution.PT1H,
+            variable=WeatherVariable.T2M,
+            valid_time=np.array(["2025-07-13T05:00"], dtype="datetime64[us]"),
+            value=np.array([290.0]),
+        )
+        for _ in range(1)
+    )
+    cached.get(interval, AREA, WeatherVariable.T2M)
+    cached.get(interval, AREA, WeatherVariable.U10)
+
+    assert len(repo.written) == 1
+    assert repo.reads == [interval, interval, interval]
+
+
+def test_async_wrapper_serves_repeated_reads_from_the_cache():
+    repo = FakeAsyncLoadRepository()
+    cached = AsyncCachedEntsoeRepository(repo, QueryCache())
+
+    async def read_twice():
+        for _ in range(2):
+            series = await cached.get(START, START + timedelta(hours=1), BIDDING_ZONE)
+        return series
+
+    series = asyncio.run(read_twice())
+
+    assert len(series.observations) == 4
+    assert repo.reads == [(START, START + timedelta(hours=1))]
+
+
+def test_cached_arrays_of_an_hourly_zone_keep_the_slot_overlapping_the_start():
+    repo = FakeHourlyLoadRepository()
+    cached = AsyncCachedEntsoeRepository(repo, QueryCache())
+    start = START + timedelta(hours=10, minutes=30)
+    end = START + timedelta(hours=12)
+
+    series = asyncio.run(cached.get_arrays(start, end, BIDDING_ZONE))
+    uncached = asyncio.run(repo.get_arrays(start, end, BIDDING_ZONE))
+
+    np.testing.assert_array_equal(
+        series.start_ts,
+        np.array(["2025-07-13T10:00", "2025-07-13T11:00"], dtype="datetime64[us]"),
+    )
+    np.testing.assert_array_equal(series.start_ts, uncached.start_ts)
+    assert series.resolution == Resolution.PT1H
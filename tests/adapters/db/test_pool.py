@@ -0,0 +1,93 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from probabilistic_load_forecast.adapters.db import (
+    ForecastMetadataRepository,
+    PoolSettings,
+    PoolStatistics,
+)
+from probabilistic_load_forecast.adapters.db.repository import PostgresRepository
+
+
+class FakeCursor:
+    def __init__(self, row):
+        self.row = row
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchone(self):
+        return self.row
+
+
+class FakeConnection:
+    def __init__(self, row):
+        self.cursor_instance = FakeCursor(row)
+
+    def cursor(self):
+        return self.cursor_instance
+
+
+class FakePool:
+    def __init__(self, row=None, stats=None):
+        self.connection_instance = FakeConnection(row)
+        self.stats = stats or {}
+        self.checkouts = 0
+
+    @contextmanager
+    def connection(self):
+        self.checkouts += 1
+        yield self.connection_instance
+
+    def get_stats(self):
+        return self.stats
+
+
+def test_pool_settings_rejects_max_size_below_min_size():
+    with pytest.raises(ValueError, match="max_size"):
+        PoolSettings(min_size=5, max_size=2)
+
+
+def test_repository_requires_dsn_or_pool():
+    with pytest.raises(ValueError, match="dsn or a connection pool"):
+        PostgresRepository()
+
+
+def test_repository_borrows_connections_from_pool():
+    latest = datetime(2026, 3, 27, 23, 0, tzinfo=timezone.utc)
+    pool = FakePool(row=(latest,))
+    repo = ForecastMetadataRepository(pool=pool)
+
+    assert repo.get_latest_common_timestamp() == latest
+    assert repo.get_latest_common_timestamp() == latest
+    assert pool.checkouts == 2
+
+
+def test_pool_statistics_reports_in_use_connections_and_wait_time():
+    pool = FakePool(
+        stats={
+            "pool_min": 2,
+            "pool_max": 10,
+            "pool_size": 6,
+            "pool_available": 2,
+            "requests_num": 120,
+            "requests_queued": 8,
+            "requests_wait_ms": 40,
+        }
+    )
+
+    stats = PoolStatistics.from_pool(pool)
+
+    assert stats.in_use == 4
+    assert stats.requests_total == 120
+    assert stats.requests_waiting == 0
+    assert stats.mean_wait_ms == 5.0
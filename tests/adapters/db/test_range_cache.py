@@ -0,0 +1,366 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from probabilistic_load_forecast.adapters.db import (
+    AsyncCachedEntsoeRepository,
+    AsyncEntsoePostgreRepository,
+    AsyncEra5PostgreRepository,
+    AsyncLoadRangeCache,
+    AsyncWeatherRangeCache,
+    Era5PostgreRepository,
+    QueryCache,
+)
+from probabilistic_load_forecast.adapters.db.range_cache import cover, uncovered
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5ArraySeries,
+    Era5Frame,
+    LoadArraySeries,
+    LoadMeasurement,
+    LoadSeries,
+    RESOLUTION_LENGTH,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+BIDDING_ZONE = BiddingZone(
+    eic_code="10YAT-APG------L",
+    display_name="Austria",
+    country_code=CountryCode("AT"),
+)
+AREA = WeatherArea(CountryCode("AT"))
+START = datetime(2025, 7, 1, 0, 0, tzinfo=timezone.utc)
+DAY = timedelta(days=1)
+
+
+def _datetime64(value: datetime) -> np.datetime64:
+    return np.datetime64(value.replace(tzinfo=None), "us")
+
+
+class FakeClock:
+    def __init__(self):
+        self.monotonic = 0.0
+        self.now = START + 8 * DAY
+
+    def advance(self, delta: timedelta) -> None:
+        self.monotonic += delta.total_seconds()
+        self.now += delta
+
+
+class FakeLoadRepository:
+    """Thirty days of slots, reads return the slots overlapping a window."""
+
+    def __init__(self, resolution: Resolution = Resolution.PT15M):
+        self.resolution = resolution
+        self.slot = np.timedelta64(RESOLUTION_LENGTH[resolution])
+        self.start_ts = _datetime64(START) + np.arange(30 * DAY // self.slot.item()) * self.slot
+        self.load_mw = np.arange(len(self.start_ts), dtype=np.float64)
+        self.fetched_rows = 0
+        self.added = []
+
+    async def get_arrays(
+        self, start, end, bidding_zone, schema="public", tablename="actual_total_load"
+    ):
+        mask = (self.start_ts + self.slot > _datetime64(start)) & (
+            self.start_ts < _datetime64(end)
+        )
+        self.fetched_rows += int(mask.sum())
+        return LoadArraySeries(
+            bidding_zone, self.resolution, self.start_ts[mask], self.load_mw[mask]
+        )
+
+    async def add(self, load_series, schema="public", tablename="actual_total_load"):
+        self.added.append(load_series)
+
+
+class FakeEra5Repository:
+    """Thirty days of hourly interval-end values, valid in (start, end]."""
+
+    def __init__(self):
+        self.valid_time = _datetime64(START) + np.arange(30 * 24) * np.timedelta64(1, "h")
+        self.fetched_rows = 0
+        self.frames = 0
+
+    async def get_arrays(self, interval, area, variable, schema="public"):
+        mask = (self.valid_time > _datetime64(interval.start)) & (
+            self.valid_time <= _datetime64(interval.end)
+        )
+        self.fetched_rows += int(mask.sum())
+        return Era5ArraySeries(
+            area=area,
+            resolution=Resolution.PT1H,
+            variable=variable,
+            valid_time=self.valid_time[mask],
+            value=np.flatnonzero(mask).astype(np.float64),
+        )
+
+    async def get_frame(self, interval, area, variables, schema="public"):
+        self.frames += 1
+        return Era5Frame(area, Resolution.PT1H, np.array([], dtype="datetime64[us]"), {})
+
+
+def test_uncovered_returns_the_gaps_around_covered_segments():
+    segments = cover(cover([], START + DAY, START + 2 * DAY), START + 3 * DAY, START + 4 * DAY)
+
+    assert uncovered(segments, START, START + 5 * DAY) == [
+        (START, START + DAY),
+        (START + 2 * DAY, START + 3 * DAY),
+        (START + 4 * DAY, START + 5 * DAY),
+    ]
+    assert uncovered(segments, START + DAY, START + 2 * DAY) == []
+
+
+def test_cover_merges_touching_segments():
+    segments = cover(cover([], START, START + DAY), START + DAY, START + 2 * DAY)
+
+    assert segments == [(START, START + 2 * DAY)]
+
+
+def test_panned_load_window_fetches_only_the_new_day():
+    repo = FakeLoadRepository()
+    cache = AsyncLoadRangeCache(repo)
+
+    first = asyncio.run(cache.get_arrays(START, START + 8 * DAY, BIDDING_ZONE))
+    rows_first = repo.fetched_rows
+    panned = asyncio.run(cache.get_arrays(START + DAY, START + 9 * DAY, BIDDING_ZONE))
+    rows_panned = repo.fetched_rows - rows_first
+
+    expected = asyncio.run(
+        FakeLoadRepository().get_arrays(START + DAY, START + 9 * DAY, BIDDING_ZONE)
+    )
+    assert len(first) == 8 * 96
+    assert rows_panned < rows_first
+    assert rows_panned == 96
+    np.testing.assert_array_equal(panned.start_ts, expected.start_ts)
+    np.testing.assert_array_equal(panned.load_mw, expected.load_mw)
+
+
+def test_window_inside_covered_range_fetches_nothing():
+    repo = FakeLoadRepository()
+    cache = AsyncLoadRangeCache(repo)
+    asyncio.run(cache.get_arrays(START, START + 8 * DAY, BIDDING_ZONE))
+    rows = repo.fetched_rows
+
+    inner = asyncio.run(
+        cache.get_arrays(START + timedelta(days=2, minutes=7), START + 3 * DAY, BIDDING_ZONE)
+    )
+
+    assert repo.fetched_rows == rows
+    assert inner.start_ts[0] == _datetime64(START + 2 * DAY)
+    assert len(inner) == 96
+
+
+def test_open_window_is_read_again_after_the_open_ttl():
+    repo = FakeLoadRepository()
+    clock = FakeClock()
+    cache = AsyncLoadRangeCache(
+        repo,
+        open_ttl=timedelta(minutes=1),
+        open_window=2 * DAY,
+        clock=lambda: clock.monotonic,
+        now=lambda: clock.now,
+    )
+    asyncio.run(cache.get_arrays(START, START + 8 * DAY, BIDDING_ZONE))
+    rows = repo.fetched_rows
+
+    clock.advance(timedelta(seconds=30))
+    asyncio.run(cache.get_arrays(START, START + 8 * DAY, BIDDING_ZONE))
+    assert repo.fetched_rows == rows
+
+    clock.advance(timedelta(seconds=30))
+    repo.load_mw = repo.load_mw + 1.0
+    series = asyncio.run(cache.get_arrays(START, START + 8 * DAY, BIDDING_ZONE))
+
+    # Only the slots after now - open_window are read again.
+    assert repo.fetched_rows - rows == 2 * 96
+    assert series.load_mw[0] == 0.0
+    assert series.load_mw[-1] == 8 * 96
+    assert len(series) == 8 * 96
+
+
+def test_closed_coverage_expires_after_the_closed_ttl():
+    repo = FakeLoadRepository()
+    clock = FakeClock()
+    cache = AsyncLoadRangeCache(
+        repo, closed_ttl=timedelta(hours=1), clock=lambda: clock.monotonic, now=lambda: clock.now
+    )
+    asyncio.run(cache.get_arrays(START, START + DAY, BIDDING_ZONE))
+
+    clock.advance(timedelta(hours=1))
+    asyncio.run(cache.get_arrays(START, START + DAY, BIDDING_ZONE))
+
+    assert repo.fetched_rows == 2 * 96
+
+
+def test_add_drops_the_coverage_of_the_written_zone():
+    repo = FakeLoadRepository()
+    cache = AsyncLoadRangeCache(repo)
+    asyncio.run(cache.get_arrays(START, START + DAY, BIDDING_ZONE))
+    load_series = LoadSeries(
+        bidding_zone=BIDDING_ZONE,
+        resolution=Resolution.PT15M,
+        observations=(
+            LoadMeasurement(
+                bidding_zone=BIDDING_ZONE,
+                interval=TimeInterval(START, START + timedelta(minutes=15)),
+                load_mw=4500.0,
+            ),
+        ),
+    )
+
+    asyncio.run(cache.add(load_series))
+    asyncio.run(cache.get_arrays(START, START + DAY, BIDDING_ZONE))
+
+    assert repo.added == [load_series]
+    assert repo.fetched_rows == 2 * 96
+
+
+def test_invalidate_table_drops_the_key_in_every_schema():
+    repo = FakeLoadRepository()
+    cache = AsyncLoadRangeCache(repo)
+    for schema in ("public", "staging"):
+        asyncio.run(cache.get_arrays(START, START + DAY, BIDDING_ZONE, schema=schema))
+
+    cache.invalidate_table("actual_total_load", BIDDING_ZONE.eic_code)
+    asyncio.run(cache.get_arrays(START, START + DAY, BIDDING_ZONE))
+
+    assert repo.fetched_rows == 3 * 96
+
+
+def test_query_cache_misses_go_through_the_range_cache():
+    repo = FakeLoadRepository()
+    cached = AsyncCachedEntsoeRepository(AsyncLoadRangeCache(repo), QueryCache())
+
+    asyncio.run(cached.get_arrays(START, START + 8 * DAY, BIDDING_ZONE))
+    panned = asyncio.run(cached.get_arrays(START + DAY, START + 9 * DAY, BIDDING_ZONE))
+
+    assert repo.fetched_rows == 9 * 96
+    assert len(panned) == 8 * 96
+
+
+def test_hourly_slots_overlapping_the_window_start_are_kept():
+    repo = FakeLoadRepository(Resolution.PT1H)
+    cache = AsyncLoadRangeCache(repo)
+    asyncio.run(cache.get_arrays(START + timedelta(hours=12), START + DAY, BIDDING_ZONE))
+
+    series = asyncio.run(
+        cache.get_arrays(START + timedelta(hours=10, minutes=30), START + DAY, BIDDING_ZONE)
+    )
+
+    assert series.resolution == Resolution.PT1H
+    assert series.start_ts[0] == _datetime64(START + timedelta(hours=10))
+    assert len(series) == 14
+
+
+def test_weather_gaps_are_stitched_into_period_starts():
+    repo = FakeEra5Repository()
+    cache = AsyncWeatherRangeCache(repo)
+    for day in (1, 3):
+        asyncio.run(
+            cache.get_frame(
+                TimeInterval(START + day * DAY, START + (day + 1) * DAY), AREA, [WeatherVariable.TP]
+            )
+        )
+    rows = repo.fetched_rows
+
+    frame = asyncio.run(
+        cache.get_frame(TimeInterval(START, START + 5 * DAY), AREA, [WeatherVariable.TP])
+    )
+
+    # Values valid in (START, START + 5 days] start one hour earlier.
+    expected = _datetime64(START) + np.arange(5 * 24) * np.timedelta64(1, "h")
+    assert repo.fetched_rows - rows == 3 * 24
+    assert cache.fetched_ranges == 5
+    np.testing.assert_array_equal(frame.timestamps, expected)
+    np.testing.assert_array_equal(frame.values[WeatherVariable.TP], np.arange(1.0, 5 * 24 + 1))
+
+
+def test_weather_frames_of_several_variables_are_passed_on():
+    repo = FakeEra5Repository()
+    cache = AsyncWeatherRangeCache(repo)
+
+    asyncio.run(
+        cache.get_frame(
+            TimeInterval(START, START + DAY), AREA, [WeatherVariable.TP, WeatherVariable.T2M]
+        )
+    )
+
+    assert repo.frames == 1
+    assert repo.fetched_rows == 0
+
+
+def test_load_range_cache_matches_repository_reads(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    repo = AsyncEntsoePostgreRepository(postgres_dsn)
+    cache = AsyncLoadRangeCache(repo)
+    load_series = LoadSeries(
+        bidding_zone=bidding_zone,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=bidding_zone,
+                interval=TimeInterval(
+                    START + timedelta(minutes=15 * i),
+                    START + timedelta(minutes=15 * (i + 1)),
+                ),
+                load_mw=4000.0 + i,
+            )
+            for i in range(3 * 96)
+        ),
+    )
+
+    async def pan():
+        await cache.add(load_series, schema=test_schema)
+        await cache.get_arrays(START, START + 2 * DAY, bidding_zone, schema=test_schema)
+        panned = await cache.get_arrays(
+            START + DAY, START + 3 * DAY, bidding_zone, schema=test_schema
+        )
+        expected = await repo.get_arrays(
+            START + DAY, START + 3 * DAY, bidding_zone, schema=test_schema
+        )
+        return panned, expected
+
+    panned, expected = asyncio.run(pan())
+
+    np.testing.assert_array_equal(panned.start_ts, expected.start_ts)
+    np.testing.assert_array_equal(panned.load_mw, expected.load_mw)
+    assert cache.fetched_rows == 3 * 96
+
+
+def test_weather_range_cache_matches_repository_frames(postgres_dsn: str, test_schema: str):
+    Era5PostgreRepository(postgres_dsn).add_arrays(
+        [
+            Era5ArraySeries(
+                area=AREA,
+                resolution=Resolution.PT1H,
+                variable=variable,
+                valid_time=_datetime64(START) + np.arange(3 * 24) * np.timedelta64(1, "h"),
+                value=np.arange(3 * 24, dtype=np.float64),
+            )
+            for variable in (WeatherVariable.TP, WeatherVariable.T2M)
+        ],
+        schema=test_schema,
+    )
+    repo = AsyncEra5PostgreRepository(postgres_dsn)
+    cache = AsyncWeatherRangeCache(repo)
+    panned = TimeInterval(START + DAY, START + 3 * DAY)
+
+    async def pan(variable):
+        await cache.get_frame(
+            TimeInterval(START, START + 2 * DAY), AREA, [variable], schema=test_schema
+        )
+        return (
+            await cache.get_frame(panned, AREA, [variable], schema=test_schema),
+            await repo.get_frame(panned, AREA, [variable], schema=test_schema),
+        )
+
+    for variable in (WeatherVariable.TP, WeatherVariable.T2M):
+        frame, expected = asyncio.run(pan(variable))
+        np.testing.assert_array_equal(frame.timestamps, expected.timestamps)
+        np.testing.assert_array_equal(frame.values[variable], expected.values[variable])
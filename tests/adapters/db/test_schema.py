@@ -0,0 +1,198 @@
+from datetime import datetime, timedelta, timezone
+
+import psycopg
+from psycopg import sql
+
+from probabilistic_load_forecast.adapters.db import schema as db_schema
+from probabilistic_load_forecast.adapters.db.repository import (
+    EntsoePostgreRepository,
+    Era5PostgreRepository,
+)
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5Series,
+    InstantWeatherValue,
+    LoadMeasurement,
+    LoadSeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+
+def _series_over_months(bidding_zone: BiddingZone) -> LoadSeries:
+    # One slot per day from mid November to mid February, spanning a year change.
+    start = datetime(2024, 11, 15, tzinfo=timezone.utc)
+    return LoadSeries(
+        bidding_zone=bidding_zone,
+        resolution=Resolution.PT15M,
+        observations=tuple(
+            LoadMeasurement(
+                bidding_zone=bidding_zone,
+                interval=TimeInterval(
+                    start=start + timedelta(days=i),
+                    end=start + timedelta(days=i, minutes=15),
+                ),
+                load_mw=4000.0 + i,
+            )
+            for i in range(90)
+        ),
+    )
+
+
+def _t2m_series_over_years() -> Era5Series:
+    # One value per week from mid 2023 to mid 2025.
+    area = WeatherArea(CountryCode("AT"))
+    start = datetime(2023, 7, 1, tzinfo=timezone.utc)
+    return Era5Series(
+        area=area,
+        resolution=Resolution.PT1H,
+        variable=WeatherVariable.T2M,
+        observations=tuple(
+            InstantWeatherValue(
+                area=area,
+                variable=WeatherVariable.T2M,
+                valid_at=start + timedelta(weeks=i),
+                value=280.0 + i % 10,
+            )
+            for i in range(104)
+        ),
+    )
+
+
+def _explain(postgres_dsn: str, query: sql.Composed, params) -> str:
+    with psycopg.connect(postgres_dsn) as con:
+        with con.cursor() as cur:
+            cur.execute("SET enable_seqscan = off")
+            cur.execute(sql.SQL("EXPLAIN ") + query, params)
+            return "\n".join(row[0] for row in cur.fetchall())
+
+
+def test_month_starts_cover_every_touched_month():
+    months = list(
+        db_schema.month_starts(
+            datetime(2024, 11, 30, 23, 45, tzinfo=timezone.utc),
+            datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc),
+        )
+    )
+
+    assert months == [
+        datetime(2024, 11, 1, tzinfo=timezone.utc),
+        datetime(2024, 12, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+    ]
+
+
+def test_monthly_partition_ddl_bounds_one_month():
+    statement = db_schema.monthly_partition_ddl(
+        "public", "actual_total_load", datetime(2024, 12, 1, tzinfo=timezone.utc)
+    ).as_string()
+
+    assert '"public"."actual_total_load_p202412"' in statement
+    assert "2024-12-01" in statement
+    assert "2025-01-01" in statement
+
+
+def test_load_table_ddl_partitions_by_start_ts_only_when_requested():
+    heap = db_schema.load_table_ddl("public")[0].as_string()
+    partitioned = db_schema.load_table_ddl("public", partitioned=True)[0].as_string()
+
+    assert "PARTITION BY" not in heap
+    assert "PARTITION BY RANGE (start_ts)" in partitioned
+
+
+def test_yearly_partition_ddl_bounds_one_year():
+    statement = db_schema.yearly_partition_ddl(
+        "public", "t2m_country_avg", datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ).as_string()
+
+    assert '"public"."t2m_country_avg_y2024"' in statement
+    assert "2024-01-01" in statement
+    assert "2025-01-01" in statement
+
+
+def test_weather_table_ddl_adds_brin_index_and_optional_partitioning():
+    heap = [s.as_string() for s in db_schema.weather_table_ddl("public", "t2m_country_avg")]
+    partitioned = db_schema.weather_table_ddl("public", "t2m_country_avg", partitioned=True)
+
+    assert "PARTITION BY" not in heap[0]
+    assert "USING brin (valid_time)" in heap[1]
+    assert "PARTITION BY RANGE (valid_time)" in partitioned[0].as_string()
+
+
+def test_load_range_read_uses_zone_start_index(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    repo = EntsoePostgreRepository(postgres_dsn)
+    repo.add(_series_over_months(bidding_zone), schema=test_schema)
+
+    plan = _explain(
+        postgres_dsn,
+        repo._select_query(test_schema, "actual_total_load"),
+        repo._select_params(
+            bidding_zone,
+            datetime(2024, 12, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+    assert "actual_total_load_zone_start_idx" in plan
+
+
+def test_partitioned_load_table_prunes_partitions_outside_the_range(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    repo = EntsoePostgreRepository(postgres_dsn, partitioned=True)
+    repo.add(_series_over_months(bidding_zone), schema=test_schema)
+
+    plan = _explain(
+        postgres_dsn,
+        repo._select_query(test_schema, "actual_total_load"),
+        repo._select_params(
+            bidding_zone,
+            datetime(2024, 12, 10, tzinfo=timezone.utc),
+            datetime(2024, 12, 20, tzinfo=timezone.utc),
+        ),
+    )
+
+    assert "actual_total_load_p202412" in plan
+    assert "actual_total_load_p202411" not in plan
+    assert "actual_total_load_p202502" not in plan
+
+    series = repo.get(
+        start=datetime(2024, 12, 10, tzinfo=timezone.utc),
+        end=datetime(2024, 12, 20, tzinfo=timezone.utc),
+        bidding_zone=bidding_zone,
+        schema=test_schema,
+    )
+    assert len(series.observations) == 10
+
+
+def test_partitioned_weather_table_prunes_years_outside_the_range(
+    postgres_dsn: str, test_schema: str
+):
+    repo = Era5PostgreRepository(postgres_dsn, partitioned=True)
+    repo.add(_t2m_series_over_years(), schema=test_schema)
+
+    plan = _explain(
+        postgres_dsn,
+        repo._select_query(test_schema, WeatherVariable.T2M),
+        (
+            "AT",
+            datetime(2024, 3, 1, tzinfo=timezone.utc),
+            datetime(2024, 4, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+    assert "t2m_country_avg_y2024" in plan
+    assert "t2m_country_avg_y2023" not in plan
+    assert "t2m_country_avg_y2025" not in plan
+
+    with psycopg.connect(postgres_dsn) as con:
+        indexes = con.execute(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = %s",
+            (test_schema,),
+        ).fetchall()
+    assert ("t2m_country_avg_valid_time_brin",) in indexes
@@ -0,0 +1,259 @@
+import os
+import resource
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import psycopg
+import pyarrow as pa
+from fastapi.testclient import TestClient
+from psycopg import sql
+
+from apps.api.main import app, get_load_repository
+from probabilistic_load_forecast.adapters.db import AsyncEntsoePostgreRepository
+from probabilistic_load_forecast.adapters.db.repository import (
+    EntsoePostgreRepository,
+    Era5PostgreRepository,
+)
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5Series,
+    LoadArraySeries,
+    LoadSeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+SERIES_START = datetime(2018, 1, 1, tzinfo=timezone.utc)
+SYNTHETIC_ROWS = int(os.getenv("PLF_STREAM_TEST_ROWS", "2000000"))
+# Rows of the table behind the streamed NDJSON response. Set to 10000000, ~285
+# years of slots, to check a large response outside of CI.
+STREAM_RESPONSE_ROWS = int(os.getenv("PLF_STREAM_RESPONSE_TEST_ROWS", "200000"))
+
+
+def _seed_load_rows(dsn: str, schema: str, rows: int) -> None:
+    repo = EntsoePostgreRepository(dsn)
+    with psycopg.connect(dsn) as con:
+        with con.cursor() as cur:
+            repo._create_table("actual_total_load", cur, schema)
+            cur.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO {} (start_ts, end_ts, load_mw, zone_code)
+                    SELECT ts, ts + interval '15 minutes', 5000 + (n % 96), '10YAT-APG------L'
+                    FROM generate_series(0, %s - 1) AS n,
+                    LATERAL (SELECT %s::timestamptz + n * interval '15 minutes' AS ts) t
+                    """
+                ).format(sql.Identifier(schema, "actual_total_load")),
+                (rows, SERIES_START),
+            )
+
+
+def test_load_iter_batches_yields_sorted_domain_batches(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    _seed_load_rows(postgres_dsn, test_schema, 10)
+    repo = EntsoePostgreRepository(postgres_dsn)
+
+    batches = list(
+        repo.iter_batches(
+            SERIES_START,
+            SERIES_START + timedelta(hours=3),
+            bidding_zone,
+            batch_size=4,
+            schema=test_schema,
+        )
+    )
+
+    assert [len(batch.observations) for batch in batches] == [4, 4, 2]
+    assert all(isinstance(batch, LoadSeries) for batch in batches)
+    starts = [obs.interval.start for batch in batches for obs in batch.observations]
+    assert starts == [SERIES_START + timedelta(minutes=15 * i) for i in range(10)]
+
+
+def test_era5_iter_batches_yields_domain_and_columnar_chunks(
+    postgres_dsn: str, test_schema: str
+):
+    area = WeatherArea(CountryCode("AT"))
+    repo = Era5PostgreRepository(postgres_dsn)
+    with psycopg.connect(postgres_dsn) as con:
+        with con.cursor() as cur:
+            repo._create_table("t2m_country_avg", cur, test_schema)
+            cur.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO {} (valid_time, value, stat, interval_seconds, country_code)
+                    SELECT %s::timestamptz + n * interval '1 hour', n, 'instant', 3600, 'AT'
+                    FROM generate_series(0, 23) AS n
+                    """
+                ).format(sql.Identifier(test_schema, "t2m_country_avg")),
+                (SERIES_START,),
+            )
+    interval = TimeInterval(SERIES_START, SERIES_START + timedelta(days=1))
+
+    domain = list(
+        repo.iter_batches(
+            interval, area, WeatherVariable.T2M, batch_size=10, schema=test_schema
+        )
+    )
+    columnar = list(
+        repo.iter_batches(
+            interval,
+            area,
+            WeatherVariable.T2M,
+            batch_size=10,
+            columnar=True,
+            schema=test_schema,
+        )
+    )
+
+    assert all(isinstance(batch, Era5Series) for batch in domain)
+    assert [len(batch.observations) for batch in domain] == [10, 10, 4]
+    np.testing.assert_array_equal(
+        np.concatenate([chunk.value for chunk in columnar]), np.arange(24.0)
+    )
+    assert columnar[0].valid_time[0] == np.datetime64("2018-01-01T00:00", "us")
+
+
+def test_load_iter_batches_keeps_memory_bounded_on_large_table(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    _seed_load_rows(postgres_dsn, test_schema, SYNTHETIC_ROWS)
+    repo = EntsoePostgreRepository(postgres_dsn)
+    batch_size = 50_000
+
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    try:
+        rows = 0
+        total = 0.0
+        for chunk in repo.iter_batches(
+            SERIES_START,
+            SERIES_START + timedelta(minutes=15) * SYNTHETIC_ROWS,
+            bidding_zone,
+            batch_size=batch_size,
+            columnar=True,
+            schema=test_schema,
+        ):
+            rows += len(chunk)
+            total += float(chunk.load_mw.sum())
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rss_growth_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before_kb) / 1024
+
+    print(
+        f"streamed {rows} rows, traced peak {peak_bytes / 2**20:.1f} MiB, "
+        f"peak RSS growth {rss_growth_mb:.1f} MiB"
+    )
+    assert rows == SYNTHETIC_ROWS
+    assert total > 0
+    # A full fetchall of 2M rows needs well over 500 MiB of Python objects,
+    # a streamed read only ever holds a single batch.
+    assert peak_bytes < 64 * 2**20
+
+
+class _SchemaBoundRepository:
+    """Reads ``iter_batches`` from the test schema, the endpoint always reads ``public``."""
+
+    def __init__(self, repo: AsyncEntsoePostgreRepository, schema: str):
+        self.repo = repo
+        self.schema = schema
+
+    def iter_batches(self, *args, **kwargs):
+        return self.repo.iter_batches(*args, schema=self.schema, **kwargs)
+
+
+class _BodyCounter:
+    """ASGI wrapper that counts the streamed body instead of buffering it.
+
+    The test client collects the whole body before returning, which would
+    hide whether the endpoint itself keeps memory flat.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.chunks = self.lines = self.size = 0
+
+    async def __call__(self, scope, receive, send):
+        async def counting_send(message):
+            if message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                self.chunks += bool(body)
+                self.lines += body.count(b"\n")
+                self.size += len(body)
+                message = {**message, "body": b""}
+            await send(message)
+
+        await self.app(scope, receive, counting_send)
+
+
+def test_load_stream_endpoint_keeps_memory_flat(
+    postgres_dsn: str, test_schema: str, bidding_zone: BiddingZone
+):
+    _seed_load_rows(postgres_dsn, test_schema, STREAM_RESPONSE_ROWS)
+    repo = _SchemaBoundRepository(AsyncEntsoePostgreRepository(postgres_dsn), test_schema)
+    app.dependency_overrides[get_load_repository] = lambda: repo
+    counter = _BodyCounter(app)
+
+    tracemalloc.start()
+    try:
+        response = TestClient(counter).get(
+            "/load-data/stream",
+            params={
+                "start": SERIES_START.isoformat(),
+                "end": (SERIES_START + timedelta(minutes=15) * STREAM_RESPONSE_ROWS).isoformat(),
+                "eic_code": bidding_zone.eic_code,
+                "batch_size": 50_000,
+            },
+            headers={"Accept-Encoding": "identity"},
+        )
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        app.dependency_overrides.clear()
+
+    print(
+        f"streamed {counter.lines} NDJSON lines in {counter.chunks} chunks, "
+        f"{counter.size / 2**20:.0f} MiB, traced peak {peak_bytes / 2**20:.1f} MiB"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert counter.lines == STREAM_RESPONSE_ROWS
+    assert counter.chunks == -(-STREAM_RESPONSE_ROWS // 50_000)
+    # The endpoint only ever holds one chunk of rows and its encoded lines,
+    # however many rows the range has.
+    assert peak_bytes < 64 * 2**20
+
+
+class _HourlyStreamRepository:
+    async def iter_batches(self, start, end, bidding_zone, batch_size, columnar):
+        yield LoadArraySeries(
+            bidding_zone,
+            Resolution.PT1H,
+            np.array(["2025-07-13T10:00", "2025-07-13T11:00"], dtype="datetime64[us]"),
+            np.array([4544.0, 4521.0]),
+        )
+
+
+def test_load_stream_arrow_schema_carries_the_slot_resolution():
+    app.dependency_overrides[get_load_repository] = lambda: _HourlyStreamRepository()
+    try:
+        response = TestClient(app).get(
+            "/load-data/stream",
+            params={
+                "start": "2025-07-13T10:30:00+00:00",
+                "end": "2025-07-13T12:00:00+00:00",
+                "eic_code": "10YAT-APG------L",
+            },
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.schema.metadata[b"resolution"] == b"1h"
+    assert table.num_rows == 2
@@ -0,0 +1,144 @@
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from probabilistic_load_forecast.adapters.entsoe import (
+    EntsoeAPIClient,
+    EntsoeFetcher,
+    TokenBucket,
+)
+from probabilistic_load_forecast.domain.exceptions import IncompleteDataError
+from probabilistic_load_forecast.domain.model import TimeInterval
+
+
+class StubEntsoeServer(ThreadingHTTPServer):
+    """Answers with the requested periodStart, earlier periods answer slower."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubEntsoeHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.client_ports = set()
+        self.tokens = set()
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}/api"
+
+
+class StubEntsoeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        period_start = params["periodStart"][0]
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.client_ports.add(self.client_address[1])
+            server.tokens.update(params["securityToken"])
+
+        # Chunks of 2018 answer last, so out of order completion is exercised.
+        time.sleep(max(0.0, (2026 - int(period_start[:4])) * 0.02))
+        body = period_start.encode()
+        with server.lock:
+            server.in_flight -= 1
+
+        if period_start.startswith("2020"):
+            self.send_response(503)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = StubEntsoeServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+START = datetime(2018, 1, 1, tzinfo=timezone.utc)
+END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _client(url, pool_size=10):
+    return EntsoeAPIClient(
+        url,
+        "token",
+        pool_size=pool_size,
+        rate_limiter=TokenBucket(1000),
+        max_retries=1,
+        backoff_base=0.001,
+    )
+
+
+def test_chunk_params_cover_the_range_in_order():
+    chunks = EntsoeFetcher.chunk_params(START, END, outBiddingZone_Domain="10Y1001A1001A82H")
+
+    assert chunks[0]["periodStart"] == "201801010000"
+    assert chunks[-1]["periodEnd"] == "202501010000"
+    assert all(
+        previous["periodEnd"] == following["periodStart"]
+        for previous, following in zip(chunks, chunks[1:])
+    )
+    assert {chunk["outBiddingZone_Domain"] for chunk in chunks} == {"10Y1001A1001A82H"}
+
+
+def test_concurrent_fetch_returns_chunks_in_chronological_order(stub_server):
+    with _client(stub_server.url, pool_size=3) as client:
+        with pytest.raises(IncompleteDataError) as excinfo:
+            EntsoeFetcher(client, max_concurrency=3).fetch(START, END)
+
+    expected = [chunk["periodStart"] for chunk in EntsoeFetcher.chunk_params(START, END)]
+    # The chunks starting in 2020 keep failing and are reported instead of dropped.
+    assert excinfo.value.partial == [
+        period_start for period_start in expected if not period_start.startswith("2020")
+    ]
+    assert excinfo.value.failed_intervals == [
+        TimeInterval(
+            datetime(2020, 1, 1, tzinfo=timezone.utc),
+            datetime(2020, 12, 31, tzinfo=timezone.utc),
+        ),
+        TimeInterval(
+            datetime(2020, 12, 31, tzinfo=timezone.utc),
+            datetime(2021, 12, 31, tzinfo=timezone.utc),
+        ),
+    ]
+    assert 1 < stub_server.max_in_flight <= 3
+    # Connections are kept alive and reused by the session.
+    assert len(stub_server.client_ports) <= 3
+    assert stub_server.tokens == {"token"}
+
+
+def test_serial_fetch_matches_concurrent_fetch(stub_server):
+    start = datetime(2021, 2, 1, tzinfo=timezone.utc)
+    with _client(stub_server.url) as client:
+        serial = EntsoeFetcher(client).fetch(start, END)
+        concurrent = EntsoeFetcher(client, max_concurrency=4).fetch(start, END)
+
+    assert serial == concurrent
+    assert serial[0] == "202102010000"
+    assert stub_server.max_in_flight <= 4
+
+
+def test_fetcher_rejects_a_concurrency_below_one():
+    with pytest.raises(ValueError, match="at least 1"):
+        EntsoeFetcher(EntsoeAPIClient("http://localhost", "token"), max_concurrency=0)
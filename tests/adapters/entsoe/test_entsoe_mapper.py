@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
-from probabilistic_load_forecast.adapters.entsoe.mapper import XmlLoadMapper
-from probabilistic_load_forecast.domain.model import LoadMeasurement, BiddingZone, TimeInterval, CountryCode
+import pytest
+from probabilistic_load_forecast.adapters.entsoe.mapper import IterparseLoadMapper, XmlLoadMapper
+from probabilistic_load_forecast.adapters.entsoe.provider import EntsoeDataProvider
+from probabilistic_load_forecast.domain.model import LoadMeasurement, LoadSeries, BiddingZone, TimeInterval, CountryCode, Resolution
 
 
 def test_parse_xml_load_data():
@@ -32,3 +34,191 @@ def test_parse_xml_load_data():
         ),
         load_mw=4836.0,
     )
+
+
+def _document(*time_series):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">'
+        "<time_Period.timeInterval><start>2025-07-13T00:00Z</start>"
+        "<end>2025-07-14T00:00Z</end></time_Period.timeInterval>"
+        + "".join(time_series)
+        + "</GL_MarketDocument>"
+    )
+
+
+def _time_series(eic_code, *periods, curve_type="A01"):
+    return (
+        f'<TimeSeries><outBiddingZone_Domain.mRID codingScheme="A01">{eic_code}'
+        f"</outBiddingZone_Domain.mRID><curveType>{curve_type}</curveType>"
+        + "".join(periods)
+        + "</TimeSeries>"
+    )
+
+
+def _period(start, quantities, resolution="PT15M", end=None, positions=None):
+    positions = positions or range(1, len(quantities) + 1)
+    points = "".join(
+        f"<Point><position>{position}</position><quantity>{quantity}</quantity></Point>"
+        for position, quantity in zip(positions, quantities)
+    )
+    end = f"<end>{end}</end>" if end else ""
+    return (
+        f"<Period><timeInterval><start>{start}</start>{end}</timeInterval>"
+        f"<resolution>{resolution}</resolution>{points}</Period>"
+    )
+
+
+def test_iterparse_mapper_matches_tree_mapper():
+    with open("tests/fixtures/sample_load.xml", encoding="utf-8") as f:
+        xml = f.read()
+
+    assert IterparseLoadMapper.map(xml) == XmlLoadMapper.map(xml)
+
+
+def test_iterparse_mapper_reads_every_time_series_and_period():
+    xml = _document(
+        _time_series(
+            "10YAT-APG------L",
+            _period("2025-07-13T12:00Z", [3.0, 4.0]),
+            _period("2025-07-13T00:00Z", [1.0, 2.0]),
+        ),
+        _time_series("10Y1001A1001A82H", _period("2025-07-13T00:00Z", [10.0])),
+    )
+
+    austria, germany = IterparseLoadMapper.map_arrays(xml)
+
+    assert austria.bidding_zone.eic_code == "10YAT-APG------L"
+    assert austria.start_ts.tolist() == [
+        datetime(2025, 7, 13, 0, 0),
+        datetime(2025, 7, 13, 0, 15),
+        datetime(2025, 7, 13, 12, 0),
+        datetime(2025, 7, 13, 12, 15),
+    ]
+    assert austria.load_mw.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert germany.bidding_zone.eic_code == "10Y1001A1001A82H"
+    assert germany.load_mw.tolist() == [10.0]
+    assert len(IterparseLoadMapper.map(xml)) == 5
+
+
+def test_iterparse_mapper_returns_nothing_for_a_document_without_time_series():
+    assert IterparseLoadMapper.map_arrays(_document()) == []
+
+
+@pytest.mark.parametrize(
+    ("code", "resolution", "second_start"),
+    [
+        ("PT30M", Resolution.PT30M, datetime(2025, 7, 13, 0, 30)),
+        ("PT60M", Resolution.PT1H, datetime(2025, 7, 13, 1, 0)),
+        ("P1D", Resolution.P1D, datetime(2025, 7, 14, 0, 0)),
+    ],
+)
+def test_iterparse_mapper_reads_coarser_resolutions(code, resolution, second_start):
+    xml = _document(
+        _time_series("10YAT-APG------L", _period("2025-07-13T00:00Z", [1.0, 2.0], code))
+    )
+
+    (series,) = IterparseLoadMapper.map_arrays(xml)
+    measurements = IterparseLoadMapper.map(xml)
+
+    assert series.resolution is resolution
+    assert series.start_ts.tolist() == [datetime(2025, 7, 13, 0, 0), second_start]
+    assert measurements[0].interval.end == second_start.replace(tzinfo=timezone.utc)
+    assert LoadSeries.from_measurements(measurements).resolution is resolution
+
+
+def test_iterparse_mapper_keeps_zones_with_several_resolutions_apart():
+    xml = _document(
+        _time_series(
+            "10YAT-APG------L",
+            _period("2025-07-13T00:00Z", [1.0], "PT60M"),
+            _period("2025-07-13T01:00Z", [2.0, 3.0], "PT15M"),
+        )
+    )
+
+    hourly, quarter_hourly = IterparseLoadMapper.map_arrays(xml)
+
+    assert (hourly.resolution, len(hourly)) == (Resolution.PT1H, 1)
+    assert (quarter_hourly.resolution, len(quarter_hourly)) == (Resolution.PT15M, 2)
+
+
+def test_iterparse_mapper_expands_a03_points_until_the_next_position():
+    xml = _document(
+        _time_series(
+            "10YAT-APG------L",
+            _period(
+                "2025-07-13T00:00Z",
+                [5.0, 7.0, 9.0],
+                "PT60M",
+                end="2025-07-13T06:00Z",
+                positions=[1, 3, 4],
+            ),
+            curve_type="A03",
+        )
+    )
+
+    (series,) = IterparseLoadMapper.map_arrays(xml)
+
+    assert series.start_ts.tolist() == [datetime(2025, 7, 13, hour) for hour in range(6)]
+    assert series.load_mw.tolist() == [5.0, 5.0, 7.0, 9.0, 9.0, 9.0]
+
+
+def test_iterparse_mapper_leaves_gaps_of_a01_curves():
+    xml = _document(
+        _time_series(
+            "10YAT-APG------L",
+            _period("2025-07-13T00:00Z", [5.0, 7.0], end="2025-07-13T01:00Z", positions=[1, 3]),
+        )
+    )
+
+    (series,) = IterparseLoadMapper.map_arrays(xml)
+
+    assert series.start_ts.tolist() == [datetime(2025, 7, 13, 0, 0), datetime(2025, 7, 13, 0, 30)]
+
+
+def test_iterparse_mapper_rejects_resolutions_without_fixed_length():
+    xml = _document(_time_series("10YAT-APG------L", _period("2025-07-01T00:00Z", [1.0], "P1M")))
+
+    with pytest.raises(ValueError, match="Unsupported resolution P1M"):
+        IterparseLoadMapper.map_arrays(xml)
+
+
+class FakeFetcher:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def fetch(self, start, end, **kwargs):
+        return self.documents
+
+
+def test_provider_get_arrays_joins_the_chunks_of_a_zone():
+    provider = EntsoeDataProvider(
+        FakeFetcher(
+            [
+                _document(
+                    _time_series("10YAT-APG------L", _period("2025-07-13T00:00Z", [1.0, 2.0]))
+                ),
+                None,
+                _document(
+                    _time_series("10YAT-APG------L", _period("2025-07-13T00:30Z", [3.0])),
+                    _time_series("10Y1001A1001A82H", _period("2025-07-13T00:00Z", [10.0])),
+                ),
+            ]
+        ),
+        IterparseLoadMapper(),
+    )
+    interval = TimeInterval(
+        datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+        datetime(2025, 7, 13, 1, 0, tzinfo=timezone.utc),
+    )
+
+    austria, germany = provider.get_arrays(interval)
+
+    assert austria.start_ts.tolist() == [
+        datetime(2025, 7, 13, 0, 0),
+        datetime(2025, 7, 13, 0, 15),
+        datetime(2025, 7, 13, 0, 30),
+    ]
+    assert austria.load_mw.tolist() == [1.0, 2.0, 3.0]
+    assert germany.load_mw.tolist() == [10.0]
+    assert [m.load_mw for m in provider.get_data(interval)] == [1.0, 2.0, 3.0, 10.0]
@@ -0,0 +1,191 @@
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from probabilistic_load_forecast.adapters.entsoe import (
+    CircuitBreaker,
+    CircuitOpenError,
+    EntsoeAPIClient,
+    TokenBucket,
+)
+from probabilistic_load_forecast.adapters.entsoe.resilience import (
+    backoff_delay,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_paces_after_the_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(6):
+        bucket.acquire()
+
+    # Two tokens at once, then one every half second.
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_pause_holds_back_every_token():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=10, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(3)
+    bucket.acquire()
+
+    assert clock.now == pytest.approx(3.1)
+
+
+def test_circuit_breaker_opens_and_recovers_through_a_trial_call():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10
+    breaker.before_call()
+    # Only one trial call while half open.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 20
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_backoff_delay_is_jittered_below_the_capped_exponential():
+    assert backoff_delay(3, base=1, cap=60, rng=lambda: 1.0) == 8
+    assert backoff_delay(10, base=1, cap=60, rng=lambda: 1.0) == 60
+    assert backoff_delay(3, base=1, cap=60, rng=lambda: 0.25) == 2
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    now = datetime(2026, 3, 27, 12, 0, tzinfo=timezone.utc)
+
+    assert retry_after_seconds("7") == 7
+    assert retry_after_seconds("Fri, 27 Mar 2026 12:00:30 GMT", now=now) == 30
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds(None) is None
+
+
+class ThrottlingServer(ThreadingHTTPServer):
+    """Answers with the given statuses in turn, then with 200."""
+
+    daemon_threads = True
+
+    def __init__(self, statuses):
+        super().__init__(("127.0.0.1", 0), ThrottlingHandler)
+        self.statuses = list(statuses)
+        self.requests = 0
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}/api"
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = b"<xml/>" if status == 200 else b""
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "2")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def throttling_server(request):
+    server = ThrottlingServer(request.param)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("throttling_server", [[429, 503, 200]], indirect=True)
+def test_client_retries_throttling_and_server_errors(throttling_server):
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, clock=clock, sleep=clock.sleep)
+    client = EntsoeAPIClient(
+        throttling_server.url, "token", rate_limiter=bucket, sleep=clock.sleep
+    )
+
+    assert client.fetch_load_data({"periodStart": "202501010000"}) == "<xml/>"
+    assert throttling_server.requests == 3
+    # The Retry-After of the 429 paused the bucket, the 503 backed off at most 2s.
+    assert 2 <= clock.now <= 4.1
+
+
+@pytest.mark.parametrize("throttling_server", [[400]], indirect=True)
+def test_client_does_not_retry_a_bad_request(throttling_server):
+    client = EntsoeAPIClient(throttling_server.url, "token", rate_limiter=TokenBucket(100))
+
+    assert client.fetch_load_data({}) is None
+    assert throttling_server.requests == 1
+
+
+@pytest.mark.parametrize("throttling_server", [[503] * 10], indirect=True)
+def test_open_circuit_fails_requests_without_sending_them(throttling_server):
+    client = EntsoeAPIClient(
+        throttling_server.url,
+        "token",
+        rate_limiter=TokenBucket(100),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        max_retries=5,
+        sleep=lambda seconds: None,
+    )
+
+    assert client.fetch_load_data({}) is None
+    assert client.fetch_load_data({}) is None
+    assert throttling_server.requests == 2
+
+
+@pytest.mark.parametrize("throttling_server", [[503, 429]], indirect=True)
+def test_throttled_trial_call_closes_the_circuit(throttling_server):
+    clock = FakeClock()
+    client = EntsoeAPIClient(
+        throttling_server.url,
+        "token",
+        rate_limiter=TokenBucket(100, clock=clock, sleep=clock.sleep),
+        circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=100, clock=clock),
+        max_retries=0,
+        sleep=clock.sleep,
+    )
+
+    assert client.fetch_load_data({}) is None
+    clock.now += 100
+    # The trial call is throttled, which must not leave the breaker stuck half open.
+    assert client.fetch_load_data({}) is None
+    clock.now += 1000
+
+    assert client.fetch_load_data({}) == "<xml/>"
+    assert throttling_server.requests == 3
@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
+import numpy as np
 import pytest
 from probabilistic_load_forecast.adapters.entsoe.fetcher import floor_to_minutes
-from probabilistic_load_forecast.adapters.utils import to_utc
+from probabilistic_load_forecast.adapters.utils import datetime_bounds, to_utc
 
 
 def test_floor_to_minutes_rounds_down():
@@ -26,3 +27,13 @@ def test_to_utc_raises_on_naive():
     naive = datetime(2023, 1, 1, 12, 0)
     with pytest.raises(ValueError):
         to_utc(naive)
+
+
+def test_datetime_bounds_returns_aware_extremes():
+    values = np.array(["2023-01-01T12:00", "2023-01-01T10:00"], dtype="datetime64[us]")
+
+    assert datetime_bounds(values) == (
+        datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc),
+        datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc),
+    )
+    assert datetime_bounds(values[:0]) == (None, None)
@@ -0,0 +1,94 @@
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from probabilistic_load_forecast.application.mappers import (
+    IpcStreamEncoder,
+    arrow_to_ipc_stream,
+    arrow_to_parquet,
+    era5_frame_to_arrow,
+    load_array_series_to_arrow,
+)
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5Frame,
+    LoadArraySeries,
+    Resolution,
+    WeatherArea,
+    WeatherVariable,
+)
+
+BIDDING_ZONE = BiddingZone(
+    eic_code="10YAT-APG------L",
+    display_name="Austria",
+    country_code=CountryCode("AT"),
+)
+
+
+def _load_series() -> LoadArraySeries:
+    return LoadArraySeries(
+        bidding_zone=BIDDING_ZONE,
+        resolution=Resolution.PT15M,
+        start_ts=np.array(
+            ["2025-07-13T00:00", "2025-07-13T00:15", "2025-07-13T00:30"],
+            dtype="datetime64[us]",
+        ),
+        load_mw=np.array([4544.0, 4521.0, 4490.0]),
+    )
+
+
+def test_load_table_roundtrips_through_arrow_stream():
+    table = load_array_series_to_arrow(_load_series())
+
+    with pa.ipc.open_stream(arrow_to_ipc_stream(table)) as reader:
+        decoded = reader.read_all()
+
+    assert decoded.column_names == ["timestamp", "load_mw"]
+    assert decoded.schema.field("timestamp").type == pa.timestamp("us", tz="UTC")
+    assert decoded.schema.metadata[b"eic_code"] == b"10YAT-APG------L"
+    np.testing.assert_array_equal(
+        decoded.column("timestamp").to_numpy(), _load_series().start_ts
+    )
+    np.testing.assert_array_equal(decoded.column("load_mw").to_numpy(), [4544.0, 4521.0, 4490.0])
+
+
+def test_ipc_stream_encoder_pieces_form_one_stream():
+    table = load_array_series_to_arrow(_load_series())
+    encoder = IpcStreamEncoder(table.schema)
+
+    pieces = [encoder.write(table.slice(0, 2)), encoder.write(table.slice(2)), encoder.close()]
+
+    assert all(pieces)
+    with pa.ipc.open_stream(b"".join(pieces)) as reader:
+        decoded = reader.read_all()
+    assert decoded.schema.metadata[b"eic_code"] == b"10YAT-APG------L"
+    np.testing.assert_array_equal(decoded.column("load_mw").to_numpy(), [4544.0, 4521.0, 4490.0])
+
+
+def test_load_table_roundtrips_through_parquet():
+    table = load_array_series_to_arrow(_load_series())
+
+    decoded = pq.read_table(io.BytesIO(arrow_to_parquet(table)))
+
+    assert decoded.equals(table)
+
+
+def test_era5_table_keeps_missing_hours_as_nulls():
+    frame = Era5Frame(
+        area=WeatherArea(CountryCode("AT")),
+        resolution=Resolution.PT1H,
+        timestamps=np.array(
+            ["2025-07-13T00:00", "2025-07-13T01:00"], dtype="datetime64[us]"
+        ),
+        values={WeatherVariable.TP: np.array([np.nan, 0.002])},
+    )
+
+    table = era5_frame_to_arrow(frame, WeatherVariable.TP)
+
+    assert table.column_names == ["timestamp", "value"]
+    assert table.column("value").null_count == 1
+    assert table.schema.metadata[b"variable"] == b"tp"
+    assert table.schema.metadata[b"area_code"] == b"AT"
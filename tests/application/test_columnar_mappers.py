@@ -0,0 +1,147 @@
+import json
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from probabilistic_load_forecast.application.mappers import (
+    columnar_to_json,
+    era5_frame_to_columnar,
+    load_array_batch_to_columnar,
+    load_array_series_to_columnar,
+    load_array_series_to_ndjson,
+    resampled_series_to_columnar,
+)
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    Era5Frame,
+    LoadArrayBatch,
+    LoadArraySeries,
+    ResampledSeries,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+BIDDING_ZONE = BiddingZone(
+    eic_code="10YAT-APG------L",
+    display_name="Austria",
+    country_code=CountryCode("AT"),
+)
+
+
+def _load_series() -> LoadArraySeries:
+    return LoadArraySeries(
+        bidding_zone=BIDDING_ZONE,
+        resolution=Resolution.PT15M,
+        start_ts=np.array(
+            ["2025-07-13T00:00", "2025-07-13T00:15"], dtype="datetime64[us]"
+        ),
+        load_mw=np.array([4544.0, 4521.0]),
+    )
+
+
+def test_load_columnar_json_writes_metadata_once_and_iso_timestamps():
+    payload = json.loads(columnar_to_json(load_array_series_to_columnar(_load_series())))
+
+    assert payload == {
+        "bidding_zone": {
+            "eic_code": "10YAT-APG------L",
+            "display_name": "Austria",
+            "country_code": "AT",
+        },
+        "resolution": "15min",
+        "timestamps": ["2025-07-13T00:00:00Z", "2025-07-13T00:15:00Z"],
+        "values": [4544.0, 4521.0],
+    }
+
+
+def test_load_columnar_json_encodes_epoch_seconds():
+    payload = json.loads(
+        columnar_to_json(load_array_series_to_columnar(_load_series(), epoch=True))
+    )
+
+    assert payload["timestamps"] == [1752364800, 1752365700]
+
+
+def test_load_ndjson_writes_one_object_per_line():
+    lines = load_array_series_to_ndjson(_load_series()).splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {"timestamp": "2025-07-13T00:00:00Z", "load_mw": 4544.0},
+        {"timestamp": "2025-07-13T00:15:00Z", "load_mw": 4521.0},
+    ]
+    assert json.loads(load_array_series_to_ndjson(_load_series(), epoch=True).splitlines()[1]) == {
+        "timestamp": 1752365700,
+        "load_mw": 4521.0,
+    }
+
+
+def test_load_ndjson_memory_stays_close_to_the_body_size():
+    rows = 50_000
+    start_ts = np.datetime64("2018-01-01T00:00", "us") + np.arange(rows) * np.timedelta64(15, "m")
+    series = LoadArraySeries(BIDDING_ZONE, Resolution.PT15M, start_ts, np.full(rows, 5000.0))
+
+    tracemalloc.start()
+    try:
+        body = load_array_series_to_ndjson(series)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert body.count(b"\n") == rows
+    # Collecting every line for a join held about 4 KiB per row.
+    assert peak_bytes < 8 * len(body)
+
+
+def test_era5_columnar_json_writes_missing_hours_as_null():
+    frame = Era5Frame(
+        area=WeatherArea(CountryCode("AT")),
+        resolution=Resolution.PT1H,
+        timestamps=np.array(
+            ["2025-07-13T00:00", "2025-07-13T01:00"], dtype="datetime64[us]"
+        ),
+        values={WeatherVariable.TP: np.array([np.nan, 0.002])},
+    )
+
+    payload = json.loads(columnar_to_json(era5_frame_to_columnar(frame, WeatherVariable.TP)))
+
+    assert payload["area_code"] == "AT"
+    assert payload["variable"] == "tp"
+    assert payload["timestamps"] == ["2025-07-13T00:00:00Z", "2025-07-13T01:00:00Z"]
+    assert payload["values"] == [None, 0.002]
+
+
+def test_load_batch_columnar_json_is_keyed_by_eic_code():
+    batch = LoadArrayBatch(
+        interval=TimeInterval(
+            datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+            datetime(2025, 7, 13, 1, 0, tzinfo=timezone.utc),
+        ),
+        series={"10YAT-APG------L": _load_series()},
+        missing_slots={"10YAT-APG------L": 2},
+    )
+
+    payload = json.loads(columnar_to_json(load_array_batch_to_columnar(batch, epoch=True)))
+
+    assert payload["start"] == "2025-07-13T00:00:00Z"
+    assert payload["zones"]["10YAT-APG------L"]["missing_slots"] == 2
+    assert payload["zones"]["10YAT-APG------L"]["timestamps"] == [1752364800, 1752365700]
+
+
+def test_resampled_columnar_json_has_one_array_per_aggregate():
+    series = ResampledSeries(
+        resolution=Resolution.P1D,
+        timestamps=np.array(["2025-07-13", "2025-07-14"], dtype="datetime64[us]"),
+        values={"mean": np.array([4500.0, np.nan]), "q90": np.array([4600.0, np.nan])},
+        counts=np.array([96, 0]),
+    )
+
+    payload = json.loads(columnar_to_json(resampled_series_to_columnar(series)))
+
+    assert payload["resolution"] == "1D"
+    assert payload["timestamps"] == ["2025-07-13T00:00:00Z", "2025-07-14T00:00:00Z"]
+    assert payload["counts"] == [96, 0]
+    assert payload["values"] == {"mean": [4500.0, None], "q90": [4600.0, None]}
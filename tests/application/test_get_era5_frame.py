@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from probabilistic_load_forecast.application.services.cds_services import (
+    GetERA5DataFrameFromDB,
+    GetERA5FrameFromDB,
+)
+from probabilistic_load_forecast.domain.model import (
+    CountryCode,
+    Era5Frame,
+    Resolution,
+    TimeInterval,
+    WeatherArea,
+    WeatherVariable,
+)
+
+
+class FakeEra5Repository:
+    def __init__(self, result) -> None:
+        self.result = result
+        self.calls = []
+
+    def get_frame(self, interval, area, variables, schema="public"):
+        self.calls.append((interval, area, list(variables), schema))
+        return self.result
+
+
+INTERVAL = TimeInterval(
+    start=datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+    end=datetime(2025, 7, 13, 2, 0, tzinfo=timezone.utc),
+)
+AREA = WeatherArea(CountryCode("AT"))
+FRAME = Era5Frame(
+    area=AREA,
+    resolution=Resolution.PT1H,
+    timestamps=np.array(
+        ["2025-07-13T00:00", "2025-07-13T01:00"], dtype="datetime64[us]"
+    ),
+    values={
+        WeatherVariable.T2M: np.array([290.5, 291.0]),
+        WeatherVariable.TP: np.array([np.nan, 0.002]),
+    },
+)
+
+
+def test_get_era5_frame_issues_a_single_repository_call():
+    repo = FakeEra5Repository(FRAME)
+    usecase = GetERA5FrameFromDB(repo)
+
+    result = usecase(
+        variables=[WeatherVariable.T2M, WeatherVariable.TP],
+        area=AREA,
+        interval=INTERVAL,
+    )
+
+    assert result is FRAME
+    assert repo.calls == [
+        (INTERVAL, AREA, [WeatherVariable.T2M, WeatherVariable.TP], "public")
+    ]
+
+
+def test_get_era5_dataframe_returns_wide_time_aligned_frame():
+    usecase = GetERA5DataFrameFromDB(FakeEra5Repository(FRAME))
+
+    result = usecase(
+        variables=[WeatherVariable.T2M, WeatherVariable.TP],
+        area=AREA,
+        interval=INTERVAL,
+    )
+
+    expected = pd.DataFrame(
+        {"t2m": [290.5, 291.0], "tp": [np.nan, 0.002]},
+        index=pd.DatetimeIndex(
+            [datetime(2025, 7, 13, 0, 0), datetime(2025, 7, 13, 1, 0)],
+            tz=timezone.utc,
+            name="valid_time",
+        ).as_unit("us"),
+    )
+    assert_frame_equal(result, expected)
@@ -0,0 +1,215 @@
+from datetime import datetime, timedelta, timezone
+
+from probabilistic_load_forecast.application.services.entsoe_services import (
+    ImportHistoricalLoadData,
+    ImportIncrementalLoadData,
+)
+import numpy as np
+import pytest
+
+from probabilistic_load_forecast.domain.exceptions import IncompleteDataError
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    LoadArraySeries,
+    LoadMeasurement,
+    Resolution,
+    TimeInterval,
+)
+
+
+class FakeLoadProvider:
+    def __init__(self, result, arrays=()):
+        self.result = result
+        self.arrays = list(arrays)
+        self.calls = []
+
+    def get_data(self, interval, **kwargs):
+        self.calls.append((interval, kwargs))
+        return iter(self.result)
+
+    def get_arrays(self, interval, **kwargs):
+        self.calls.append((interval, kwargs))
+        return self.arrays
+
+
+class FailingLoadProvider:
+    def __init__(self, failed_intervals, partial):
+        self.error = IncompleteDataError(failed_intervals, partial)
+
+    def get_data(self, interval, **kwargs):
+        raise self.error
+
+    get_arrays = get_data
+
+
+class FakeLoadRepository:
+    def __init__(self, latest_start=None):
+        self.calls = []
+        self.latest_start = latest_start
+
+    def get_latest_start(self, bidding_zone):
+        return self.latest_start
+
+    def add(self, series):
+        self.calls.append(("add", series))
+
+    def add_bulk(self, series):
+        self.calls.append(("add_bulk", series))
+
+
+def _measurements():
+    bidding_zone = BiddingZone(
+        eic_code="10YAT-APG------L",
+        display_name="Austria",
+        country_code=CountryCode("AT"),
+    )
+    return [
+        LoadMeasurement(
+            bidding_zone=bidding_zone,
+            interval=TimeInterval(
+                start=datetime(2025, 7, 13, 0, 15, tzinfo=timezone.utc),
+                end=datetime(2025, 7, 13, 0, 30, tzinfo=timezone.utc),
+            ),
+            load_mw=4521.0,
+        ),
+        LoadMeasurement(
+            bidding_zone=bidding_zone,
+            interval=TimeInterval(
+                start=datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+                end=datetime(2025, 7, 13, 0, 15, tzinfo=timezone.utc),
+            ),
+            load_mw=4544.0,
+        ),
+    ]
+
+
+def test_import_historical_load_data_uses_add_by_default():
+    repo = FakeLoadRepository()
+    service = ImportHistoricalLoadData(FakeLoadProvider(_measurements()), repo)
+
+    service(
+        TimeInterval(
+            start=datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+            end=datetime(2025, 7, 13, 0, 30, tzinfo=timezone.utc),
+        )
+    )
+
+    assert [name for name, _ in repo.calls] == ["add"]
+    series = repo.calls[0][1]
+    assert [obs.load_mw for obs in series.observations] == [4544.0, 4521.0]
+
+
+def _arrays(load_mw):
+    return LoadArraySeries(
+        bidding_zone=_measurements()[0].bidding_zone,
+        resolution=Resolution.PT15M,
+        start_ts=np.arange(len(load_mw)) * np.timedelta64(15, "m")
+        + np.datetime64("2025-07-13T00:00", "us"),
+        load_mw=np.array(load_mw),
+    )
+
+
+def test_import_historical_load_data_writes_arrays_on_the_bulk_path():
+    repo = FakeLoadRepository()
+    arrays = _arrays([4544.0, 4521.0])
+    service = ImportHistoricalLoadData(
+        FakeLoadProvider(_measurements(), arrays=[arrays, _arrays([])]), repo, bulk=True
+    )
+
+    service(
+        TimeInterval(
+            start=datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+            end=datetime(2025, 7, 13, 0, 30, tzinfo=timezone.utc),
+        )
+    )
+
+    assert repo.calls == [("add_bulk", arrays)]
+
+
+def test_bulk_import_stores_the_fetched_arrays_and_reports_the_rest():
+    repo = FakeLoadRepository()
+    failed = TimeInterval(
+        start=datetime(2025, 7, 13, 0, 30, tzinfo=timezone.utc),
+        end=datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc),
+    )
+    arrays = _arrays([4544.0, 4521.0])
+    service = ImportHistoricalLoadData(FailingLoadProvider([failed], [arrays]), repo, bulk=True)
+
+    with pytest.raises(IncompleteDataError):
+        service(TimeInterval(start=datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc), end=failed.end))
+
+    assert repo.calls == [("add_bulk", arrays)]
+
+
+def test_import_historical_load_data_stores_fetched_part_and_reports_the_rest():
+    repo = FakeLoadRepository()
+    failed = TimeInterval(
+        start=datetime(2025, 7, 13, 0, 30, tzinfo=timezone.utc),
+        end=datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc),
+    )
+    service = ImportHistoricalLoadData(FailingLoadProvider([failed], _measurements()), repo)
+
+    with pytest.raises(IncompleteDataError) as excinfo:
+        service(
+            TimeInterval(
+                start=datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc),
+                end=datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc),
+            )
+        )
+
+    assert excinfo.value.failed_intervals == [failed]
+    assert [name for name, _ in repo.calls] == ["add"]
+    assert len(repo.calls[0][1].observations) == 2
+
+
+def test_incremental_import_starts_an_overlap_before_the_latest_stored_slot():
+    latest = datetime(2025, 7, 13, 0, 15, tzinfo=timezone.utc)
+    end = datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc)
+    provider = FakeLoadProvider(_measurements())
+    repo = FakeLoadRepository(latest_start=latest)
+    service = ImportIncrementalLoadData(provider, repo, overlap=timedelta(hours=6))
+
+    interval = service(_measurements()[0].bidding_zone, end=end)
+
+    assert interval == TimeInterval(datetime(2025, 7, 12, 18, 0, tzinfo=timezone.utc), end)
+    assert provider.calls == [(interval, {"outBiddingZone_Domain": "10YAT-APG------L"})]
+    assert [name for name, _ in repo.calls] == ["add"]
+
+
+def test_incremental_import_starts_at_a_full_hour():
+    latest = datetime(2025, 7, 13, 10, 45, tzinfo=timezone.utc)
+    end = datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc)
+    service = ImportIncrementalLoadData(
+        FakeLoadProvider(_measurements()),
+        FakeLoadRepository(latest_start=latest),
+        overlap=timedelta(minutes=90),
+    )
+
+    interval = service(_measurements()[0].bidding_zone, end=end)
+
+    assert interval.start == datetime(2025, 7, 13, 9, 0, tzinfo=timezone.utc)
+
+
+def test_incremental_import_of_an_empty_zone_needs_an_initial_start():
+    bidding_zone = _measurements()[0].bidding_zone
+    end = datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc)
+    initial_start = datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc)
+    service = ImportIncrementalLoadData(FakeLoadProvider(_measurements()), FakeLoadRepository())
+
+    with pytest.raises(ValueError, match="No load stored"):
+        service(bidding_zone, end=end)
+    assert service(bidding_zone, end=end, initial_start=initial_start) == TimeInterval(
+        initial_start, end
+    )
+
+
+def test_incremental_import_skips_a_zone_that_is_up_to_date():
+    end = datetime(2025, 7, 14, 0, 0, tzinfo=timezone.utc)
+    provider = FakeLoadProvider(_measurements())
+    repo = FakeLoadRepository(latest_start=end + timedelta(hours=2))
+    service = ImportIncrementalLoadData(provider, repo, overlap=timedelta(hours=1))
+
+    assert service(_measurements()[0].bidding_zone, end=end) is None
+    assert provider.calls == []
+    assert repo.calls == []
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from pandas.testing import assert_frame_equal
+
+from probabilistic_load_forecast.application.mappers import (
+    load_array_series_to_dataframe,
+    load_series_to_dataframe,
+)
+from probabilistic_load_forecast.domain.model import (
+    BiddingZone,
+    CountryCode,
+    LoadArraySeries,
+    LoadMeasurement,
+    LoadSeries,
+    Resolution,
+    TimeInterval,
+)
+
+BIDDING_ZONE = BiddingZone(
+    eic_code="10YAT-APG------L",
+    display_name="Austria",
+    country_code=CountryCode("AT"),
+)
+
+
+def test_array_mapper_matches_object_mapper():
+    start = datetime(2025, 7, 13, 0, 0, tzinfo=timezone.utc)
+    loads = [4544.0, 4521.0, 4490.0]
+    series = LoadSeries.from_measurements(
+        [
+            LoadMeasurement(
+                bidding_zone=BIDDING_ZONE,
+                interval=TimeInterval(
+                    start=start + timedelta(minutes=15 * i),
+                    end=start + timedelta(minutes=15 * (i + 1)),
+                ),
+                load_mw=load,
+            )
+            for i, load in enumerate(loads)
+        ]
+    )
+    arrays = LoadArraySeries(
+        bidding_zone=BIDDING_ZONE,
+        resolution=Resolution.PT15M,
+        start_ts=np.array(
+            ["2025-07-13T00:00", "2025-07-13T00:15", "2025-07-13T00:30"],
+            dtype="datetime64[us]",
+        ),
+        load_mw=np.array(loads),
+    )
+
+    assert_frame_equal(
+        load_array_series_to_dataframe(arrays),
+        load_series_to_dataframe(series),
+    )
+
+
+def test_array_mapper_uses_the_series_resolution_for_periods():
+    arrays = LoadArraySeries(
+        bidding_zone=BIDDING_ZONE,
+        resolution=Resolution.PT1H,
+        start_ts=np.array(["2025-07-13T10:00", "2025-07-13T11:00"], dtype="datetime64[us]"),
+        load_mw=np.array([4544.0, 4521.0]),
+    )
+
+    frame = load_array_series_to_dataframe(arrays)
+
+    assert frame.index.freqstr == "h"
+    assert frame.index[0].end_time < np.datetime64("2025-07-13T11:00")
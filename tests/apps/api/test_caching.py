@@ -0,0 +1,158 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api import caching
+from apps.api.main import app, get_load_repository, get_watermark_cache
+from probabilistic_load_forecast.adapters.db import (
+    AsyncCachedEntsoeRepository,
+    QueryCache,
+    Watermark,
+)
+from probabilistic_load_forecast.domain.model import LoadArraySeries, Resolution
+
+WATERMARK = datetime(2025, 7, 13, 12, 0, tzinfo=timezone.utc)
+UPDATED_AT = datetime(2025, 7, 13, 13, 5, tzinfo=timezone.utc)
+
+
+class FakeMetadataRepository:
+    def __init__(self, watermark):
+        self.watermark = watermark
+        self.updated_at = UPDATED_AT
+
+    async def get_watermark_version(self, source, key):
+        if self.watermark is None:
+            return None
+        return Watermark(self.watermark, self.updated_at)
+
+
+class FakeLoadRepository:
+    def __init__(self):
+        self.reads = 0
+
+    async def get_arrays(
+        self, start, end, bidding_zone, schema="public", tablename="actual_total_load"
+    ):
+        self.reads += 1
+        return LoadArraySeries(
+            bidding_zone=bidding_zone,
+            resolution=Resolution.PT15M,
+            start_ts=np.array(["2025-07-12T00:00"], dtype="datetime64[us]"),
+            load_mw=np.array([4500.0]),
+        )
+
+
+@pytest.fixture
+def metadata_repo():
+    return FakeMetadataRepository(WATERMARK)
+
+
+@pytest.fixture
+def load_repo():
+    return FakeLoadRepository()
+
+
+@pytest.fixture
+def client(metadata_repo, load_repo):
+    # ttl=0 reads the watermark on every request, like an expired entry.
+    watermarks = caching.WatermarkCache(metadata_repo, ttl=0)
+    app.dependency_overrides[get_watermark_cache] = lambda: watermarks
+    app.dependency_overrides[get_load_repository] = lambda: load_repo
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _load_params(end: datetime) -> dict:
+    return {
+        "start": (end - timedelta(days=1)).isoformat(),
+        "end": end.isoformat(),
+        "eic_code": "10YAT-APG------L",
+        "format": "columnar",
+    }
+
+
+def test_revalidation_of_an_unchanged_watermark_is_not_modified(client, load_repo):
+    params = _load_params(WATERMARK - timedelta(days=3))
+
+    first = client.get("/load-data", params=params)
+    second = client.get(
+        "/load-data", params=params, headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Vary"] == "Accept, Accept-Encoding"
+    assert load_repo.reads == 1
+
+
+def test_windows_before_the_correction_horizon_are_cached_for_an_hour(client):
+    closed = client.get("/load-data", params=_load_params(WATERMARK - caching.CORRECTION_HORIZON))
+    # Ends before the watermark, but inside the slots the overlap import rewrites.
+    corrected = client.get("/load-data", params=_load_params(WATERMARK - timedelta(hours=2)))
+
+    assert closed.headers["Cache-Control"] == "public, max-age=3600"
+    assert corrected.headers["Cache-Control"] == "public, no-cache"
+
+
+def test_a_moved_watermark_changes_the_etag_of_closed_windows(client, metadata_repo, load_repo):
+    params = _load_params(WATERMARK - timedelta(days=3))
+    first = client.get("/load-data", params=params)
+
+    metadata_repo.watermark = WATERMARK + timedelta(minutes=15)
+    second = client.get(
+        "/load-data", params=params, headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert load_repo.reads == 2
+
+
+def test_a_rewrite_behind_the_watermark_changes_the_etag(client, metadata_repo):
+    params = _load_params(WATERMARK - timedelta(days=3))
+    first = client.get("/load-data", params=params)
+
+    # A bulk re-import of older slots stamps the watermark without moving it.
+    metadata_repo.updated_at = UPDATED_AT + timedelta(hours=1)
+    second = client.get(
+        "/load-data", params=params, headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+
+def test_a_moved_watermark_drops_the_cached_reads(metadata_repo, load_repo):
+    query_cache = QueryCache()
+    watermarks = caching.WatermarkCache(metadata_repo, ttl=0)
+    watermarks.on_change(query_cache.invalidate)
+    app.dependency_overrides[get_watermark_cache] = lambda: watermarks
+    app.dependency_overrides[get_load_repository] = lambda: AsyncCachedEntsoeRepository(
+        load_repo, query_cache
+    )
+    params = _load_params(WATERMARK - timedelta(days=3))
+    try:
+        client = TestClient(app)
+        client.get("/load-data", params=params)
+        client.get("/load-data", params=params)
+        reads_before = load_repo.reads
+        metadata_repo.watermark = WATERMARK + timedelta(minutes=15)
+        client.get("/load-data", params=params)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert reads_before == 1
+    assert load_repo.reads == 2
+
+
+def test_zone_without_watermark_gets_no_etag(client, metadata_repo):
+    metadata_repo.watermark = None
+
+    response = client.get("/load-data", params=_load_params(WATERMARK))
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "public, no-cache"
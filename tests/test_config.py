@@ -0,0 +1,48 @@
+from probabilistic_load_forecast import config
+from probabilistic_load_forecast.config import PoolSettings
+
+
+def test_get_pool_settings_defaults(monkeypatch):
+    for name in (
+        "PG_POOL_MIN_SIZE",
+        "PG_POOL_MAX_SIZE",
+        "PG_POOL_MAX_IDLE",
+        "PG_POOL_MAX_LIFETIME",
+        "PG_POOL_TIMEOUT",
+        "PG_POOL_CHECK",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+    assert config.get_pool_settings() == PoolSettings()
+
+
+def test_get_pool_settings_reads_environment(monkeypatch):
+    monkeypatch.setenv("PG_POOL_MIN_SIZE", "2")
+    monkeypatch.setenv("PG_POOL_MAX_SIZE", "20")
+    monkeypatch.setenv("PG_POOL_MAX_IDLE", "60")
+    monkeypatch.setenv("PG_POOL_TIMEOUT", "5")
+    monkeypatch.setenv("PG_POOL_CHECK", "false")
+
+    settings = config.get_pool_settings()
+
+    assert settings.min_size == 2
+    assert settings.max_size == 20
+    assert settings.max_idle == 60.0
+    assert settings.timeout == 5.0
+    assert settings.check is False
+
+
+def test_get_query_cache_size(monkeypatch):
+    monkeypatch.delenv("QUERY_CACHE_MAX_ENTRIES", raising=False)
+    assert config.get_query_cache_size() == 256
+
+    monkeypatch.setenv("QUERY_CACHE_MAX_ENTRIES", "0")
+    assert config.get_query_cache_size() == 0
+
+
+def test_get_range_cache_max_keys(monkeypatch):
+    monkeypatch.delenv("RANGE_CACHE_MAX_KEYS", raising=False)
+    assert config.get_range_cache_max_keys() == 32
+
+    monkeypatch.setenv("RANGE_CACHE_MAX_KEYS", "0")
+    assert config.get_range_cache_max_keys() == 0